@@ -0,0 +1,142 @@
+"""Latencia de punta a punta de la capa de datos contra un PostgREST local simulado.
+
+Para cada tamaño de datos (cantidad de partidas) mide ``sign_in``,
+``save_game_result``, ``get_user_statistics`` y ``get_words_for_game`` en
+frío (sin cachés locales) y en caliente, y ``get_all_statistics``. Imprime
+una tabla y, con ``--json``, guarda los resultados en un archivo JSON para
+comparar corridas en el tiempo.
+
+Uso: python -m benchmarks.bench_data_layer [--sizes 1000,10000] [--latency 0.02] [--json resultados.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.fake_postgrest import FAKE_KEY, FakePostgrest, build_dataset
+
+
+def percentile(timings: list, fraction: float) -> float:
+    return timings[min(int(len(timings) * fraction), len(timings) - 1)]
+
+
+def measure(server: FakePostgrest, fn, repetitions: int, before=None) -> dict:
+    """Ejecutar ``fn(i)`` ``repetitions`` veces; ``before`` prepara cada corrida fuera de la medición.
+
+    Una primera llamada sin medir deja listas la conexión y las cachés que
+    ``before`` no borra.
+    """
+    fn(0)
+    timings = []
+    requests = 0
+    for i in range(repetitions):
+        if before is not None:
+            before()
+        count = server.request_count
+        start = time.perf_counter()
+        fn(i)
+        timings.append(time.perf_counter() - start)
+        requests += server.request_count - count
+    timings.sort()
+    return {
+        "repetitions": repetitions,
+        "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+        "mean_ms": round(sum(timings) / len(timings) * 1000, 3),
+        "requests_per_call": round(requests / repetitions, 2),
+    }
+
+
+def clear_local_caches(*parts) -> None:
+    """Borrar las cachés en disco de la base en uso (``stats``, ``words``) y las de memoria."""
+    from database.local_storage import get_backend_dir
+    from database.supabase_client import invalidate_reference_cache
+
+    for part in parts:
+        shutil.rmtree(get_backend_dir(part), ignore_errors=True)
+    invalidate_reference_cache()
+
+
+def run_size(server: FakePostgrest, games: int, users: int, words: int, repetitions: int) -> list:
+    from database import supabase_client as db
+
+    dataset = build_dataset(users=users, games=games, words=words)
+    server.load(dataset)
+    clear_local_caches("stats", "words")
+
+    rng = random.Random(games)
+    user_ids = [rng.randint(1, users) for _ in range(repetitions)]
+    spanish_words = [p["palabra"] for p in dataset["palabras"] if p["idioma_id"] == 2]
+
+    operations = [
+        ("sign_in", lambda i: db.sign_in(f"usuario{user_ids[i]}", "secreto"), repetitions, None),
+        ("save_game_result", lambda i: db.save_game_result(user_ids[i], rng.choice(spanish_words).upper(), "spanish",
+                                                           4, 60.0, True, 0), repetitions, None),
+        ("get_user_statistics (frío)", lambda i: db.get_user_statistics(user_ids[i]), repetitions,
+         lambda: clear_local_caches("stats")),
+        ("get_user_statistics (caliente)", lambda i: db.get_user_statistics(user_ids[0]), repetitions, None),
+        ("get_words_for_game (frío)", lambda i: db.get_words_for_game("spanish"), max(repetitions // 4, 3),
+         lambda: clear_local_caches("words")),
+        ("get_words_for_game (caliente)", lambda i: db.get_words_for_game("spanish"), repetitions, None),
+        ("get_all_statistics", lambda i: db.get_all_statistics(), max(repetitions // 10, 3), None),
+    ]
+
+    results = []
+    for name, fn, count, before in operations:
+        result = {"operation": name, "games": games, "users": users, "words_per_language": words,
+                  **measure(server, fn, count, before)}
+        results.append(result)
+        print(f"{games:>8} {name:<32} p50 {result['p50_ms']:>9.1f}ms  p95 {result['p95_ms']:>9.1f}ms  "
+              f"peticiones {result['requests_per_call']:>6.1f}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Cantidades de partidas separadas por comas")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--words", type=int, default=2000, help="Palabras por idioma")
+    parser.add_argument("--repetitions", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.02, help="Segundos de latencia por petición")
+    parser.add_argument("--json", help="Archivo donde guardar los resultados")
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="wordle-bench-")
+    os.environ["WORDLE_DATA_DIR"] = data_dir
+    os.environ["WORDLE_BACKEND"] = "supabase"
+
+    results = []
+    try:
+        with FakePostgrest(latency=args.latency) as server:
+            os.environ["SUPABASE_URL"] = server.url
+            os.environ["SUPABASE_KEY"] = FAKE_KEY
+
+            from database.supabase_client import initialize_supabase
+            initialize_supabase(warm_up=False)
+
+            for games in (int(size) for size in args.sizes.split(",")):
+                results.extend(run_size(server, games, args.users, args.words, args.repetitions))
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    if args.json:
+        report = {
+            "benchmark": "data_layer",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency_ms": args.latency * 1000,
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Tiempo de construcción y memoria del índice de palabras válidas por idioma.
+
+Con credenciales de Supabase usa las listas reales de ``get_words_for_game``;
+con ``--synthetic N`` usa N palabras aleatorias por idioma. Con las listas
+reales el índice es el de las suposiciones permitidas (las respuestas más el
+diccionario completo del idioma, si está en el directorio de datos).
+
+Uso: python -m benchmarks.bench_dictionary [--synthetic 10000]
+"""
+import argparse
+import random
+import time
+
+from engine.dictionary import WordIndex, build_guess_index
+from benchmarks.bench_hints import synthetic_words
+
+LANGUAGES = ("english", "spanish")
+
+
+def load_words(language_name: str, synthetic: int) -> list:
+    if synthetic:
+        return synthetic_words(synthetic, seed=LANGUAGES.index(language_name))
+
+    from database.supabase_client import get_words_for_game
+    return get_words_for_game(language_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--synthetic", type=int, default=0)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for language_name in LANGUAGES:
+        words = load_words(language_name, args.synthetic)
+        index = WordIndex(words) if args.synthetic else build_guess_index(language_name, words)
+        stats = index.stats()
+
+        probes = [random.choice(words) for _ in range(args.lookups)]
+        start = time.perf_counter()
+        for word in probes:
+            word in index
+        lookup_ns = (time.perf_counter() - start) / len(probes) * 1e9
+
+        print(f"{language_name}: {stats['words']} palabras, construcción {stats['build_ms']:.2f}ms, "
+              f"memoria {stats['memory_bytes'] / 1024:.1f}KiB, búsqueda {lookup_ns:.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark de la pista de "mejor suposición".
+
+Construye una lista sintética de palabras, simula partidas y mide cuánto
+tarda ``best_guess`` después de cada intento. Termina con código 1 si el
+percentil 95 supera ``HINT_TIME_BUDGET``.
+
+Uso: python -m benchmarks.bench_hints [--words 10000] [--games 50]
+"""
+import argparse
+import random
+import string
+import sys
+import time
+
+import numpy as np
+
+from engine.matrix_cache import PatternMatrix
+from engine.scoring import build_pattern_matrix, prepare_words, score_guess
+from engine.solver import HINT_TIME_BUDGET, best_guess, filter_candidates
+
+
+def synthetic_words(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(string.ascii_uppercase) for _ in range(5)))
+    return prepare_words(sorted(words))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=10_000)
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    words = synthetic_words(args.words, args.seed)
+
+    start = time.perf_counter()
+    pattern_matrix = PatternMatrix(words, build_pattern_matrix(words, words))
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    opener, _ = best_guess(pattern_matrix, np.arange(len(words)))
+    opener_time = time.perf_counter() - start
+
+    rng = random.Random(args.seed)
+    timings = []
+    for _ in range(args.games):
+        target = rng.choice(words)
+        candidates = np.arange(len(words))
+        guess = opener
+        for _ in range(6):
+            candidates = filter_candidates(pattern_matrix, candidates, guess, score_guess(guess, target))
+            if guess == target:
+                break
+            start = time.perf_counter()
+            guess, _ = best_guess(pattern_matrix, candidates)
+            timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    p50 = timings[len(timings) // 2] if timings else 0.0
+    p95 = timings[int(len(timings) * 0.95)] if timings else 0.0
+
+    print(f"palabras: {len(words)}")
+    print(f"construcción de la matriz: {build_time:.2f}s")
+    print(f"primera suposición (una vez por lista): {opener_time:.2f}s -> {opener}")
+    print(f"pistas medidas: {len(timings)}  p50: {p50 * 1000:.1f}ms  p95: {p95 * 1000:.1f}ms  "
+          f"presupuesto: {HINT_TIME_BUDGET * 1000:.0f}ms")
+
+    if p95 > HINT_TIME_BUDGET:
+        print("El percentil 95 supera el presupuesto de tiempo de la pista")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Micro-benchmarks de los caminos críticos del juego (sin interfaz gráfica).
+
+Mide operaciones por segundo y memoria asignada (tracemalloc) de:
+
+- ``evaluate_guess``: ``score_guess`` + ``decode_pattern`` de cada palabra contra un objetivo.
+- ``filter_candidates``: ``CandidateFilter.add_feedback`` sobre toda la lista.
+- ``reveal_letter_hint``: la pista de letra de ``HeadlessGame`` a mitad de partida.
+- ``normalize_words``: la normalización de filas de ``get_words_for_game``.
+- ``calculate_statistics``: ``StatsAggregate.from_games`` + ``summary``.
+
+Cada caso corre en un tamaño realista y uno de estrés (10k palabras, 1M
+partidas). Los resultados se comparan con ``benchmarks/baselines/hot_paths.json``;
+termina con código 1 si algún caso es más lento que la línea de base por
+encima de la tolerancia. La línea de base depende de la máquina: conviene
+regenerarla con ``--save-baseline`` en la máquina donde se comparan corridas.
+
+Uso: python -m benchmarks.bench_hot_paths [--quick] [--save-baseline] [--tolerance 0.4]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.bench_hints import synthetic_words
+from database.supabase_client import normalize_word_rows
+from engine.constraints import CandidateFilter
+from engine.dictionary import WordIndex
+from engine.scoring import decode_pattern, score_guess
+from engine.simulator import HeadlessGame
+from engine.statistics import StatsAggregate
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "hot_paths.json"
+
+# Tiempo mínimo medido por caso (se repite la operación hasta alcanzarlo)
+MIN_MEASURE_SECONDS = 0.5
+
+
+def evaluate_guess_case(size: int):
+    words = synthetic_words(size, seed=1)
+    target = words[len(words) // 2]
+
+    def run():
+        for guess in words:
+            decode_pattern(score_guess(guess, target))
+
+    return run, len(words)
+
+
+def filter_candidates_case(size: int):
+    words = synthetic_words(size, seed=2)
+    candidate_filter = CandidateFilter(words)
+    target, guess = words[0], words[-1]
+    pattern = score_guess(guess, target)
+
+    def run():
+        candidate_filter.reset()
+        candidate_filter.add_feedback(guess, pattern)
+
+    return run, len(words)
+
+
+def reveal_letter_hint_case(size: int):
+    words = synthetic_words(2000, seed=3)
+    rng = random.Random(3)
+    guess_index = WordIndex(words)
+    games = []
+    for _ in range(min(size, 1000)):
+        game = HeadlessGame(rng.choice(words), guess_index, rng=rng)
+        for _ in range(3):
+            game.submit_guess(rng.choice(words))
+        games.append(game)
+    calls = [games[i % len(games)] for i in range(size)]
+
+    def run():
+        for game in calls:
+            game.hints_used = 0
+            game.reveal_letter_hint()
+
+    return run, size
+
+
+def normalize_words_case(size: int):
+    rows = [{"id": i, "palabra": word.lower()} for i, word in enumerate(synthetic_words(size, seed=4))]
+
+    def run():
+        normalize_word_rows(rows)
+
+    return run, len(rows)
+
+
+def calculate_statistics_case(size: int):
+    rng = random.Random(5)
+    games = [{"created_at": f"2024-01-01T00:00:{i:09d}", "win": rng.random() < 0.6, "attempts": rng.randint(1, 6),
+              "time_taken": rng.uniform(10, 300), "language": rng.choice(("english", "spanish"))}
+             for i in range(size)]
+    rng.shuffle(games)
+
+    def run():
+        StatsAggregate.from_games(games).summary()
+
+    return run, len(games)
+
+
+CASES = [
+    ("evaluate_guess", evaluate_guess_case, {"realistic": 2_000, "stress": 10_000}),
+    ("filter_candidates", filter_candidates_case, {"realistic": 2_000, "stress": 10_000}),
+    ("reveal_letter_hint", reveal_letter_hint_case, {"realistic": 1_000, "stress": 1_000_000}),
+    ("normalize_words", normalize_words_case, {"realistic": 2_000, "stress": 10_000}),
+    ("calculate_statistics", calculate_statistics_case, {"realistic": 1_000, "stress": 1_000_000}),
+]
+
+
+def measure(run, ops: int) -> dict:
+    """Operaciones por segundo (mejor repetición) y memoria asignada en una corrida."""
+    run()
+    best = float("inf")
+    elapsed_total = 0.0
+    repetitions = 0
+    while elapsed_total < MIN_MEASURE_SECONDS or repetitions < 3:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        elapsed_total += elapsed
+        repetitions += 1
+
+    # Memoria en una pasada aparte: tracemalloc hace más lento el código medido
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops": ops,
+        "repetitions": repetitions,
+        "ops_per_sec": round(ops / best, 1),
+        "peak_alloc_kib": round(peak / 1024, 1),
+        "alloc_bytes_per_op": round(peak / ops, 1),
+    }
+
+
+def load_baseline() -> dict:
+    if not BASELINE_PATH.exists():
+        return {}
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Solo los tamaños realistas")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.4,
+                        help="Caída de ops/s aceptada respecto de la línea de base (0.4 = 40%%)")
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    results = {}
+    regressions = []
+
+    for name, make_case, sizes in CASES:
+        for size_name, size in sizes.items():
+            if args.quick and size_name != "realistic":
+                continue
+            key = f"{name}/{size_name}"
+            run, ops = make_case(size)
+            result = measure(run, ops)
+            results[key] = result
+
+            comparison = ""
+            if key in baseline:
+                ratio = result["ops_per_sec"] / baseline[key]["ops_per_sec"]
+                comparison = f"  vs base {ratio:6.2f}x"
+                if ratio < 1 - args.tolerance:
+                    regressions.append(key)
+                    comparison += "  REGRESIÓN"
+            print(f"{key:<34} {result['ops_per_sec']:>14,.0f} ops/s  "
+                  f"pico {result['peak_alloc_kib']:>10,.1f} KiB  {result['alloc_bytes_per_op']:>8.1f} B/op{comparison}")
+
+    if args.save_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=2)
+        print(f"Línea de base guardada en {BASELINE_PATH}")
+    elif regressions:
+        print(f"Casos más lentos que la línea de base: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
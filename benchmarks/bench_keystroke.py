@@ -0,0 +1,227 @@
+"""Latencia por pulsación en el tablero del juego: azulejos y teclas pintados a mano contra ``setStyleSheet``.
+
+Mide, desde la llamada a ``WordleGame.key_pressed`` hasta que el ciclo de
+eventos terminó de pulir y pintar la ventana:
+
+- ``letra``: escribir una letra (el azulejo pasa de vacío a lleno).
+- ``borrar``: borrar la última letra.
+- ``enter``: evaluar una fila completa (5 azulejos y hasta 5 teclas cambian de estado).
+
+Dos modos, cada uno en un proceso propio:
+
+- ``painted``: el actual; ``LetterTile`` y ``KeyboardKey`` se pintan en
+  ``paintEvent`` y un cambio de estado solo pide un repintado.
+- ``legacy``: el anterior (copiado en ``legacy_widgets``); cada cambio de
+  estado arma un CSS nuevo y llama a ``setStyleSheet`` en el azulejo, su
+  etiqueta o la tecla, y Qt vuelve a interpretarlo y a pulir el widget.
+
+Corre con la plataforma Qt ``offscreen`` y el backend SQLite en un directorio
+temporal. Los cuadros de diálogo del juego se reemplazan por una función vacía.
+
+Uso: python -m benchmarks.bench_keystroke [--games 40] [--mode both] [--json teclas.json]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_navigation_memory import seed_database, wait_for_words
+
+RESULT_PREFIX = "RESULT "
+
+LEGACY_TILE_STYLES = {
+    "empty": ("#d3d6da;", "color: black;"),
+    "filled": ("#878a8c;", "color: black;"),
+    "correct": ("#6aaa64; background-color: #6aaa64;", "color: white;"),
+    "present": ("#c9b458; background-color: #c9b458;", "color: white;"),
+    "absent": ("#787c7e; background-color: #787c7e;", "color: white;"),
+}
+
+LEGACY_KEY_COLORS = {
+    "unused": ("#d3d6da", "black", "#c3c6ca"),
+    "correct": ("#6aaa64", "white", "#5a9a54"),
+    "present": ("#c9b458", "white", "#b9a448"),
+    "absent": ("#787c7e", "white", "#686c6e"),
+}
+
+
+def legacy_widgets():
+    """Las clases ``LetterTile`` y ``KeyboardKey`` anteriores: un CSS nuevo por cada cambio de estado."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QFont
+    from PyQt6.QtWidgets import QFrame, QLabel, QPushButton, QVBoxLayout
+
+    class LetterTile(QFrame):
+        def __init__(self, row, col):
+            super().__init__()
+            self.row = row
+            self.col = col
+            self.letter = ""
+            self.state = "empty"
+            self.setFixedSize(60, 60)
+            self.setFrameShape(QFrame.Shape.Box)
+            self.setLineWidth(2)
+            self.letter_label = QLabel("")
+            self.letter_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.letter_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
+            layout = QVBoxLayout()
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(self.letter_label)
+            self.setLayout(layout)
+            self.update_style()
+
+        def set_letter(self, letter):
+            self.letter = letter.upper() if letter else ""
+            self.letter_label.setText(self.letter)
+            self.state = "filled" if letter else "empty"
+            self.update_style()
+
+        def set_state(self, state):
+            self.state = state
+            self.update_style()
+
+        def update_style(self):
+            border, label_style = LEGACY_TILE_STYLES[self.state]
+            self.letter_label.setStyleSheet(label_style)
+            self.setStyleSheet("border: 2px solid " + border)
+
+    class KeyboardKey(QPushButton):
+        def __init__(self, text, key_press_callback):
+            super().__init__(text)
+            self.key = text
+            self.state = "unused"
+            self.clicked.connect(lambda: key_press_callback(self.key))
+            self.setFixedHeight(50)
+            self.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+            self.update_style()
+
+        def set_state(self, state):
+            if (state == "correct" or
+                    (state == "present" and self.state != "correct") or
+                    (state == "absent" and self.state not in ["correct", "present"])):
+                self.state = state
+                self.update_style()
+
+        def update_style(self):
+            background, color, hover = LEGACY_KEY_COLORS[self.state]
+            self.setStyleSheet(f"""
+                QPushButton {{
+                    background-color: {background};
+                    color: {color};
+                    border: none;
+                    border-radius: 4px;
+                }}
+                QPushButton:hover {{
+                    background-color: {hover};
+                }}
+            """)
+
+    return LetterTile, KeyboardKey
+
+
+def percentile(timings: list, fraction: float) -> float:
+    return timings[min(int(len(timings) * fraction), len(timings) - 1)]
+
+
+def run_mode(mode: str, games: int, words: int) -> dict:
+    from PyQt6.QtWidgets import QApplication
+
+    import ui.game
+    from ui.game import WordleGame
+
+    app = QApplication(["wordle-bench"])
+    seed_database(words)
+    WordleGame.show_message = lambda self, title, message: None
+    if mode == "legacy":
+        ui.game.LetterTile, ui.game.KeyboardKey = legacy_widgets()
+
+    timings = {"letra": [], "borrar": [], "enter": []}
+
+    def timed(kind, game, key):
+        start = time.perf_counter()
+        game.key_pressed(key)
+        app.processEvents()
+        timings[kind].append(time.perf_counter() - start)
+
+    for _ in range(games):
+        game = WordleGame(1, False, "spanish")
+        game.show()
+        wait_for_words(game)
+        app.processEvents()
+        guesses = [word for word in game.valid_words if word != game.target_word][:5]
+        for guess in guesses:
+            for letter in guess:
+                timed("letra", game, letter)
+            timed("borrar", game, "⌫")
+            timed("letra", game, guess[-1])
+            timed("enter", game, "ENTER")
+        game.close()
+        game.deleteLater()
+        app.processEvents()
+
+    results = {}
+    for kind, values in timings.items():
+        values.sort()
+        results[kind] = {"samples": len(values),
+                         "p50_us": round(percentile(values, 0.50) * 1e6, 1),
+                         "p95_us": round(percentile(values, 0.95) * 1e6, 1),
+                         "mean_us": round(sum(values) / len(values) * 1e6, 1)}
+    return {"mode": mode, "games": games, "results": results}
+
+
+def run_child(mode: str, args) -> dict:
+    """Correr un modo en un proceso nuevo (sin estilos ni parches del otro) y leer su resultado."""
+    data_dir = tempfile.mkdtemp(prefix="wordle-key-bench-")
+    env = dict(os.environ, WORDLE_BACKEND="sqlite", WORDLE_DATA_DIR=data_dir)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_keystroke", "--mode", mode, "--child",
+             "--games", str(args.games), "--words", str(args.words)],
+            env=env, capture_output=True, text=True)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr[-2000:])
+    line = next(line for line in completed.stdout.splitlines() if line.startswith(RESULT_PREFIX))
+    return json.loads(line[len(RESULT_PREFIX):])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=40, help="Tableros a jugar (5 filas cada uno)")
+    parser.add_argument("--words", type=int, default=2000, help="Palabras por idioma")
+    parser.add_argument("--mode", choices=("painted", "legacy", "both"), default="both")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--json", help="Archivo donde guardar los resultados")
+    args = parser.parse_args()
+
+    if args.child:
+        print(RESULT_PREFIX + json.dumps(run_mode(args.mode, args.games, args.words)), flush=True)
+        return
+
+    modes = ("legacy", "painted") if args.mode == "both" else (args.mode,)
+    reports = [run_child(mode, args) for mode in modes]
+
+    for report in reports:
+        for kind, result in report["results"].items():
+            print(f"{report['mode']:>7} {kind:<7} p50 {result['p50_us']:>8.1f}us  p95 {result['p95_us']:>8.1f}us  "
+                  f"media {result['mean_us']:>8.1f}us  ({result['samples']} pulsaciones)")
+
+    if len(reports) == 2:
+        legacy, painted = (report["results"] for report in reports)
+        print("\n" + "  ".join(f"{kind}: {legacy[kind]['p50_us'] / painted[kind]['p50_us']:.2f}x"
+                               for kind in legacy) + "  (p50 anterior / actual)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
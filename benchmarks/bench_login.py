@@ -0,0 +1,86 @@
+"""Latencia del inicio de sesión contra un PostgREST local simulado.
+
+Compara el flujo anterior (consulta a 'usuarios' y luego a 'tipo_usuario')
+con ``sign_in``, que trae el tipo de usuario embebido en una sola consulta.
+``--latency`` simula el viaje de ida y vuelta a Supabase por petición.
+
+Uso: python -m benchmarks.bench_login [--logins 200] [--latency 0.02]
+"""
+import argparse
+import os
+import time
+
+from benchmarks.fake_postgrest import FAKE_KEY, FakePostgrest
+
+
+def seed_tables(users: int) -> dict:
+    from database.supabase_client import hash_password
+
+    password = hash_password("secreto")
+    return {
+        "idiomas": [{"id": 1, "idioma": "english"}, {"id": 2, "idioma": "spanish"}],
+        "tipo_usuario": [
+            {"id": 1, "tipo": "jugador", "es_administrador": False},
+            {"id": 2, "tipo": "administrador", "es_administrador": True},
+        ],
+        "usuarios": [
+            {"id": i, "nombre_usuario": f"usuario{i}", "contrasena": password, "email": f"usuario{i}@mail.com",
+             "tipo_usuario_id": 2 if i % 50 == 0 else 1}
+            for i in range(1, users + 1)
+        ],
+    }
+
+
+def two_request_sign_in(username: str, password: str) -> dict:
+    """Flujo anterior: el usuario y su tipo en dos consultas separadas."""
+    from database.supabase_client import get_supabase_client, verify_password
+
+    client = get_supabase_client()
+    user_data = client.table("usuarios").select("id, nombre_usuario, contrasena, email, tipo_usuario_id").eq(
+        "nombre_usuario", username).execute().data[0]
+    if not verify_password(password, user_data["contrasena"]):
+        raise ValueError("Nombre de usuario o contraseña invalidos")
+    tipo = client.table("tipo_usuario").select("es_administrador").eq("id", user_data["tipo_usuario_id"]).execute()
+    user_data["is_admin"] = bool(tipo.data[0]["es_administrador"])
+    return user_data
+
+
+def measure(fn, usernames: list) -> list:
+    timings = []
+    for username in usernames:
+        start = time.perf_counter()
+        fn(username, "secreto")
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    with FakePostgrest(seed_tables(args.users), latency=args.latency) as server:
+        os.environ["SUPABASE_URL"] = server.url
+        os.environ["SUPABASE_KEY"] = FAKE_KEY
+
+        from database.supabase_client import sign_in
+
+        usernames = [f"usuario{(i % args.users) + 1}" for i in range(args.logins)]
+        # Calentar la conexión para no medir el primer handshake
+        sign_in(usernames[0], "secreto")
+
+        print(f"latencia simulada por petición: {args.latency * 1000:.0f}ms  inicios de sesión: {args.logins}")
+        for label, fn in (("dos consultas", two_request_sign_in), ("consulta embebida", sign_in)):
+            before = server.request_count
+            timings = measure(fn, usernames)
+            p50 = timings[len(timings) // 2]
+            p95 = timings[int(len(timings) * 0.95)]
+            requests = (server.request_count - before) / len(usernames)
+            print(f"{label:>18}: p50 {p50 * 1000:.1f}ms  p95 {p95 * 1000:.1f}ms  peticiones/login {requests:.1f}")
+
+
+if __name__ == "__main__":
+    main()
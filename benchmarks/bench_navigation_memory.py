@@ -0,0 +1,194 @@
+"""Memoria de la interfaz a lo largo de muchas partidas seguidas (inicio -> partida -> inicio).
+
+Mide uno de dos flujos, o ambos con ``--mode both``, cada uno en un proceso
+propio para que la memoria no se mezcle:
+
+- ``navigator``: el flujo actual con ``ui.navigation``; la pantalla de inicio
+  se reutiliza y el tablero de cada partida se destruye al volver.
+- ``legacy``: el flujo anterior, que creaba una ventana de nivel superior por
+  transición y solo ocultaba la anterior (cada ventana guardaba una
+  referencia a la siguiente, así que ninguna se liberaba). Crece unos 4 MiB
+  por partida: 500 partidas necesitan cerca de 2 GiB.
+
+Cada partida se juega escribiendo una palabra y luego la respuesta en el
+teclado virtual. Cada ``--step`` partidas se registran los widgets vivos
+(``QApplication.allWidgets``) y la memoria residente del proceso. Corre con
+la plataforma Qt ``offscreen`` y el backend SQLite en un directorio temporal;
+los cuadros de diálogo del juego se reemplazan por una función vacía porque
+bloquearían la corrida.
+
+Uso: python -m benchmarks.bench_navigation_memory [--games 500] [--step 100] [--mode navigator|legacy|both]
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.fake_postgrest import build_dataset
+
+RESULT_PREFIX = "RESULT "
+
+
+def rss_mib() -> float:
+    """Memoria residente actual (en Linux); en otros sistemas, el pico."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def seed_database(words: int) -> None:
+    from database.supabase_client import get_supabase_client
+
+    client = get_supabase_client()
+    dataset = build_dataset(users=1, games=0, words=words)
+    client.table("usuarios").insert(dataset["usuarios"]).execute()
+    client.table("palabras").insert(dataset["palabras"]).execute()
+
+
+def wait_for_words(game) -> None:
+    """Esperar a que el juego reciba su lista de palabras (se carga en segundo plano)."""
+    from PyQt6.QtWidgets import QApplication
+
+    while not game.words_ready:
+        QApplication.processEvents()
+        time.sleep(0.001)
+
+
+def play(game) -> None:
+    """Jugar una partida con el teclado virtual: una palabra cualquiera y luego la respuesta."""
+    wait_for_words(game)
+    opener = next(word for word in game.valid_words if word != game.target_word)
+    for word in (opener, game.target_word):
+        for letter in word:
+            game.key_pressed(letter)
+        game.key_pressed("ENTER")
+
+
+def flush_deleted_widgets(app) -> None:
+    from PyQt6.QtCore import QEvent
+
+    app.processEvents()
+    # deleteLater se atiende al volver al ciclo de eventos principal, que aquí no corre
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def run_navigator(app, games: int, on_game) -> None:
+    from ui.navigation import get_navigator
+
+    navigator = get_navigator()
+    home = navigator.show_home(1, False, "spanish")
+    for i in range(games):
+        home.start_game()
+        game = navigator.screens["game"]
+        play(game)
+        game.back_to_home()
+        home = navigator.screens["home"]
+        flush_deleted_widgets(app)
+        on_game(i + 1)
+
+
+def run_legacy(app, games: int, on_game) -> None:
+    from ui.game import WordleGame
+    from ui.home import HomeWindow
+
+    # Como en main.py antes del navegador: la primera ventana queda referenciada y sostiene la cadena
+    root = home = HomeWindow(1, False, "spanish")
+    root.show()
+    for i in range(games):
+        home.game_window = WordleGame(home.user_id, home.is_admin, home.language)
+        home.hide()
+        home.game_window.show()
+        game = home.game_window
+        play(game)
+        game.home_window = HomeWindow(game.user_id, game.is_admin, game.language)
+        game.hide()
+        game.home_window.show()
+        home = game.home_window
+        flush_deleted_widgets(app)
+        on_game(i + 1)
+
+
+def run_mode(mode: str, games: int, step: int, words: int) -> dict:
+    from PyQt6.QtWidgets import QApplication
+
+    from ui.game import WordleGame
+
+    app = QApplication(["wordle-bench"])
+    seed_database(words)
+    WordleGame.show_message = lambda self, title, message: None
+
+    checkpoints = []
+    start = time.perf_counter()
+
+    def on_game(played):
+        if played == 1 or played % step == 0:
+            checkpoints.append({"games": played, "widgets": len(QApplication.allWidgets()),
+                                "rss_mib": round(rss_mib(), 1),
+                                "elapsed_s": round(time.perf_counter() - start, 2)})
+
+    runner = run_navigator if mode == "navigator" else run_legacy
+    runner(app, games, on_game)
+
+    from database.outbox import get_game_outbox
+    get_game_outbox().flush()
+    return {"mode": mode, "games": games, "checkpoints": checkpoints}
+
+
+def run_child(mode: str, args) -> dict:
+    """Correr un flujo en un proceso nuevo (memoria independiente) y leer su resultado."""
+    data_dir = tempfile.mkdtemp(prefix="wordle-nav-bench-")
+    env = dict(os.environ, WORDLE_BACKEND="sqlite", WORDLE_DATA_DIR=data_dir)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_navigation_memory", "--mode", mode, "--child",
+             "--games", str(args.games), "--step", str(args.step), "--words", str(args.words)],
+            env=env, capture_output=True, text=True)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr[-2000:])
+    line = next(line for line in completed.stdout.splitlines() if line.startswith(RESULT_PREFIX))
+    return json.loads(line[len(RESULT_PREFIX):])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--step", type=int, default=100, help="Cada cuántas partidas registrar la memoria")
+    parser.add_argument("--words", type=int, default=2000, help="Palabras por idioma")
+    parser.add_argument("--mode", choices=("navigator", "legacy", "both"), default="navigator")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--json", help="Archivo donde guardar los resultados")
+    args = parser.parse_args()
+
+    if args.child:
+        print(RESULT_PREFIX + json.dumps(run_mode(args.mode, args.games, args.step, args.words)), flush=True)
+        return
+
+    modes = ("legacy", "navigator") if args.mode == "both" else (args.mode,)
+    results = [run_child(mode, args) for mode in modes]
+
+    for result in results:
+        first = result["checkpoints"][0]
+        for checkpoint in result["checkpoints"]:
+            print(f"{result['mode']:>10} {checkpoint['games']:>6} partidas  "
+                  f"widgets {checkpoint['widgets']:>7}  RSS {checkpoint['rss_mib']:>8.1f} MiB  "
+                  f"({checkpoint['rss_mib'] - first['rss_mib']:+.1f})  {checkpoint['elapsed_s']:>7.1f}s")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Resultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
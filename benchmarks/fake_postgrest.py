@@ -0,0 +1,258 @@
+"""Servidor mínimo compatible con PostgREST para medir la capa de datos sin Supabase.
+
+Sirve ``/rest/v1/<tabla>`` con el subconjunto de la API que usa
+``database.supabase_client``, traduciendo cada petición a una consulta del
+backend SQLite (``database.sqlite_backend``, con el mismo esquema e índices):
+
+- ``GET`` con ``select`` (incluye recursos embebidos muchos-a-uno, p. ej.
+  ``tipo_usuario(es_administrador)``), filtros ``eq``/``neq``/``gt``/``gte``/
+  ``lt``/``lte``/``in``, ``order``, ``limit`` y ``Prefer: count=exact``.
+- ``POST`` para insertar una fila o una lista de filas; con
+  ``Prefer: resolution=merge-duplicates`` (o ``ignore-duplicates``) y
+  ``on_conflict`` hace un upsert.
+- ``PATCH`` para actualizar las filas que cumplen los filtros.
+- ``POST /rpc/<función>`` para las funciones de database/migrations.
+
+Cada petición espera ``latency`` segundos antes de responder para simular el
+viaje de ida y vuelta a Supabase. ``build_dataset`` genera tablas de
+cualquier tamaño para los benchmarks.
+"""
+import json
+import random
+import shutil
+import socket
+import string
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from database.sqlite_backend import SQLiteClient, SQLiteRPC
+
+# Clave con forma de JWT: create_client valida el formato, no la firma
+FAKE_KEY = "fake.postgrest.key"
+
+REST_PREFIX = "/rest/v1/"
+
+FILTER_OPERATORS = ("eq", "neq", "gt", "gte", "lt", "lte")
+
+# Orden de carga que respeta las claves foráneas
+TABLE_ORDER = ["tipo_usuario", "idiomas", "usuarios", "palabras", "partidas"]
+
+
+def _filter_value(value: str):
+    # SQLite guarda los booleanos como 0/1; los números los convierte la afinidad de la columna
+    return {"true": 1, "false": 0}.get(value, value)
+
+
+def build_dataset(users: int = 100, games: int = 1000, words: int = 2000, seed: int = 0) -> dict:
+    """Tablas sintéticas: ``words`` palabras por idioma y ``games`` partidas repartidas entre ``users``."""
+    from database.supabase_client import hash_password
+
+    rng = random.Random(seed)
+    password = hash_password("secreto")
+
+    palabras = []
+    for idioma_id in (1, 2):
+        seen = set()
+        while len(seen) < words:
+            seen.add("".join(rng.choice(string.ascii_lowercase) for _ in range(5)))
+        palabras.extend({"palabra": palabra, "idioma_id": idioma_id} for palabra in sorted(seen))
+    for palabra_id, palabra in enumerate(palabras, start=1):
+        palabra["id"] = palabra_id
+
+    return {
+        "usuarios": [
+            {"id": i, "nombre_usuario": f"usuario{i}", "contrasena": password, "email": f"usuario{i}@mail.com",
+             "tipo_usuario_id": 2 if i == 1 else 1}
+            for i in range(1, users + 1)
+        ],
+        "palabras": palabras,
+        "partidas": [
+            {"id": i, "created_at": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T12:00:00+00:00",
+             "usuario_id": rng.randint(1, users), "palabra_id": rng.randint(1, len(palabras)),
+             "adivinada": rng.random() < 0.6, "intentos": rng.randint(1, 6),
+             "time_taken": round(rng.uniform(10, 300), 1), "hints_used": rng.randint(0, 3)}
+            for i in range(1, games + 1)
+        ],
+    }
+
+
+class FakePostgrest:
+    """Servidor HTTP en un hilo propio sobre una base SQLite temporal; usar como administrador de contexto."""
+
+    def __init__(self, tables: dict = None, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._directory = tempfile.mkdtemp(prefix="fake-postgrest-")
+        self.backend = SQLiteClient(Path(self._directory) / "postgrest.db")
+        if tables:
+            self.load(tables)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def load(self, tables: dict) -> None:
+        """Reemplazar el contenido de las tablas dadas por ``tables`` ({tabla: [filas]})."""
+        ordered = sorted(tables, key=lambda t: TABLE_ORDER.index(t) if t in TABLE_ORDER else len(TABLE_ORDER))
+        connection = self.backend.connection()
+        with connection:
+            for table in reversed(ordered):
+                connection.execute(f"delete from {table}")
+            for table in ordered:
+                rows = tables[table]
+                if not rows:
+                    continue
+                columns = list(rows[0])
+                connection.executemany(
+                    f"insert into {table} ({', '.join(columns)}) values ({', '.join('?' * len(columns))})",
+                    [[row.get(column) for column in columns] for row in rows])
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="FakePostgrest", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # Traducción de los parámetros de PostgREST a consultas del backend
+
+    def _apply_params(self, query, params: list):
+        for key, value in params:
+            if key == "select":
+                continue
+            if key == "order":
+                for term in value.split(","):
+                    column, _, direction = term.partition(".")
+                    query = query.order(column, desc=direction.startswith("desc"))
+            elif key == "limit":
+                query = query.limit(int(value))
+            else:
+                operator, _, operand = value.partition(".")
+                if operator == "in":
+                    query = query.in_(key, [_filter_value(v.strip('"')) for v in operand.strip("()").split(",")])
+                elif operator in FILTER_OPERATORS:
+                    query = getattr(query, operator)(key, _filter_value(operand))
+                else:
+                    raise ValueError(f"Operador no soportado: {operator}")
+        return query
+
+    def select(self, table: str, params: list, count: bool = False):
+        query = self.backend.table(table).select(dict(params).get("select", "*"), count="exact" if count else None)
+        return self._apply_params(query, params).execute()
+
+    def insert(self, table: str, payload):
+        return self.backend.table(table).insert(payload).execute()
+
+    def upsert(self, table: str, payload, on_conflict: str, ignore_duplicates: bool):
+        return self.backend.table(table).upsert(payload, on_conflict=on_conflict,
+                                                ignore_duplicates=ignore_duplicates).execute()
+
+    def update(self, table: str, params: list, values: dict):
+        return self._apply_params(self.backend.table(table).update(values), params).execute()
+
+    def rpc(self, function: str, params: dict):
+        return SQLiteRPC(self.backend, function, params).execute()
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _table(self):
+                path = urlsplit(self.path)
+                if not path.path.startswith(REST_PREFIX):
+                    return None, []
+                return path.path[len(REST_PREFIX):], parse_qsl(path.query, keep_blank_values=True)
+
+            def _reply(self, status: int, body, headers: dict = None):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _read_body(self):
+                # postgrest-py manda el cuerpo en un segmento aparte; sin ACK inmediato
+                # el cliente espera el ACK retardado del servidor (~40ms en Linux)
+                if hasattr(socket, "TCP_QUICKACK"):
+                    self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+                length = int(self.headers.get("Content-Length", 0))
+                return self.rfile.read(length) if length else b""
+
+            def _begin(self):
+                # Consumir el cuerpo siempre: la conexión se reutiliza (keep-alive)
+                body = self._read_body()
+                with fake._lock:
+                    fake.request_count += 1
+                if fake.latency:
+                    time.sleep(fake.latency)
+                return json.loads(body) if body else None
+
+            def _handle(self, action):
+                try:
+                    status, body, headers = action()
+                except Exception as e:
+                    self._reply(400, {"message": str(e)})
+                    return
+                self._reply(status, body, headers)
+
+            def do_GET(self):
+                self._begin()
+                table, params = self._table()
+                count = "count=" in self.headers.get("Prefer", "")
+
+                def action():
+                    response = fake.select(table, params, count)
+                    headers = {}
+                    if count:
+                        headers["Content-Range"] = (f"0-{len(response.data) - 1}/{response.count}" if response.data
+                                                    else f"*/{response.count}")
+                    return 200, response.data, headers
+
+                self._handle(action)
+
+            def do_POST(self):
+                payload = self._begin()
+                table, params = self._table()
+                prefer = self.headers.get("Prefer", "")
+                if table.startswith("rpc/"):
+                    self._handle(lambda: (200, fake.rpc(table[4:], payload or {}).data, None))
+                elif "resolution=" in prefer:
+                    on_conflict = dict(params).get("on_conflict", "")
+                    ignore = "resolution=ignore-duplicates" in prefer
+                    self._handle(lambda: (201, fake.upsert(table, payload, on_conflict, ignore).data, None))
+                else:
+                    self._handle(lambda: (201, fake.insert(table, payload).data, None))
+
+            def do_PATCH(self):
+                payload = self._begin()
+                table, params = self._table()
+                self._handle(lambda: (200, fake.update(table, params, payload).data, None))
+
+        return Handler
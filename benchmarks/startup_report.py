@@ -0,0 +1,139 @@
+"""Informe del tiempo de arranque hasta la primera pintura de la ventana de inicio de sesión.
+
+Lanza ``main.startup`` en un proceso nuevo con ``python -X importtime``
+(plataforma Qt ``offscreen`` y backend SQLite en un directorio temporal,
+así no hace falta red) y mide el tiempo desde el inicio del intérprete hasta
+que la ventana se pintó por primera vez. Del informe de ``-X importtime``
+muestra los módulos más costosos y cuáles de los módulos pesados (supabase,
+httpx, numpy, las demás ventanas) se importaron antes de esa primera pintura.
+
+Uso: python -m benchmarks.startup_report [--runs 5] [--top 15] [--json arranque.json]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Módulos que no deberían cargarse antes de mostrar la ventana de inicio de sesión
+HEAVY_MODULES = ("supabase", "postgrest", "httpx", "numpy", "ui.game", "ui.admin", "ui.statistics",
+                 "ui.language_selection", "ui.signup")
+
+# Se ejecuta en el proceso hijo: el marcador separa lo importado antes y después de la primera pintura
+PROBE = """
+import builtins
+import sys
+import time
+from PyQt6.QtCore import QEvent, QObject
+import main
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and not hasattr(self, "at"):
+            self.at = time.perf_counter()
+        return False
+
+first_paint = FirstPaint()
+app, window = main.startup(["wordle"])
+window.installEventFilter(first_paint)
+window.repaint()
+app.processEvents()
+elapsed = getattr(first_paint, "at", time.perf_counter()) - builtins._startup_t0
+print("STARTUP_MS", round(elapsed * 1000, 1), flush=True)
+sys.stderr.write("STARTUP_MARK\\n")
+sys.stderr.flush()
+app.supabase_task.future.result(timeout=30)
+"""
+
+
+def run_probe(data_dir: str) -> tuple:
+    """Ejecutar el arranque una vez; devuelve (ms hasta la primera pintura, líneas de importtime)."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", WORDLE_BACKEND="sqlite", WORDLE_DATA_DIR=data_dir)
+    bootstrap = "import builtins, time; builtins._startup_t0 = time.perf_counter()\n" + PROBE
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", bootstrap], cwd=ROOT, env=env,
+                               capture_output=True, text=True, timeout=120)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr[-2000:])
+
+    startup_ms = next(float(line.split()[1]) for line in completed.stdout.splitlines()
+                      if line.startswith("STARTUP_MS"))
+    before_paint = completed.stderr.split("STARTUP_MARK")[0]
+    return startup_ms, before_paint.splitlines()
+
+
+def parse_importtime(lines: list) -> dict:
+    """Módulo -> (tiempo propio, tiempo acumulado) en microsegundos."""
+    modules = {}
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def top_level_total(lines: list) -> int:
+    """Suma del tiempo acumulado de las importaciones de primer nivel (sin sangría)."""
+    total = 0
+    for line in lines:
+        if line.startswith("import time:") and "self [us]" not in line:
+            _, cumulative_us, name = line[len("import time:"):].split("|")
+            if not name.startswith("  "):
+                total += int(cumulative_us)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Cantidad de módulos más costosos a mostrar")
+    parser.add_argument("--json", help="Archivo donde guardar el informe")
+    args = parser.parse_args()
+
+    timings = []
+    lines = []
+    with tempfile.TemporaryDirectory(prefix="wordle-startup-") as data_dir:
+        for _ in range(args.runs):
+            startup_ms, lines = run_probe(data_dir)
+            timings.append(startup_ms)
+    timings.sort()
+
+    # El informe de módulos es el de la última corrida (cachés de bytecode ya calientes)
+    modules = parse_importtime(lines)
+    slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    heavy_loaded = [name for name in HEAVY_MODULES if name in modules]
+
+    print(f"primera pintura: mediana {timings[len(timings) // 2]:.1f}ms  mínimo {timings[0]:.1f}ms  "
+          f"({args.runs} corridas)")
+    print(f"importaciones antes de la primera pintura: {top_level_total(lines) / 1000:.1f}ms  "
+          f"({len(modules)} módulos)")
+    print(f"\n{'módulo':<40} {'acumulado':>11} {'propio':>9}")
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{name:<40} {cumulative_us / 1000:>9.1f}ms {self_us / 1000:>7.1f}ms")
+    print("\nmódulos pesados cargados antes de la primera pintura: " + (", ".join(heavy_loaded) or "ninguno"))
+
+    if args.json:
+        report = {
+            "benchmark": "startup",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "first_paint_ms": timings,
+            "import_ms": round(top_level_total(lines) / 1000, 1),
+            "slowest_modules": [{"module": name, "cumulative_ms": cumulative_us / 1000,
+                                 "self_ms": self_us / 1000} for name, (self_us, cumulative_us) in slowest],
+            "heavy_modules_before_paint": heavy_loaded,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Informe guardado en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
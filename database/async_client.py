@@ -0,0 +1,314 @@
+"""Variante asíncrona (asyncio) de la capa de datos.
+
+Ofrece las mismas consultas de lectura que ``database.supabase_client``
+como corrutinas sobre ``AsyncPostgrestClient`` (httpx.AsyncClient con los
+ajustes de conexión de ``get_http_settings``). Las consultas que no
+dependen entre sí se lanzan a la vez con ``asyncio.gather``: por ejemplo 'usuarios' y
+'palabras' de un bloque de partidas, mientras se pide la página siguiente.
+
+Se puede usar desde un bucle de eventos integrado con Qt (p. ej. qasync)::
+
+    asyncio.ensure_future(async_client.get_user_statistics(user_id))
+
+o desde un hilo con ``async_client.run(...)``, que equivale a
+``asyncio.run`` pero cierra el cliente HTTP de ese bucle al terminar. Con
+un bucle propio y duradero (el de qasync), hay que esperar
+``close_async_client()`` antes de cerrarlo.
+
+Hay un cliente HTTP por bucle de eventos, así que ambos usos pueden
+convivir. Los clientes de bucles ya cerrados se descartan al pedir uno
+nuevo. Las cachés locales (instantánea de estadísticas, tablas de
+referencia) son las mismas que las del cliente síncrono.
+
+Con WORDLE_BACKEND=sqlite las consultas van a la misma base local que el
+cliente síncrono: cada ``execute`` corre en un hilo con ``asyncio.to_thread``.
+"""
+import asyncio
+import os
+import weakref
+
+import httpx
+from postgrest import AsyncPostgrestClient
+
+from database.stats_snapshot import load_user_snapshot, save_user_snapshot
+from database.sqlite_backend import SQLiteQuery, SQLiteRPC
+from database.supabase_client import (STATISTICS_PAGE_SIZE, USUARIO_CON_TIPO, _format_partida,
+                                      _pop_es_administrador, _reference_cache, get_backend_name,
+                                      get_http_settings, get_supabase_client, verify_password)
+from engine.statistics import summarize_statistics
+
+# Un cliente por bucle de eventos: httpx.AsyncClient no se puede compartir entre bucles
+_async_clients = weakref.WeakKeyDictionary()
+
+
+class _PooledPostgrestClient(AsyncPostgrestClient):
+    """AsyncPostgrestClient con los mismos ajustes de conexión que el cliente síncrono."""
+
+    def create_session(self, base_url, headers, timeout):
+        return httpx.AsyncClient(base_url=base_url, headers=headers, **get_http_settings())
+
+
+class _ThreadedSQLiteQuery(SQLiteQuery):
+    """SQLiteQuery cuyo ``execute`` se espera y corre la consulta en un hilo."""
+
+    async def execute(self):
+        return await asyncio.to_thread(super().execute)
+
+
+class _ThreadedSQLiteRPC(SQLiteRPC):
+    async def execute(self):
+        return await asyncio.to_thread(super().execute)
+
+
+class _AsyncSQLiteClient:
+    """Interfaz de AsyncPostgrestClient sobre el cliente SQLite de ``get_supabase_client``."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def table(self, table_name: str) -> SQLiteQuery:
+        return _ThreadedSQLiteQuery(self.client, table_name)
+
+    def from_(self, table_name: str) -> SQLiteQuery:
+        return self.table(table_name)
+
+    async def rpc(self, fn: str, params: dict) -> SQLiteRPC:
+        return _ThreadedSQLiteRPC(self.client, fn, params)
+
+    async def aclose(self) -> None:
+        # Las conexiones son del cliente síncrono (una por hilo) y siguen en uso
+        pass
+
+
+def get_async_client() -> AsyncPostgrestClient:
+    """Obtener el cliente asíncrono del bucle de eventos actual (se crea la primera vez)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        # Las conexiones de un cliente guardan referencias a su bucle: soltar los de bucles cerrados
+        for closed_loop in [other for other in _async_clients if other.is_closed()]:
+            del _async_clients[closed_loop]
+
+        if get_backend_name() == "sqlite":
+            client = _async_clients[loop] = _AsyncSQLiteClient(get_supabase_client())
+            return client
+
+        supabase_url = os.getenv("SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_KEY")
+
+        if not supabase_url or not supabase_key:
+            raise ValueError("Supabase URL and key must be set in .env file")
+
+        client = _PooledPostgrestClient(
+            f"{supabase_url}/rest/v1",
+            headers={"apiKey": supabase_key, "Authorization": f"Bearer {supabase_key}"},
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Cerrar las conexiones del cliente del bucle de eventos actual."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def run(coro):
+    """Correr ``coro`` en un bucle nuevo, como ``asyncio.run``, y cerrar su cliente al terminar."""
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            await close_async_client()
+
+    return asyncio.run(run_and_close())
+
+
+# Funciones de Autenticación de Usuario
+async def sign_in(username: str, password: str) -> dict:
+    """Iniciar sesión de un usuario existente."""
+    client = get_async_client()
+
+    user_result = await client.table("usuarios").select(USUARIO_CON_TIPO).eq("nombre_usuario", username).execute()
+
+    if not user_result.data or len(user_result.data) == 0:
+        raise ValueError("Nombre de usuario o contraseña invalidos")
+
+    user_data = user_result.data[0]
+
+    if not verify_password(password, user_data["contrasena"]):
+        raise ValueError("Nombre de usuario o contraseña invalidos")
+
+    user_data['is_admin'] = _pop_es_administrador(user_data)
+
+    return user_data
+
+
+async def get_user_profile(user_id: int) -> dict:
+    """Obtener el perfil de un usuario."""
+    client = get_async_client()
+    result = await client.table("usuarios").select("id, nombre_usuario, email, tipo_usuario_id").eq(
+        "id", user_id).execute()
+
+    if not result.data or len(result.data) == 0:
+        raise ValueError("Usuario no encontrado")
+
+    return result.data[0]
+
+
+async def is_admin(user_id: int) -> bool:
+    """Verificar si un usuario es administrador."""
+    client = get_async_client()
+    result = await client.table("usuarios").select("id, tipo_usuario(es_administrador)").eq("id", user_id).execute()
+
+    if not result.data or len(result.data) == 0:
+        raise ValueError("Usuario no encontrado")
+
+    return _pop_es_administrador(result.data[0])
+
+
+# Tablas de referencia
+async def _get_idiomas() -> dict:
+    """Obtener la tabla 'idiomas' completa como {id: idioma} (en caché)."""
+    idiomas = _reference_cache.get("idiomas", "all")
+    if idiomas is not None:
+        return idiomas
+
+    client = get_async_client()
+    result = await client.table("idiomas").select("id, idioma").execute()
+    idiomas = {idioma["id"]: idioma["idioma"] for idioma in (result.data or [])}
+
+    if idiomas:
+        _reference_cache.set("idiomas", "all", idiomas)
+    return idiomas
+
+
+async def _get_palabra_map(palabra_ids: list) -> dict:
+    client = get_async_client()
+    result = await client.table("palabras").select("id, palabra, idioma_id").in_("id", palabra_ids).execute()
+    return {palabra["id"]: palabra for palabra in (result.data or [])}
+
+
+async def _get_user_map(user_ids: list) -> dict:
+    client = get_async_client()
+    result = await client.table("usuarios").select("id, nombre_usuario").in_("id", user_ids).execute()
+    return {user["id"]: user["nombre_usuario"] for user in (result.data or [])}
+
+
+# Estadísticas
+async def _fetch_partidas_page(columns: str, after_id=None, user_id: int = None,
+                               page_size: int = STATISTICS_PAGE_SIZE) -> list:
+    """Una página de 'partidas' con id mayor a ``after_id`` (de un usuario, o de todos)."""
+    client = get_async_client()
+    query = client.table("partidas").select(columns)
+    if user_id is not None:
+        query = query.eq("usuario_id", user_id)
+    if after_id is not None:
+        query = query.gt("id", after_id)
+    result = await query.order("id").limit(page_size).execute()
+    return result.data if result.data else []
+
+
+async def _iter_partidas_pages(columns: str, after_id=None, user_id: int = None,
+                               page_size: int = STATISTICS_PAGE_SIZE):
+    """Recorrer 'partidas' por páginas pidiendo la siguiente mientras se procesa la actual."""
+    partidas = await _fetch_partidas_page(columns, after_id, user_id, page_size)
+    while partidas:
+        next_page = None
+        if len(partidas) == page_size:
+            next_page = asyncio.ensure_future(
+                _fetch_partidas_page(columns, partidas[-1]["id"], user_id, page_size))
+        try:
+            yield partidas
+        except BaseException:
+            if next_page is not None:
+                next_page.cancel()
+            raise
+        partidas = await next_page if next_page is not None else []
+
+
+async def get_user_statistics(user_id: int) -> list:
+    """Obtener estadísticas para un usuario específico de la tabla 'partidas'
+
+    Igual que la versión síncrona: solo descarga las partidas con 'id'
+    mayor al último guardado en la copia local.
+    """
+    snapshot = load_user_snapshot(user_id)
+
+    try:
+        new_games = []
+        pages = _iter_partidas_pages("id, created_at, palabra_id, adivinada, intentos, time_taken, hints_used, client_id",
+                                     snapshot["last_id"], user_id=user_id)
+        async for partidas in pages:
+            palabra_ids = list(set(partida["palabra_id"] for partida in partidas))
+            palabra_map, idioma_map = await asyncio.gather(_get_palabra_map(palabra_ids), _get_idiomas())
+
+            new_games.extend(_format_partida(partida, palabra_map, idioma_map) for partida in partidas)
+            snapshot["last_id"] = partidas[-1]["id"]
+
+        if new_games:
+            snapshot["games"].extend(new_games)
+            save_user_snapshot(user_id, snapshot)
+
+        return snapshot["games"]
+    except Exception as e:
+        print(f"Error al obtener las estadísticas del usuario: {e}")
+        return snapshot["games"]
+
+
+async def iter_all_statistics(page_size: int = STATISTICS_PAGE_SIZE):
+    """Recorrer las partidas de todos los usuarios en bloques ya enriquecidos.
+
+    Por cada bloque, 'usuarios' y 'palabras' se consultan a la vez y la
+    página siguiente de 'partidas' ya está en camino.
+    """
+    idioma_map = await _get_idiomas()
+    pages = _iter_partidas_pages("id, created_at, usuario_id, palabra_id, adivinada, intentos, time_taken, hints_used",
+                                 page_size=page_size)
+
+    async for partidas in pages:
+        user_ids = list(set(partida["usuario_id"] for partida in partidas))
+        palabra_ids = list(set(partida["palabra_id"] for partida in partidas))
+        user_map, palabra_map = await asyncio.gather(_get_user_map(user_ids), _get_palabra_map(palabra_ids))
+
+        chunk = []
+        for partida in partidas:
+            game = _format_partida(partida, palabra_map, idioma_map)
+            chunk.append({"username": user_map.get(partida["usuario_id"], "Unknown"), **game})
+        yield chunk
+
+
+async def get_all_statistics() -> list:
+    """Obtener estadísticas para todos los usuarios (solo administrador) de la tabla 'partidas'"""
+    try:
+        formatted_data = []
+        async for chunk in iter_all_statistics():
+            formatted_data.extend(chunk)
+        return formatted_data
+    except Exception as e:
+        print(f"Error al obtener las estadísticas de todos los usuarios: {e}")
+        return []
+
+
+async def get_statistics_summary(user_id: int = None):
+    """Obtener el resumen de estadísticas calculado en el servidor (None si no está disponible)."""
+    client = get_async_client()
+
+    try:
+        query = await client.rpc("estadisticas_resumen", {"p_usuario_id": user_id})
+        result = await query.execute()
+        if not result.data:
+            raise ValueError("La función 'estadisticas_resumen' no devolvió datos")
+
+        row = result.data[0]
+        return summarize_statistics(row["total_games"], row["wins"], row["english_games"], row["spanish_games"],
+                                    row["total_time"], row["total_attempts"])
+    except Exception as e:
+        print(f"Error al obtener el resumen de estadísticas: {e}")
+        return None
+
+
+async def get_admin_dashboard() -> tuple:
+    """Resumen del servidor y todas las partidas, pedidos a la vez."""
+    return await asyncio.gather(get_statistics_summary(), get_all_statistics())
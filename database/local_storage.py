@@ -0,0 +1,38 @@
+import hashlib
+import os
+from pathlib import Path
+
+
+def get_local_dir(*parts) -> Path:
+    """Obtener (y crear si no existe) un directorio de datos locales de la aplicación.
+
+    La ubicación base se puede cambiar con la variable de entorno WORDLE_DATA_DIR.
+    """
+    base = os.getenv("WORDLE_DATA_DIR") or os.path.join(Path.home(), ".wordle")
+    path = Path(base, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def backend_namespace() -> str:
+    """Nombre del backend en uso seguido de un hash de su URL (Supabase) o de su archivo (SQLite)."""
+    from database.supabase_client import get_backend_name
+
+    backend = get_backend_name()
+    if backend == "sqlite":
+        from database.sqlite_backend import default_database_path
+        location = os.path.abspath(default_database_path())
+    else:
+        location = (os.getenv("SUPABASE_URL") or "").rstrip("/")
+
+    return f"{backend}-{hashlib.sha1(location.encode('utf-8')).hexdigest()[:12]}"
+
+
+def get_backend_dir(*parts) -> Path:
+    """Directorio local para datos que dependen de la base en uso.
+
+    Las copias de partidas, las palabras con sus ids y la bandeja de salida
+    guardan ids de esa base, así que cada una va bajo
+    ``backends/<backend_namespace()>`` y dos bases distintas no se mezclan.
+    """
+    return get_local_dir("backends", backend_namespace(), *parts)
@@ -0,0 +1,56 @@
+-- Estadísticas agregadas en el servidor.
+-- Ejecutar en el editor SQL de Supabase (o con psql) una sola vez por proyecto.
+
+-- Índices para las consultas por usuario y por palabra
+create index if not exists partidas_usuario_id_idx on partidas (usuario_id);
+create index if not exists partidas_palabra_id_idx on partidas (palabra_id);
+create index if not exists palabras_idioma_id_idx on palabras (idioma_id);
+
+-- Una fila por partida con su idioma ya normalizado ('english' / 'spanish')
+create or replace view partidas_idioma as
+select p.id,
+       p.usuario_id,
+       p.adivinada,
+       p.intentos,
+       p.time_taken,
+       p.hints_used,
+       p.created_at,
+       case when lower(i.idioma) in ('español', 'spanish') then 'spanish' else 'english' end as language
+from partidas p
+left join palabras pa on pa.id = p.palabra_id
+left join idiomas i on i.id = pa.idioma_id;
+
+-- Resumen de las tarjetas de estadísticas: de un usuario, o de todos si p_usuario_id es null
+create or replace function estadisticas_resumen(p_usuario_id bigint default null)
+returns table (
+    total_games bigint,
+    wins bigint,
+    english_games bigint,
+    spanish_games bigint,
+    total_time double precision,
+    total_attempts bigint
+)
+language sql
+stable
+as $$
+    select count(*),
+           count(*) filter (where adivinada),
+           count(*) filter (where language = 'english'),
+           count(*) filter (where language = 'spanish'),
+           coalesce(sum(time_taken), 0)::double precision,
+           coalesce(sum(intentos), 0)
+    from partidas_idioma
+    where p_usuario_id is null or usuario_id = p_usuario_id;
+$$;
+
+-- Partidas jugadas por idioma
+create or replace view distribucion_idiomas as
+select i.idioma as language_name,
+       count(p.id) as game_count
+from idiomas i
+left join palabras pa on pa.idioma_id = i.id
+left join partidas p on p.palabra_id = pa.id
+group by i.idioma;
+
+grant select on partidas_idioma, distribucion_idiomas to anon, authenticated;
+grant execute on function estadisticas_resumen(bigint) to anon, authenticated;
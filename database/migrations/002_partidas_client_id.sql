@@ -0,0 +1,9 @@
+-- Identificador generado en el cliente para cada partida de la bandeja de salida.
+-- Los reenvíos usan upsert con on_conflict=client_id, así un lote que se guardó
+-- pero cuya respuesta se perdió no crea filas duplicadas.
+-- Ejecutar en el editor SQL de Supabase (o con psql) una sola vez por proyecto.
+
+alter table partidas add column if not exists client_id uuid;
+
+-- Único para que on_conflict lo pueda usar; las partidas anteriores quedan con null
+create unique index if not exists partidas_client_id_idx on partidas (client_id);
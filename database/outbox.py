@@ -0,0 +1,246 @@
+"""Bandeja de salida local para los resultados de las partidas.
+
+Cada partida terminada se agrega de inmediato a un diario (JSON por línea)
+en disco. Un único hilo en segundo plano envía lo pendiente a 'partidas'
+con inserciones en lote, reintentando con espera exponencial mientras
+Supabase no esté disponible. Lo que no llegó a enviarse se retoma en el
+próximo inicio de la aplicación.
+
+Solo las fallas de transporte (sin conexión, tiempo agotado, base local
+ocupada) se reintentan. Si la base rechaza un lote (p. ej. una clave
+foránea inválida), el lote se parte hasta aislar las filas rechazadas; esas
+entradas, igual que las que no se pueden armar (idioma desconocido, campos
+faltantes), no se descartan: se apartan en un diario de cuarentena junto al
+principal, con el motivo, para poder revisarlas o reencolarlas a mano.
+
+Cada entrada lleva un 'client_id' generado al registrarla y se envía como
+upsert sobre esa columna, así reintentar un lote que se guardó pero cuya
+respuesta se perdió no duplica partidas.
+"""
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+
+from database.local_storage import get_backend_dir, get_local_dir
+from database.supabase_client import _build_partida_row, save_game_results
+
+# Partidas por inserción en lote
+BATCH_SIZE = 100
+
+# Espera entre reintentos (segundos): se duplica tras cada fallo hasta el máximo
+RETRY_INITIAL_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+
+class GameOutbox:
+    """Diario de resultados pendientes con un hilo que los envía en lote."""
+
+    def __init__(self, journal_path=None):
+        if journal_path is None:
+            journal_path = get_backend_dir("outbox") / "partidas.jsonl"
+            _adopt_legacy_journal(journal_path)
+        self.journal_path = journal_path
+        self.quarantine_path = self.journal_path.with_name(f"{self.journal_path.stem}.rechazadas.jsonl")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._pending = self._read_journal()
+        self._retry_delay = RETRY_INITIAL_DELAY
+
+        self._thread = threading.Thread(target=self._run, name="GameOutboxFlusher", daemon=True)
+        self._thread.start()
+        if self._pending:
+            self._wakeup.set()
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def pending_games(self, user_id) -> list:
+        """Copias de las partidas de un usuario que todavía no llegaron a la base."""
+        with self._lock:
+            return [dict(entry) for entry in self._pending if entry.get("user_id") == user_id]
+
+    def record(self, user_id, word, language, attempts, time_taken, win, hints_used) -> str:
+        """Registrar el resultado de una partida en el diario y programar su envío; devuelve su 'client_id'."""
+        entry = {
+            "client_id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "word": word,
+            "language": language,
+            "attempts": attempts,
+            "time_taken": time_taken,
+            "win": win,
+            "hints_used": hints_used,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        with self._lock:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending.append(entry)
+            self._idle.clear()
+
+        self._retry_delay = RETRY_INITIAL_DELAY
+        self._wakeup.set()
+        return entry["client_id"]
+
+    def flush(self, timeout: float = None) -> bool:
+        """Pedir un envío inmediato y esperar a que no quede nada pendiente."""
+        self._wakeup.set()
+        return self._idle.wait(timeout)
+
+    def _read_journal(self) -> list:
+        entries = []
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        # Línea incompleta de un cierre inesperado
+                        continue
+        except FileNotFoundError:
+            pass
+
+        # Diarios de versiones anteriores: fijar el id antes de enviar nada, para que un reintento use el mismo
+        if any("client_id" not in entry for entry in entries):
+            for entry in entries:
+                entry.setdefault("client_id", str(uuid.uuid4()))
+            self._pending = entries
+            self._rewrite_journal()
+        return entries
+
+    def _rewrite_journal(self) -> None:
+        """Reescribir el diario de forma atómica con las entradas todavía pendientes."""
+        tmp_path = self.journal_path.with_name(f"{self.journal_path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self._pending:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            while True:
+                with self._lock:
+                    batch = self._pending[:BATCH_SIZE]
+                    if not batch:
+                        self._idle.set()
+                        break
+
+                try:
+                    rejected = self._send(batch)
+                except Exception as e:
+                    print(f"Error al enviar partidas pendientes, reintento en {self._retry_delay:.0f}s: {str(e)}")
+                    if self._wakeup.wait(self._retry_delay):
+                        self._wakeup.clear()
+                    self._retry_delay = min(self._retry_delay * 2, RETRY_MAX_DELAY)
+                    continue
+
+                self._retry_delay = RETRY_INITIAL_DELAY
+                with self._lock:
+                    if rejected:
+                        # Primero la cuarentena: un cierre entre ambas escrituras duplica, no pierde
+                        self._quarantine(rejected)
+                    sent = {id(entry) for entry in batch}
+                    self._pending = [entry for entry in self._pending if id(entry) not in sent]
+                    self._rewrite_journal()
+
+    def _send(self, batch) -> list:
+        """Enviar un lote; devuelve las entradas rechazadas, con el motivo.
+
+        Las fallas de transporte se propagan para que el lote completo se reintente.
+        """
+        entries = []
+        rows = []
+        rejected = []
+        for entry in batch:
+            try:
+                row = _build_partida_row(entry["user_id"], entry["word"], entry["language"], entry["attempts"],
+                                         entry["time_taken"], entry["win"], entry["hints_used"])
+                row["created_at"] = entry["created_at"]
+                row["client_id"] = entry["client_id"]
+            except Exception as e:
+                if is_transient_error(e):
+                    raise
+                # No bloquear la cola por una entrada inválida, pero tampoco perderla
+                print(f"Se aparta una partida pendiente inválida: {str(e)}")
+                rejected.append((entry, str(e)))
+                continue
+            entries.append(entry)
+            rows.append(row)
+
+        return rejected + self._save_rows(entries, rows)
+
+    def _save_rows(self, entries, rows) -> list:
+        """Guardar las filas; si la base rechaza el lote, partirlo en mitades hasta aislar las rechazadas."""
+        if not rows:
+            return []
+
+        try:
+            save_game_results(rows)
+            return []
+        except Exception as e:
+            if is_transient_error(e):
+                raise
+            if len(rows) == 1:
+                print(f"La base rechazó una partida pendiente: {str(e)}")
+                return [(entries[0], str(e))]
+
+        # Las mitades que ya se guardaron no se duplican al reintentar: el upsert usa 'client_id'
+        middle = len(rows) // 2
+        return self._save_rows(entries[:middle], rows[:middle]) + self._save_rows(entries[middle:], rows[middle:])
+
+    def _quarantine(self, rejected) -> None:
+        """Agregar al diario de cuarentena las entradas rechazadas y el motivo."""
+        with open(self.quarantine_path, "a", encoding="utf-8") as f:
+            for entry, reason in rejected:
+                f.write(json.dumps({"entry": entry, "error": reason}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Indicar si un error es de transporte (vale la pena reintentar) y no un rechazo de los datos."""
+    if isinstance(error, OSError):
+        return True
+    if isinstance(error, sqlite3.OperationalError):
+        # Base local ocupada por otro proceso; los errores de esquema no se arreglan reintentando
+        return any(reason in str(error) for reason in ("locked", "busy", "unable to open"))
+    try:
+        import httpx
+    except ImportError:
+        return False
+    return isinstance(error, httpx.TransportError)
+
+
+def _adopt_legacy_journal(journal_path) -> None:
+    """Mover a ``journal_path`` el diario de versiones anteriores, que no distinguía la base."""
+    legacy_path = get_local_dir() / "outbox" / "partidas.jsonl"
+    if legacy_path.exists() and not journal_path.exists():
+        os.replace(legacy_path, journal_path)
+
+
+_outbox = None
+_outbox_lock = threading.Lock()
+
+
+def get_game_outbox() -> GameOutbox:
+    """Obtener la bandeja de salida compartida por todo el proceso."""
+    global _outbox
+
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = GameOutbox()
+        return _outbox
@@ -0,0 +1,447 @@
+"""Backend local en SQLite con el mismo esquema que Supabase.
+
+Implementa el subconjunto del constructor de consultas de postgrest-py que
+usa ``database.supabase_client`` (``table().select/insert/upsert/update``, filtros
+``eq``/``neq``/``gt``/``gte``/``lt``/``lte``/``in_``, ``order``, ``limit``,
+``count="exact"``, recursos embebidos muchos-a-uno y ``rpc``), así que el
+resto de la capa de datos funciona sin cambios sin conexión a internet.
+
+Se activa con ``WORDLE_BACKEND=sqlite``; la base se guarda en
+``WORDLE_SQLITE_PATH`` (por defecto ``~/.wordle/wordle.db``). Sirve para
+instalaciones tipo kiosco y como backend de referencia en los benchmarks.
+
+Las inserciones y actualizaciones devuelven las filas con ``returning``
+(SQLite 3.35 o posterior); con versiones anteriores las filas se vuelven a
+leer por ``rowid`` o por la columna de ``on_conflict``. ``upsert`` necesita
+SQLite 3.24 o posterior.
+
+Para cargar una lista de palabras (una por línea)::
+
+    python -m database.sqlite_backend --import-words english palabras.txt
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+
+from database.local_storage import get_local_dir
+
+SCHEMA = """
+create table if not exists tipo_usuario (
+    id integer primary key,
+    tipo text not null,
+    es_administrador integer not null default 0
+);
+
+create table if not exists usuarios (
+    id integer primary key,
+    nombre_usuario text not null unique,
+    contrasena text not null,
+    email text,
+    tipo_usuario_id integer references tipo_usuario (id)
+);
+
+create table if not exists idiomas (
+    id integer primary key,
+    idioma text not null unique
+);
+
+create table if not exists palabras (
+    id integer primary key,
+    palabra text not null,
+    idioma_id integer not null references idiomas (id)
+);
+
+create table if not exists partidas (
+    id integer primary key,
+    created_at text not null default (strftime('%Y-%m-%dT%H:%M:%f', 'now') || '+00:00'),
+    usuario_id integer not null references usuarios (id),
+    palabra_id integer not null references palabras (id),
+    adivinada integer not null default 0,
+    intentos integer not null default 0,
+    time_taken real not null default 0,
+    hints_used integer not null default 0,
+    client_id text
+);
+
+create index if not exists partidas_usuario_id_idx on partidas (usuario_id);
+create index if not exists partidas_palabra_id_idx on partidas (palabra_id);
+create index if not exists partidas_created_at_idx on partidas (created_at);
+create index if not exists palabras_idioma_id_idx on palabras (idioma_id);
+-- Versiones anteriores creaban un índice único que el esquema de Supabase no tiene
+drop index if exists palabras_idioma_palabra_idx;
+
+create view if not exists partidas_idioma as
+select p.id,
+       p.usuario_id,
+       p.adivinada,
+       p.intentos,
+       p.time_taken,
+       p.hints_used,
+       p.created_at,
+       case when lower(i.idioma) in ('español', 'spanish') then 'spanish' else 'english' end as language
+from partidas p
+left join palabras pa on pa.id = p.palabra_id
+left join idiomas i on i.id = pa.idioma_id;
+
+create view if not exists distribucion_idiomas as
+select i.idioma as language_name,
+       count(p.id) as game_count
+from idiomas i
+left join palabras pa on pa.idioma_id = i.id
+left join partidas p on p.palabra_id = pa.id
+group by i.idioma;
+
+-- Bases creadas antes de 'client_id' reciben la columna en SQLiteClient._migrate
+insert or ignore into tipo_usuario (id, tipo, es_administrador) values (1, 'jugador', 0), (2, 'administrador', 1);
+insert or ignore into idiomas (id, idioma) values (1, 'english'), (2, 'spanish');
+"""
+
+# Columnas booleanas (SQLite las guarda como 0/1; PostgREST devuelve true/false)
+BOOLEAN_COLUMNS = {
+    "tipo_usuario": {"es_administrador"},
+    "partidas": {"adivinada"},
+    "partidas_idioma": {"adivinada"},
+}
+
+# ``insert ... returning`` existe desde SQLite 3.35
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _identifier(name: str) -> str:
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Identificador inválido: {name!r}")
+    return name
+
+
+def _split_select(select: str) -> list:
+    """Separar la lista de ``select`` por comas de primer nivel (fuera de paréntesis)."""
+    items, depth, current = [], 0, ""
+    for char in select:
+        if char == "," and depth == 0:
+            items.append(current.strip())
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    if current.strip():
+        items.append(current.strip())
+    return items
+
+
+def _to_python(table: str, row: dict) -> dict:
+    for column in BOOLEAN_COLUMNS.get(table, ()):
+        if row.get(column) is not None:
+            row[column] = bool(row[column])
+    return row
+
+
+class SQLiteResponse:
+    """Respuesta con la misma forma que la de postgrest-py (``data`` y ``count``)."""
+
+    def __init__(self, data: list, count: int = None):
+        self.data = data
+        self.count = count
+
+
+class SQLiteQuery:
+    """Consulta sobre una tabla o vista con la interfaz encadenable de postgrest-py."""
+
+    def __init__(self, client, table: str):
+        self.client = client
+        self.table_name = _identifier(table)
+        self._action = "select"
+        self._columns = "*"
+        self._count = None
+        self._payload = None
+        # Columnas de ``on_conflict`` de un upsert (None: inserción simple)
+        self._on_conflict = None
+        self._ignore_duplicates = False
+        self._filters = []
+        self._params = []
+        self._order = []
+        self._limit = None
+
+    # Acciones
+
+    def select(self, columns: str = "*", count: str = None):
+        self._action, self._columns, self._count = "select", columns, count
+        return self
+
+    def insert(self, rows):
+        self._action, self._payload = "insert", rows
+        return self
+
+    def upsert(self, rows, on_conflict: str = "", ignore_duplicates: bool = False):
+        """Insertar o, si choca con ``on_conflict`` (la clave primaria por defecto), actualizar o ignorar."""
+        self._action, self._payload = "insert", rows
+        self._on_conflict = [_identifier(column.strip()) for column in (on_conflict or "id").split(",")]
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, values: dict):
+        self._action, self._payload = "update", values
+        return self
+
+    # Filtros
+
+    def _filter(self, column: str, operator: str, value):
+        self._filters.append(f"{_identifier(column)} {operator} ?")
+        self._params.append(value)
+        return self
+
+    def eq(self, column: str, value):
+        return self._filter(column, "=", value)
+
+    def neq(self, column: str, value):
+        return self._filter(column, "!=", value)
+
+    def gt(self, column: str, value):
+        return self._filter(column, ">", value)
+
+    def gte(self, column: str, value):
+        return self._filter(column, ">=", value)
+
+    def lt(self, column: str, value):
+        return self._filter(column, "<", value)
+
+    def lte(self, column: str, value):
+        return self._filter(column, "<=", value)
+
+    def in_(self, column: str, values):
+        values = list(values)
+        if not values:
+            self._filters.append("0")
+            return self
+        self._filters.append(f"{_identifier(column)} in ({', '.join('?' * len(values))})")
+        self._params.extend(values)
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self._order.append(f"{_identifier(column)} {'desc' if desc else 'asc'}")
+        return self
+
+    def limit(self, size: int):
+        self._limit = int(size)
+        return self
+
+    # Ejecución
+
+    def _where(self) -> str:
+        return f" where {' and '.join(self._filters)}" if self._filters else ""
+
+    def _select_list(self) -> tuple:
+        """Traducir ``select`` a SQL; los recursos embebidos se resuelven con json_object."""
+        expressions, embedded = [], []
+        for item in _split_select(self._columns):
+            if item == "*":
+                expressions.append(f"{self.table_name}.*")
+            elif "(" in item:
+                name, _, columns = item.partition("(")
+                alias, _, foreign = name.rpartition(":")
+                foreign = _identifier(foreign.split("!")[0])
+                alias = _identifier(alias or foreign)
+                pairs = ", ".join(f"'{_identifier(c.strip())}', f.{c.strip()}" for c in columns[:-1].split(","))
+                expressions.append(f"(select json_object({pairs}) from {foreign} f "
+                                   f"where f.id = {self.table_name}.{foreign}_id) as {alias}")
+                embedded.append((alias, foreign))
+            else:
+                alias, _, column = item.rpartition(":")
+                column = _identifier(column)
+                expressions.append(f"{self.table_name}.{column} as {_identifier(alias or column)}")
+        return ", ".join(expressions), embedded
+
+    def _rows(self, cursor, embedded=()) -> list:
+        rows = []
+        for row in cursor.fetchall():
+            row = dict(row)
+            for alias, foreign in embedded:
+                row[alias] = _to_python(foreign, json.loads(row[alias])) if row[alias] is not None else None
+            rows.append(_to_python(self.table_name, row))
+        return rows
+
+    def execute(self) -> SQLiteResponse:
+        connection = self.client.connection()
+        if self._action == "insert":
+            return self._execute_insert(connection)
+        if self._action == "update":
+            return self._execute_update(connection)
+
+        select_list, embedded = self._select_list()
+        sql = f"select {select_list} from {self.table_name}{self._where()}"
+        if self._order:
+            sql += f" order by {', '.join(self._order)}"
+        if self._limit is not None:
+            sql += f" limit {self._limit}"
+        data = self._rows(connection.execute(sql, self._params), embedded)
+
+        count = None
+        if self._count:
+            count_sql = f"select count(*) from {self.table_name}{self._where()}"
+            count = connection.execute(count_sql, self._params).fetchone()[0]
+        return SQLiteResponse(data, count)
+
+    def _execute_insert(self, connection) -> SQLiteResponse:
+        rows = self._payload if isinstance(self._payload, list) else [self._payload]
+        inserted = []
+        with connection:
+            for row in rows:
+                columns = [_identifier(column) for column in row]
+                sql = (f"insert into {self.table_name} ({', '.join(columns)}) "
+                       f"values ({', '.join('?' * len(columns))})") + self._conflict_clause(columns)
+                if HAS_RETURNING:
+                    inserted.extend(self._rows(connection.execute(sql + " returning *", list(row.values()))))
+                    continue
+
+                cursor = connection.execute(sql, list(row.values()))
+                if self._on_conflict is None:
+                    inserted.extend(self._rows(connection.execute(
+                        f"select * from {self.table_name} where rowid = ?", (cursor.lastrowid,))))
+                elif cursor.rowcount:
+                    # Tras un upsert lastrowid no indica la fila actualizada: buscarla por la clave del conflicto
+                    where = " and ".join(f"{column} = ?" for column in self._on_conflict)
+                    inserted.extend(self._rows(connection.execute(
+                        f"select * from {self.table_name} where {where}", [row[c] for c in self._on_conflict])))
+        return SQLiteResponse(inserted)
+
+    def _conflict_clause(self, columns) -> str:
+        if self._on_conflict is None:
+            return ""
+        target = f" on conflict ({', '.join(self._on_conflict)})"
+        updates = [column for column in columns if column not in self._on_conflict]
+        if self._ignore_duplicates or not updates:
+            return target + " do nothing"
+        return target + " do update set " + ", ".join(f"{column} = excluded.{column}" for column in updates)
+
+    def _execute_update(self, connection) -> SQLiteResponse:
+        assignments = ", ".join(f"{_identifier(column)} = ?" for column in self._payload)
+        sql = f"update {self.table_name} set {assignments}{self._where()}"
+        values = list(self._payload.values()) + self._params
+        with connection:
+            if HAS_RETURNING:
+                return SQLiteResponse(self._rows(connection.execute(sql + " returning *", values)))
+
+            # Sin returning: anotar las filas afectadas antes de cambiarlas (el filtro puede dejar de cumplirse)
+            rowids = [row[0] for row in connection.execute(
+                f"select rowid from {self.table_name}{self._where()}", self._params)]
+            connection.execute(sql, values)
+            data = self._rows(connection.execute(
+                f"select * from {self.table_name} where rowid in ({', '.join('?' * len(rowids))})", rowids))
+        return SQLiteResponse(data)
+
+
+class SQLiteRPC:
+    """Funciones del servidor (database/migrations) reimplementadas en SQL de SQLite."""
+
+    FUNCTIONS = {
+        "estadisticas_resumen": """
+            select count(*) as total_games,
+                   coalesce(sum(adivinada), 0) as wins,
+                   coalesce(sum(language = 'english'), 0) as english_games,
+                   coalesce(sum(language = 'spanish'), 0) as spanish_games,
+                   coalesce(sum(time_taken), 0.0) as total_time,
+                   coalesce(sum(intentos), 0) as total_attempts
+            from partidas_idioma
+            where :p_usuario_id is null or usuario_id = :p_usuario_id
+        """,
+    }
+
+    def __init__(self, client, function: str, params: dict):
+        if function not in self.FUNCTIONS:
+            raise ValueError(f"Función '{function}' no disponible en el backend SQLite")
+        self.client = client
+        self.function = function
+        self.params = params or {}
+
+    def execute(self) -> SQLiteResponse:
+        cursor = self.client.connection().execute(self.FUNCTIONS[self.function], self.params)
+        return SQLiteResponse([dict(row) for row in cursor.fetchall()])
+
+
+def default_database_path() -> str:
+    """Archivo de la base: WORDLE_SQLITE_PATH o ``wordle.db`` en el directorio de datos locales."""
+    return os.getenv("WORDLE_SQLITE_PATH") or str(get_local_dir() / "wordle.db")
+
+
+class SQLiteClient:
+    """Cliente con la misma interfaz que el de Supabase sobre una base SQLite local.
+
+    Cada hilo usa su propia conexión (el ejecutor de E/S consulta desde
+    varios hilos); con WAL las lecturas no esperan a las escrituras.
+    """
+
+    def __init__(self, path=None):
+        self.path = str(path or default_database_path())
+        self._local = threading.local()
+        with self.connection() as connection:
+            connection.executescript(SCHEMA)
+            self._migrate(connection)
+
+    @staticmethod
+    def _migrate(connection) -> None:
+        """Agregar a una base existente lo que el esquema incorporó después (como database/migrations)."""
+        columns = {row["name"] for row in connection.execute("pragma table_info(partidas)")}
+        if "client_id" not in columns:
+            connection.execute("alter table partidas add column client_id text")
+        connection.execute("create unique index if not exists partidas_client_id_idx on partidas (client_id)")
+
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0)
+            connection.row_factory = sqlite3.Row
+            connection.execute("pragma journal_mode = wal")
+            connection.execute("pragma foreign_keys = on")
+            self._local.connection = connection
+        return connection
+
+    def table(self, table_name: str) -> SQLiteQuery:
+        return SQLiteQuery(self, table_name)
+
+    def from_(self, table_name: str) -> SQLiteQuery:
+        return self.table(table_name)
+
+    def rpc(self, fn: str, params: dict) -> SQLiteRPC:
+        return SQLiteRPC(self, fn, params)
+
+
+def import_words(client: SQLiteClient, language_name: str, path: str) -> int:
+    """Cargar en 'palabras' las palabras de un archivo de texto (una por línea)."""
+    connection = client.connection()
+    row = connection.execute("select id from idiomas where idioma = ?", (language_name,)).fetchone()
+    if row is None:
+        raise ValueError(f"Idioma '{language_name}' no encontrado en la tabla 'idiomas'.")
+
+    with open(path, encoding="utf-8") as f:
+        words = {line.strip().lower() for line in f if line.strip()}
+
+    # Sin índice único (como en Supabase): las repetidas se descartan en la consulta
+    with connection:
+        cursor = connection.executemany(
+            "insert into palabras (palabra, idioma_id) select ?1, ?2 "
+            "where not exists (select 1 from palabras where palabra = ?1 and idioma_id = ?2)",
+            [(word, row["id"]) for word in sorted(words)])
+    return cursor.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Base de datos local SQLite de Wordle")
+    parser.add_argument("--path", help="Archivo de la base (por defecto WORDLE_SQLITE_PATH o ~/.wordle/wordle.db)")
+    parser.add_argument("--import-words", nargs=2, metavar=("IDIOMA", "ARCHIVO"))
+    args = parser.parse_args()
+
+    client = SQLiteClient(args.path)
+    if args.import_words:
+        count = import_words(client, *args.import_words)
+        print(f"{count} palabras importadas en {client.path}")
+    else:
+        print(f"Base de datos lista en {client.path}")
+
+
+if __name__ == "__main__":
+    main()
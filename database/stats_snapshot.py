@@ -0,0 +1,141 @@
+import json
+import os
+
+from database.local_storage import get_backend_dir
+from engine.statistics import StatsAggregate
+
+
+def _snapshot_path(user_id: int):
+    return get_backend_dir("stats") / f"usuario_{user_id}.json"
+
+
+def load_user_snapshot(user_id: int) -> dict:
+    """Leer la copia local de las partidas de un usuario.
+
+    Devuelve ``{"last_id": ..., "games": [...]}``; ``last_id`` es el mayor id
+    de 'partidas' ya incorporado (None si todavía no hay copia).
+    """
+    try:
+        with open(_snapshot_path(user_id), encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if "games" in snapshot and "last_id" in snapshot:
+            return snapshot
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Error al leer la copia local de estadísticas: {e}")
+
+    return {"last_id": None, "games": []}
+
+
+def save_user_snapshot(user_id: int, snapshot: dict) -> None:
+    """Guardar de forma atómica la copia local de las partidas de un usuario."""
+    path = _snapshot_path(user_id)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error al guardar la copia local de estadísticas: {e}")
+
+
+def _aggregate_path(user_id: int):
+    return get_backend_dir("stats") / f"usuario_{user_id}_resumen.json"
+
+
+def load_user_aggregate(user_id: int) -> StatsAggregate:
+    """Leer el agregado de estadísticas guardado junto a la copia local del usuario."""
+    try:
+        with open(_aggregate_path(user_id), encoding="utf-8") as f:
+            return StatsAggregate.from_dict(json.load(f))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Error al leer el resumen local de estadísticas: {e}")
+
+    return StatsAggregate()
+
+
+def save_user_aggregate(user_id: int, aggregate: StatsAggregate) -> None:
+    """Guardar de forma atómica el agregado de estadísticas del usuario."""
+    path = _aggregate_path(user_id)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(aggregate.to_dict(), f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error al guardar el resumen local de estadísticas: {e}")
+
+
+def record_game_stats(user_id: int, win: bool, attempts: int, time_taken: float, language: str,
+                      client_id: str = None) -> StatsAggregate:
+    """Sumar una partida terminada al agregado local del usuario.
+
+    ``client_id`` es el de la bandeja de salida; con él la partida no se
+    vuelve a contar cuando llegue en la copia sincronizada.
+    """
+    aggregate = load_user_aggregate(user_id)
+    aggregate.add_game(win, attempts, time_taken, language)
+    if client_id:
+        aggregate.pending_client_ids.add(client_id)
+    save_user_aggregate(user_id, aggregate)
+    return aggregate
+
+
+def reconcile_user_aggregate(user_id: int, aggregate: StatsAggregate, snapshot: dict) -> StatsAggregate:
+    """Poner el agregado al día con la copia sincronizada de partidas del usuario.
+
+    El agregado recuerda el último id de 'partidas' que contó y los
+    'client_id' de las partidas que sumó al terminarlas en este equipo. Solo
+    se recorren las partidas de la copia con id mayor: las que ya se contaron
+    aquí se reconocen por su 'client_id' y las demás (p. ej. de otro equipo)
+    se suman, así el costo depende de las partidas nuevas y no del historial.
+    Si la copia y el agregado no cuadran (copia anterior sin ids, agregado de
+    otra base o de una versión anterior) se reconstruye todo.
+    """
+    games = snapshot["games"]
+    if snapshot["last_id"] == aggregate.last_id:
+        return aggregate
+
+    new_games = []
+    consistent = aggregate.last_id is None or (snapshot["last_id"] or 0) > aggregate.last_id
+    for game in reversed(games):
+        if not consistent:
+            break
+        if game.get("id") is None:
+            consistent = False
+        elif aggregate.last_id is not None and game["id"] <= aggregate.last_id:
+            break
+        else:
+            new_games.append(game)
+
+    if consistent:
+        for game in reversed(new_games):
+            client_id = game.get("client_id")
+            if client_id in aggregate.pending_client_ids:
+                aggregate.pending_client_ids.discard(client_id)
+            else:
+                aggregate.add_game(game.get("win", False), game.get("attempts", 0), game.get("time_taken", 0),
+                                   game.get("language", ""))
+        aggregate.last_id = snapshot["last_id"]
+        # Cada partida contada está en la copia o todavía pendiente de llegar a ella
+        consistent = aggregate.total_games == len(games) + len(aggregate.pending_client_ids)
+
+    if not consistent:
+        aggregate = _rebuild_user_aggregate(user_id, snapshot)
+
+    save_user_aggregate(user_id, aggregate)
+    return aggregate
+
+
+def _rebuild_user_aggregate(user_id: int, snapshot: dict) -> StatsAggregate:
+    """Reconstruir el agregado desde la copia más las partidas del usuario que siguen en la bandeja de salida."""
+    from database.outbox import get_game_outbox
+
+    pending = get_game_outbox().pending_games(user_id)
+    aggregate = StatsAggregate.from_games(snapshot["games"] + pending)
+    aggregate.last_id = snapshot["last_id"]
+    aggregate.pending_client_ids = {game["client_id"] for game in pending if game.get("client_id")}
+    return aggregate
@@ -1,29 +1,185 @@
 import os
 import hashlib
 import hmac
-from supabase import create_client, Client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from database.stats_snapshot import load_user_snapshot, save_user_snapshot
+from database.word_cache import load_cached_words, save_cached_words
+from engine.statistics import summarize_statistics
+
+# supabase, postgrest y httpx tardan en importarse (~0.5s): se cargan al crear el
+# cliente, que main hace en segundo plano mientras se muestra la ventana de login
+if TYPE_CHECKING:
+    from supabase import Client
 
 # Instancia global de Supabase
 _supabase_client = None
+_supabase_client_lock = threading.Lock()
+
+# Segundos que se conservan en memoria las tablas de referencia (idiomas, ids de palabras)
+REFERENCE_CACHE_TTL = 600
+
+
+class _ReferenceCache:
+    """Caché en memoria, compartida por todo el proceso, con expiración por entrada."""
+
+    def __init__(self, ttl: float, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, table: str, key):
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if self.clock() >= expires_at:
+                del self._entries[(table, key)]
+                return None
+            return value
+
+    def set(self, table: str, key, value) -> None:
+        with self._lock:
+            self._entries[(table, key)] = (value, self.clock() + self.ttl)
+
+    def invalidate(self, table: str = None) -> None:
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+            else:
+                for entry_key in [k for k in self._entries if k[0] == table]:
+                    del self._entries[entry_key]
+
+
+_reference_cache = _ReferenceCache(REFERENCE_CACHE_TTL)
+
+
+def invalidate_reference_cache(table: str = None) -> None:
+    """Descartar la caché de tablas de referencia (toda, o solo la de ``table``)."""
+    _reference_cache.invalidate(table)
+
+
+# Ajustes de HTTP por defecto (se pueden cambiar con variables de entorno o en initialize_supabase)
+HTTP_MAX_CONNECTIONS = 10
+# Segundos que una conexión ociosa sigue abierta; el valor por defecto de httpx (5s)
+# obliga a repetir el handshake TLS tras cualquier pausa corta en la interfaz
+HTTP_KEEPALIVE_EXPIRY = 60.0
+HTTP_TIMEOUT = 10.0
+HTTP_CONNECT_TIMEOUT = 5.0
+
+
+def _env_number(name: str, default, cast=float):
+    value = os.getenv(name)
+    return cast(value) if value else default
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_settings(max_connections: int = None, keepalive_expiry: float = None, http2: bool = None,
+                      timeout: float = None, connect_timeout: float = None) -> dict:
+    """Resolver los ajustes de HTTP: argumento, variable de entorno o valor por defecto.
+
+    Variables: SUPABASE_MAX_CONNECTIONS, SUPABASE_KEEPALIVE_EXPIRY, SUPABASE_HTTP2,
+    SUPABASE_TIMEOUT y SUPABASE_CONNECT_TIMEOUT. HTTP/2 (varias consultas en
+    paralelo sobre una sola conexión) requiere el paquete opcional 'h2'.
+    """
+    import httpx
+
+    if http2 is None:
+        http2 = os.getenv("SUPABASE_HTTP2", "auto").lower()
+        http2 = _h2_available() if http2 == "auto" else http2 in ("1", "true", "yes")
+    if http2 and not _h2_available():
+        print("HTTP/2 requiere el paquete 'h2' (pip install httpx[http2]); se usa HTTP/1.1")
+        http2 = False
+
+    max_connections = max_connections or _env_number("SUPABASE_MAX_CONNECTIONS", HTTP_MAX_CONNECTIONS, int)
+    return {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry or _env_number("SUPABASE_KEEPALIVE_EXPIRY", HTTP_KEEPALIVE_EXPIRY),
+        ),
+        "timeout": httpx.Timeout(
+            timeout or _env_number("SUPABASE_TIMEOUT", HTTP_TIMEOUT),
+            connect=connect_timeout or _env_number("SUPABASE_CONNECT_TIMEOUT", HTTP_CONNECT_TIMEOUT),
+        ),
+        "http2": http2,
+    }
+
+
+def _configure_postgrest_session(client: "Client", http_settings: dict) -> None:
+    """Reemplazar la sesión HTTP de PostgREST por una con el grupo de conexiones configurado."""
+    from postgrest.utils import SyncClient
+
+    session = client.postgrest.session
+    client.postgrest.session = SyncClient(base_url=session.base_url, headers=session.headers, **http_settings)
+    session.close()
+
+
+def _warm_up() -> None:
+    """Abrir la conexión (DNS, TCP, TLS) antes del primer inicio de sesión.
+
+    Usa la consulta de 'idiomas', que de todos modos queda en caché para después.
+    """
+    try:
+        _get_idiomas()
+    except Exception as e:
+        print(f"No se pudo precalentar la conexión con Supabase: {e}")
+
+
+def get_backend_name() -> str:
+    """Backend de datos elegido con WORDLE_BACKEND: 'supabase' (por defecto) o 'sqlite'."""
+    return os.getenv("WORDLE_BACKEND", "supabase").lower()
+
 
+def initialize_supabase(max_connections: int = None, keepalive_expiry: float = None, http2: bool = None,
+                        timeout: float = None, warm_up: bool = True) -> "Client":
+    """Inicializar y Devolver Supabase Client
 
-def initialize_supabase() -> Client:
-    """Inicializar y Devolver Supabase Client"""
+    Con WORDLE_BACKEND=sqlite devuelve un cliente local con la misma
+    interfaz (ver database/sqlite_backend.py).
+    """
     global _supabase_client
 
-    if _supabase_client is None:
+    # Las consultas llegan desde varios hilos del ejecutor de E/S: crear un solo cliente
+    with _supabase_client_lock:
+        if _supabase_client is not None:
+            return _supabase_client
+
+        if get_backend_name() == "sqlite":
+            from database.sqlite_backend import SQLiteClient
+            _supabase_client = SQLiteClient()
+            return _supabase_client
+
         supabase_url = os.getenv("SUPABASE_URL")
         supabase_key = os.getenv("SUPABASE_KEY")
 
         if not supabase_url or not supabase_key:
             raise ValueError("Supabase URL and key must be set in .env file")
 
-        _supabase_client = create_client(supabase_url, supabase_key)
+        from supabase import create_client
+        client = create_client(supabase_url, supabase_key)
+        _configure_postgrest_session(client, get_http_settings(max_connections, keepalive_expiry, http2, timeout))
+        _supabase_client = client
 
-    return _supabase_client
+    if warm_up:
+        _warm_up()
 
+    return client
 
-def get_supabase_client() -> Client:
+
+def get_supabase_client() -> "Client":
     """Obtener el cliente Supabase inicializado."""
     global _supabase_client
 
@@ -101,12 +257,15 @@ def sign_out() -> None:
     pass
 
 
+# Columnas del usuario junto con el tipo de usuario embebido (una sola consulta)
+USUARIO_CON_TIPO = "id, nombre_usuario, contrasena, email, tipo_usuario_id, tipo_usuario(es_administrador)"
+
+
 def sign_in(username: str, password: str) -> dict:
     """Iniciar sesión de un usuario existente."""
     client = get_supabase_client()
 
-    user_result = client.table("usuarios").select("id, nombre_usuario, contrasena, email, tipo_usuario_id").eq(
-        "nombre_usuario", username).execute()
+    user_result = client.table("usuarios").select(USUARIO_CON_TIPO).eq("nombre_usuario", username).execute()
 
     if not user_result.data or len(user_result.data) == 0:
         raise ValueError("Nombre de usuario o contraseña invalidos")
@@ -117,17 +276,8 @@ def sign_in(username: str, password: str) -> dict:
     if not verify_password(password, user_data["contrasena"]):
         raise ValueError("Nombre de usuario o contraseña invalidos")
 
-    # Obtener el tipo de usuario
-    tipo_usuario_id = user_data.get("tipo_usuario_id")
-    is_admin_status = False
-    if tipo_usuario_id:
-        tipo_usuario_result = client.table("tipo_usuario").select("es_administrador").eq("id",
-                                                                                         tipo_usuario_id).execute()
-        if tipo_usuario_result.data and len(tipo_usuario_result.data) > 0:
-            is_admin_status = tipo_usuario_result.data[0].get("es_administrador", False)
-
     # Agregar el estado de administrador al usuario
-    user_data['is_admin'] = is_admin_status
+    user_data['is_admin'] = _pop_es_administrador(user_data)
 
     return user_data
 
@@ -146,78 +296,115 @@ def get_user_profile(user_id: int) -> dict:
 def is_admin(user_id: int) -> bool:
     """Verificar si un usuario es administrador."""
     client = get_supabase_client()
-    user_profile = get_user_profile(user_id)
+    result = client.table("usuarios").select("id, tipo_usuario(es_administrador)").eq("id", user_id).execute()
 
-    tipo_usuario_id = user_profile.get("tipo_usuario_id")
-    if tipo_usuario_id is None:
-        return False
+    if not result.data or len(result.data) == 0:
+        raise ValueError("Usuario no encontrado")
 
-    tipo_usuario_result = client.table("tipo_usuario").select("es_administrador").eq("id", tipo_usuario_id).execute()
+    return _pop_es_administrador(result.data[0])
 
-    if tipo_usuario_result.data and len(tipo_usuario_result.data) > 0:
-        return tipo_usuario_result.data[0].get("es_administrador", False)
 
-    return False
+def _pop_es_administrador(user_row: dict) -> bool:
+    """Extraer 'es_administrador' del tipo de usuario embebido en la fila de 'usuarios'."""
+    tipo_usuario = user_row.pop("tipo_usuario", None) or {}
+    return bool(tipo_usuario.get("es_administrador", False))
 
 
-def _get_idioma_id(language_name: str) -> int:
+def _get_idiomas() -> dict:
+    """Obtener la tabla 'idiomas' completa como {id: idioma} (en caché)."""
+    idiomas = _reference_cache.get("idiomas", "all")
+    if idiomas is not None:
+        return idiomas
+
     client = get_supabase_client()
-    result = client.table("idiomas").select("id").eq("idioma", language_name).execute()
-    if not result.data or len(result.data) == 0:
-        raise ValueError(f"Idioma '{language_name}' no encontrado en la tabla 'idiomas'.")
-    return result.data[0]['id']
+    result = client.table("idiomas").select("id, idioma").execute()
+    idiomas = {idioma["id"]: idioma["idioma"] for idioma in (result.data or [])}
+
+    if idiomas:
+        _reference_cache.set("idiomas", "all", idiomas)
+    return idiomas
+
+
+def _get_idioma_id(language_name: str) -> int:
+    for idioma_id, idioma in _get_idiomas().items():
+        if idioma == language_name:
+            return idioma_id
+    raise ValueError(f"Idioma '{language_name}' no encontrado en la tabla 'idiomas'.")
+
+
+def _cache_palabra_ids(rows, idioma_id: int) -> None:
+    """Registrar en caché los ids de palabras ya descargadas de un idioma."""
+    for row in rows:
+        _reference_cache.set("palabras", (row["palabra"].lower(), idioma_id), row["id"])
 
 
 def _get_palabra_id(word_text: str, idioma_id: int) -> int:
+    cached = _reference_cache.get("palabras", (word_text.lower(), idioma_id))
+    if cached is not None:
+        return cached
+
     client = get_supabase_client()
     result = client.table("palabras").select("id").eq("palabra", word_text.lower()).eq("idioma_id", idioma_id).execute()
     if not result.data or len(result.data) == 0:
         raise ValueError(f"Palabra '{word_text}' no encontrada para el idioma ID {idioma_id} en la tabla 'palabras'.")
-    return result.data[0]['id']
+
+    palabra_id = result.data[0]['id']
+    _reference_cache.set("palabras", (word_text.lower(), idioma_id), palabra_id)
+    return palabra_id
+
+
+def _build_partida_row(user_id: int, word: str, language: str, attempts: int, time_taken: float, win: bool,
+                       hints_used: int) -> dict:
+    """Armar la fila de 'partidas' de un resultado, resolviendo (o creando) el id de la palabra."""
+    if not user_id or not word or not language:
+        raise ValueError("Faltan parámetros")
+
+    client = get_supabase_client()
+    if not client:
+        raise ConnectionError("Error al Inicializar el Cliente de Supabase")
+
+    idioma_id = _get_idioma_id(language)
+    if not idioma_id:
+        raise ValueError(f"Idioma '{language}' no encontrado en la tabla 'idiomas'.")
+
+    palabra_id = _get_palabra_id(word, idioma_id)
+    if not palabra_id:
+        try:
+            result = client.table("palabras").insert({
+                "palabra": word.lower(),
+                "idioma_id": idioma_id
+            }).execute()
+
+            if not result.data:
+                raise Exception("Error al insertar la palabra en la tabla 'palabras'")
+
+            palabra_id = result.data[0]["id"]
+            _cache_palabra_ids(result.data, idioma_id)
+        except Exception as e:
+            print(f"Error al insertar la palabra en la tabla 'palabras': {str(e)}")
+
+            palabra_id = _get_palabra_id(word, idioma_id)
+            if not palabra_id:
+                raise Exception("Error al obtener o crear la palabra en la base de datos")
+
+    return {
+        "usuario_id": user_id,
+        "palabra_id": palabra_id,
+        "adivinada": win,
+        "intentos": attempts,
+        "time_taken": time_taken,
+        "hints_used": hints_used
+    }
 
 
 def save_game_result(user_id: int, word: str, language: str, attempts: int, time_taken: float, win: bool,
                      hints_used: int):
     """Guardar el resultado del juego en la tabla 'partidas'"""
     try:
-        if not user_id or not word or not language:
-            raise ValueError("Faltan parámetros")
-
         client = get_supabase_client()
-        if not client:
-            raise Exception("Error al Inicializar el Cliente de Supabase")
-
-        idioma_id = _get_idioma_id(language)
-        if not idioma_id:
-            raise ValueError(f"Idioma '{language}' no encontrado en la tabla 'idiomas'.")
-
-        palabra_id = _get_palabra_id(word, idioma_id)
-        if not palabra_id:
-            try:
-                result = client.table("palabras").insert({
-                    "palabra": word.lower(),
-                    "idioma_id": idioma_id
-                }).execute()
-
-                if not result.data:
-                    raise Exception("Error al insertar la palabra en la tabla 'palabras'")
-
-                palabra_id = result.data[0]["id"]
-            except Exception as e:
-                print(f"Error al insertar la palabra en la tabla 'palabras': {str(e)}")
-
-                palabra_id = _get_palabra_id(word, idioma_id)
-                if not palabra_id:
-                    raise Exception("Error al obtener o crear la palabra en la base de datos")
-
-        result = client.table("partidas").insert({
-            "usuario_id": user_id,
-            "palabra_id": palabra_id,
-            "adivinada": win,
-            "intentos": attempts,
-            "time_taken": time_taken,
-            "hints_used": hints_used
-        }).execute()
+        row = _build_partida_row(user_id, word, language, attempts, time_taken, win, hints_used)
+
+        result = client.table("partidas").insert(row).execute()
 
         if not result.data or len(result.data) == 0:
             raise ValueError("Error al guardar el resultado del juego en la tabla 'partidas'")
@@ -229,197 +416,320 @@ def save_game_result(user_id: int, word: str, language: str, attempts: int, time
         raise
 
 
-def get_user_statistics(user_id: int) -> list:
-    """Obtener estadísticas para un usuario específico de la tabla 'partidas'"""
+def save_game_results(rows: list) -> list:
+    """Insertar varias filas ya armadas en 'partidas' con un único request.
+
+    Si las filas traen 'client_id' (database/migrations/002_partidas_client_id.sql)
+    se envían como upsert sobre esa columna: reenviar un lote ya guardado
+    actualiza las mismas filas en lugar de duplicarlas.
+    """
+    if not rows:
+        return []
+
     client = get_supabase_client()
+    if all(row.get("client_id") for row in rows):
+        result = client.table("partidas").upsert(rows, on_conflict="client_id").execute()
+    else:
+        result = client.table("partidas").insert(rows).execute()
 
-    try:
-        result = client.table("partidas").select("*").eq("usuario_id", user_id).execute()
-        partidas = result.data if result.data else []
+    if not result.data or len(result.data) != len(rows):
+        raise ValueError("Error al guardar los resultados de los juegos en la tabla 'partidas'")
 
-        if not partidas:
-            return []
+    return result.data
 
-        palabra_ids = [partida["palabra_id"] for partida in partidas]
 
-        palabras_result = client.table("palabras").select("id, palabra, idioma_id").in_("id", palabra_ids).execute()
-        palabras = palabras_result.data if palabras_result.data else []
+# Partidas por página al recorrer 'partidas' (por debajo del límite de filas de PostgREST)
+STATISTICS_PAGE_SIZE = 500
 
-        if not palabras:
-            return []
 
-        palabra_map = {palabra["id"]: palabra for palabra in palabras}
+def _format_partida(partida: dict, palabra_map: dict, idioma_map: dict) -> dict:
+    """Convertir una fila de 'partidas' al formato que usan las ventanas de estadísticas."""
+    palabra_info = palabra_map.get(partida["palabra_id"], {})
+    idioma_name = idioma_map.get(palabra_info.get("idioma_id"), "Unknown")
 
-        idioma_ids = list(set(palabra["idioma_id"] for palabra in palabras))
+    return {
+        "id": partida.get("id"),
+        # Solo en las consultas por usuario (lo usa el agregado para no contar dos veces una partida local)
+        "client_id": partida.get("client_id"),
+        "created_at": partida.get("created_at", ""),
+        "word": palabra_info.get("palabra", ""),
+        "language": "spanish" if idioma_name and idioma_name.lower() in ["español", "spanish"] else "english",
+        "attempts": partida.get("intentos", 0),
+        "time_taken": partida.get("time_taken", 0),
+        "win": partida.get("adivinada", False),
+        "hints_used": partida.get("hints_used", 0)
+    }
 
-        idiomas_result = client.table("idiomas").select("id, idioma").in_("id", idioma_ids).execute()
-        idiomas = idiomas_result.data if idiomas_result.data else []
 
-        if not idiomas:
-            return []
+def get_user_statistics(user_id: int) -> list:
+    """Obtener estadísticas para un usuario específico de la tabla 'partidas'"""
+    return sync_user_snapshot(user_id)["games"]
 
-        idioma_map = {idioma["id"]: idioma["idioma"] for idioma in idiomas}
 
-        formatted_data = []
-        for partida in partidas:
-            palabra_id = partida["palabra_id"]
-            palabra_info = palabra_map.get(palabra_id, {})
-            idioma_id = palabra_info.get("idioma_id")
-            idioma_name = idioma_map.get(idioma_id, "Unknown")
-
-            formatted_data.append({
-                "created_at": partida.get("created_at", ""),
-                "word": palabra_info.get("palabra", ""),
-                "language": "spanish" if idioma_name and idioma_name.lower() in ["español", "spanish"] else "english",
-                "attempts": partida.get("intentos", 0),
-                "time_taken": partida.get("time_taken", 0),
-                "win": partida.get("adivinada", False),
-                "hints_used": partida.get("hints_used", 0)
-            })
-        return formatted_data
+def sync_user_snapshot(user_id: int) -> dict:
+    """Poner al día y devolver la copia local de las partidas de un usuario.
+
+    Mantiene una copia local de las partidas ya enriquecidas y solo descarga
+    las filas con 'id' mayor al último visto. Se usa el id y no 'created_at'
+    como cursor porque las partidas enviadas desde la bandeja de salida
+    pueden llegar con una fecha anterior a la última vista. Devuelve
+    ``{"last_id": ..., "games": [...]}`` como ``load_user_snapshot``.
+    """
+    snapshot = load_user_snapshot(user_id)
+
+    try:
+        client = get_supabase_client()
+        new_games = []
+        last_id = snapshot["last_id"]
+        for partidas in _iter_user_partidas(user_id, last_id):
+            palabra_ids = list(set(partida["palabra_id"] for partida in partidas))
+            palabras_result = client.table("palabras").select("id, palabra, idioma_id").in_("id", palabra_ids).execute()
+            palabra_map = {palabra["id"]: palabra for palabra in (palabras_result.data or [])}
+            idioma_map = _get_idiomas()
+
+            new_games.extend(_format_partida(partida, palabra_map, idioma_map) for partida in partidas)
+            last_id = partidas[-1]["id"]
+
+        # El cursor avanza junto con las partidas: si una página falla, la copia sigue coherente
+        if new_games:
+            snapshot["games"].extend(new_games)
+            snapshot["last_id"] = last_id
+            save_user_snapshot(user_id, snapshot)
+
+        return snapshot
     except Exception as e:
         print(f"Error al obtener las estadísticas del usuario: {e}")
-        return []
+        return snapshot
 
 
-def get_all_statistics() -> list:
-    """Obtener estadísticas para todos los usuarios (solo administrador) de la tabla 'partidas'"""
+def _iter_user_partidas(user_id: int, after_id=None, page_size: int = STATISTICS_PAGE_SIZE):
+    """Recorrer por páginas las partidas de un usuario con id mayor a ``after_id``."""
     client = get_supabase_client()
 
-    try:
-        result = client.table("partidas").select("*").execute()
+    while True:
+        query = client.table("partidas").select(
+            "id, created_at, palabra_id, adivinada, intentos, time_taken, hints_used, client_id").eq(
+            "usuario_id", user_id)
+        if after_id is not None:
+            query = query.gt("id", after_id)
+        result = query.order("id").limit(page_size).execute()
+        partidas = result.data if result.data else []
+
+        if not partidas:
+            return
+
+        yield partidas
+        after_id = partidas[-1]["id"]
+
+        if len(partidas) < page_size:
+            return
+
+
+def iter_all_statistics(page_size: int = STATISTICS_PAGE_SIZE):
+    """Recorrer las partidas de todos los usuarios en bloques de a lo sumo ``page_size`` filas.
+
+    Pagina por 'id' (keyset), así que cada bloque es una consulta acotada sin
+    importar el tamaño de la tabla, y resuelve usuarios y palabras solo para
+    las partidas del bloque. Genera listas de partidas ya enriquecidas.
+    """
+    client = get_supabase_client()
+    idioma_map = _get_idiomas()
+    last_id = None
+
+    while True:
+        query = client.table("partidas").select(
+            "id, created_at, usuario_id, palabra_id, adivinada, intentos, time_taken, hints_used")
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        result = query.order("id").limit(page_size).execute()
         partidas = result.data if result.data else []
 
         if not partidas:
-            return []
+            return
+
+        last_id = partidas[-1]["id"]
 
         user_ids = list(set(partida["usuario_id"] for partida in partidas))
         palabra_ids = list(set(partida["palabra_id"] for partida in partidas))
 
         users_result = client.table("usuarios").select("id, nombre_usuario").in_("id", user_ids).execute()
-        users = users_result.data if users_result.data else []
-
-        user_map = {user["id"]: user["nombre_usuario"] for user in users}
+        user_map = {user["id"]: user["nombre_usuario"] for user in (users_result.data or [])}
 
         palabras_result = client.table("palabras").select("id, palabra, idioma_id").in_("id", palabra_ids).execute()
-        palabras = palabras_result.data if palabras_result.data else []
-
-        palabra_map = {palabra["id"]: palabra for palabra in palabras}
+        palabra_map = {palabra["id"]: palabra for palabra in (palabras_result.data or [])}
 
-        idioma_ids = list(set(palabra["idioma_id"] for palabra in palabras))
+        chunk = []
+        for partida in partidas:
+            game = _format_partida(partida, palabra_map, idioma_map)
+            chunk.append({"username": user_map.get(partida["usuario_id"], "Unknown"), **game})
+        yield chunk
 
-        idiomas_result = client.table("idiomas").select("id, idioma").in_("id", idioma_ids).execute()
-        idiomas = idiomas_result.data if idiomas_result.data else []
+        if len(partidas) < page_size:
+            return
 
-        idioma_map = {idioma["id"]: idioma["idioma"] for idioma in idiomas}
 
+def get_all_statistics() -> list:
+    """Obtener estadísticas para todos los usuarios (solo administrador) de la tabla 'partidas'"""
+    try:
         formatted_data = []
-        for partida in partidas:
-            user_id = partida["usuario_id"]
-            palabra_id = partida["palabra_id"]
-
-            username = user_map.get(user_id, "Unknown")
-            palabra_info = palabra_map.get(palabra_id, {})
-            idioma_id = palabra_info.get("idioma_id")
-            idioma_name = idioma_map.get(idioma_id, "Unknown")
-
-            formatted_data.append({
-                "username": username,
-                "created_at": partida.get("created_at", ""),
-                "word": palabra_info.get("palabra", ""),
-                "language": "spanish" if idioma_name and idioma_name.lower() in ["español", "spanish"] else "english",
-                "attempts": partida.get("intentos", 0),
-                "time_taken": partida.get("time_taken", 0),
-                "win": partida.get("adivinada", False),
-                "hints_used": partida.get("hints_used", 0)
-            })
+        for chunk in iter_all_statistics():
+            formatted_data.extend(chunk)
         return formatted_data
     except Exception as e:
         print(f"Error al obtener las estadísticas de todos los usuarios: {e}")
         return []
 
 
+def get_statistics_summary(user_id: int = None):
+    """Obtener el resumen de estadísticas (de un usuario, o de todos) calculado en el servidor.
+
+    Usa la función 'estadisticas_resumen' de database/migrations/001_estadisticas.sql.
+    Devuelve None si no está disponible, para que la interfaz calcule el resumen localmente.
+    """
+    client = get_supabase_client()
+
+    try:
+        result = client.rpc("estadisticas_resumen", {"p_usuario_id": user_id}).execute()
+        if not result.data:
+            raise ValueError("La función 'estadisticas_resumen' no devolvió datos")
+
+        row = result.data[0]
+        return summarize_statistics(row["total_games"], row["wins"], row["english_games"], row["spanish_games"],
+                                    row["total_time"], row["total_attempts"])
+    except Exception as e:
+        print(f"Error al obtener el resumen de estadísticas: {e}")
+        return None
+
+
 def get_language_distribution() -> list:
-    """Obtener estadísticas de distribución de idiomas de la tabla 'partidas', uniendo con 'palabras' y 'idiomas'."""
+    """Obtener la cantidad de partidas por idioma desde la vista 'distribucion_idiomas'."""
     client = get_supabase_client()
 
     try:
-        result = client.table("partidas").select("palabra_id").execute()
-        partidas = result.data
+        result = client.table("distribucion_idiomas").select("language_name, game_count").execute()
+        return result.data if result.data else []
+    except Exception as e:
+        print(f"Error al obtener las estadísticas de distribución de idiomas: {e}")
+        return []
 
-        if not partidas:
-            return []
 
-        palabra_ids = [partida["palabra_id"] for partida in partidas]
+def _get_words_version(idioma_id: int) -> list:
+    """Marcador barato de versión de la lista de palabras: cantidad de filas e id máximo."""
+    client = get_supabase_client()
+    result = client.table("palabras").select("id", count="exact").eq("idioma_id", idioma_id).order(
+        "id", desc=True).limit(1).execute()
+    max_id = result.data[0]["id"] if result.data else 0
+    return [result.count or 0, max_id]
 
-        palabras_result = client.table("palabras").select("id, idioma_id").in_("id", palabra_ids).execute()
-        palabras = palabras_result.data
 
-        if not palabras:
-            return []
+# Listas de respaldo cuando no se pueden obtener las palabras de la base
+DEFAULT_WORDS = {
+    "english": ["HELLO", "WORLD", "PYTHON", "JAZZY", "QUICK"],
+    "spanish": ["HOLA", "MUNDO", "PYTHON", "JAZZ", "RAPID"],
+}
 
-        language_distribution = {}
 
-        for palabra in palabras:
-            idioma_id = palabra["idioma_id"]
-            if idioma_id not in language_distribution:
-                language_distribution[idioma_id] = 1
-            else:
-                language_distribution[idioma_id] += 1
+# Idiomas con una revalidación de la caché de palabras en curso
+_word_revalidations = set()
+_word_revalidations_lock = threading.Lock()
+# Hilo propio para revalidar (la capa de datos no depende del ejecutor de la interfaz)
+_word_revalidation_executor = None
 
-        idiomas_result = client.table("idiomas").select("id, idioma").in_("id",
-                                                                          list(language_distribution.keys())).execute()
-        idiomas = idiomas_result.data
 
-        if not idiomas:
-            return []
+def _get_word_rows(language_name: str) -> list:
+    """Obtener las filas (id, palabra) de un idioma.
 
-        language_distribution_list = []
+    Si hay caché local se devuelve de inmediato y su versión se comprueba en
+    un hilo aparte; si la lista cambió, la copia nueva queda guardada
+    para la próxima partida. Solo sin caché se espera a la base.
+    """
+    cached_version, cached_rows = load_cached_words(language_name)
+    if cached_rows:
+        _revalidate_word_rows_later(language_name, cached_version, cached_rows)
+        return cached_rows
 
-        for idioma in idiomas:
-            idioma_id = idioma["id"]
-            idioma_name = idioma["idioma"]
-            game_count = language_distribution[idioma_id]
-            language_distribution_list.append({
-                "language_name": idioma_name,
-                "game_count": game_count
-            })
+    return _refresh_word_rows(language_name)
 
-        return language_distribution_list
-    except Exception as e:
-        print(f"Error al obtener las estadísticas de distribución de idiomas: {e}")
-        return []
+
+def _refresh_word_rows(language_name: str, cached_version=None, cached_rows=None) -> list:
+    """Comparar la versión de la caché con la de la base y descargar la lista si cambió."""
+    idioma_id = _get_idioma_id(language_name)
+    version = _get_words_version(idioma_id)
+
+    if cached_rows and cached_version == version:
+        _cache_palabra_ids(cached_rows, idioma_id)
+        return cached_rows
+
+    client = get_supabase_client()
+    result = client.table("palabras").select("id, palabra").eq("idioma_id", idioma_id).execute()
+    rows = result.data if result.data else []
+    if rows:
+        save_cached_words(language_name, version, rows)
+        _cache_palabra_ids(rows, idioma_id)
+    return rows
+
+
+def _revalidate_word_rows_later(language_name: str, cached_version, cached_rows):
+    """Encolar la revalidación de la caché de un idioma (una sola a la vez por idioma).
+
+    Devuelve el ``Future`` de la revalidación, o None si ya había una en curso.
+    """
+    global _word_revalidation_executor
+
+    with _word_revalidations_lock:
+        if language_name in _word_revalidations:
+            return
+        _word_revalidations.add(language_name)
+        if _word_revalidation_executor is None:
+            _word_revalidation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WordCacheRevalidation")
+
+    def revalidate():
+        try:
+            _refresh_word_rows(language_name, cached_version, cached_rows)
+        except Exception as e:
+            print(f"No se pudo validar la caché de palabras, se sigue usando la copia local: {str(e)}")
+        finally:
+            with _word_revalidations_lock:
+                _word_revalidations.discard(language_name)
+
+    return _word_revalidation_executor.submit(revalidate)
+
+
+def normalize_word_rows(rows: list, word_length: int = 5) -> list:
+    """Palabras en mayúsculas de la longitud pedida (o todas, si ninguna la tiene)."""
+    words = [item["palabra"].upper() for item in rows if len(item["palabra"]) == word_length]
+
+    if not words and rows:
+        words = [item["palabra"].upper() for item in rows]
+
+    return words
 
 
 def get_words_for_game(language_name: str, word_length: int = 5):
     """Obtener todas las palabras para un idioma específico de la tabla 'palabras'"""
     try:
-        client = get_supabase_client()
-        if not client:
-            raise Exception("Error al Inicializar el Cliente de Supabase")
+        rows = _get_word_rows(language_name)
 
-        idioma_id = _get_idioma_id(language_name)
-        if not idioma_id:
-            raise ValueError(f"Idioma Invalido: {language_name}")
-
-        result = client.table("palabras").select("palabra").eq("idioma_id", idioma_id).execute()
-
-        if not result.data:
+        if not rows:
             raise Exception("No data returned from database")
 
-        words = [item["palabra"].upper() for item in result.data if len(item["palabra"]) == word_length]
-
-        if not words and result.data:
-            words = [item["palabra"].upper() for item in result.data]
+        words = normalize_word_rows(rows, word_length)
 
         if not words:
-            default_words = ["HELLO", "WORLD", "PYTHON", "JAZZY", "QUICK"] if language_name == "english" else \
-                ["HOLA", "MUNDO", "PYTHON", "JAZZ", "RAPID"]
-            return default_words
+            return default_words_for(language_name)
 
         return words
     except Exception as e:
         print(f"Error al obtener las palabras para el juego: {str(e)}")
         # Return default words in case of any error
-        return ["HELLO", "WORLD", "PYTHON", "JAZZY", "QUICK"] if language_name == "english" else \
-            ["HOLA", "MUNDO", "PYTHON", "JAZZ", "RAPID"]
+        return default_words_for(language_name)
+
+
+def default_words_for(language_name: str) -> list:
+    """Copia de la lista de respaldo de un idioma."""
+    return list(DEFAULT_WORDS["english" if language_name == "english" else "spanish"])
+
+
+def is_default_word_list(words) -> bool:
+    """Indicar si ``words`` es una lista de respaldo y no la de la base de datos."""
+    return list(words) in DEFAULT_WORDS.values()
@@ -0,0 +1,44 @@
+import json
+import os
+
+from database.local_storage import get_backend_dir
+
+
+def _cache_path(language_name: str):
+    return get_backend_dir("words") / f"{language_name}.tsv"
+
+
+def load_cached_words(language_name: str):
+    """Leer la lista de palabras en caché de un idioma.
+
+    Devuelve ``(version, rows)`` donde ``rows`` son dicts con ``id`` y
+    ``palabra``, o ``(None, None)`` si no hay caché válida.
+    """
+    path = _cache_path(language_name)
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            rows = []
+            for line in f:
+                palabra_id, palabra = line.rstrip("\n").split("\t", 1)
+                rows.append({"id": int(palabra_id), "palabra": palabra})
+        return header["version"], rows
+    except FileNotFoundError:
+        return None, None
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error al leer la caché de palabras de '{language_name}': {e}")
+        return None, None
+
+
+def save_cached_words(language_name: str, version, rows) -> None:
+    """Guardar la lista de palabras de un idioma junto con su marcador de versión."""
+    path = _cache_path(language_name)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"version": version}) + "\n")
+            for row in rows:
+                f.write(f"{row['id']}\t{row['palabra']}\n")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Error al guardar la caché de palabras de '{language_name}': {e}")
@@ -0,0 +1,8 @@
+"""Reglas de la partida compartidas por la interfaz, el simulador y las estadísticas.
+
+Módulo sin dependencias para poder importarlo sin cargar numpy.
+"""
+WORD_LENGTH = 5
+
+MAX_ATTEMPTS = 6
+MAX_HINTS = 3
@@ -0,0 +1,147 @@
+"""Conjunto de respuestas posibles que se reduce incrementalmente con cada suposición.
+
+Cada palabra se codifica como un entero con un bit por (posición, letra) y
+con sus conteos de letras empaquetados en campos de 3 bits. Las
+restricciones acumuladas (letras permitidas por posición y conteos mínimos
+y máximos) se expresan igual, así que filtrar es O(candidatas) con
+operaciones enteras.
+"""
+from engine.scoring import ABSENT, CORRECT, WORD_LENGTH
+
+_COUNT_BITS = 3
+_COUNT_MASK = (1 << _COUNT_BITS) - 1
+
+
+class CandidateFilter:
+    """Respuestas todavía compatibles con la retroalimentación recibida."""
+
+    def __init__(self, words, length: int = WORD_LENGTH):
+        self.words = list(words)
+        self.length = length
+
+        letters = sorted({letter for word in self.words for letter in word})
+        self._letter_index = {letter: i for i, letter in enumerate(letters)}
+        self._alphabet_size = len(letters)
+
+        self._position_codes = [self._encode_positions(word) for word in self.words]
+        self._count_codes = [self._encode_counts(word) for word in self.words]
+
+        self.reset()
+
+    def reset(self):
+        """Volver al conjunto completo sin restricciones, reutilizando las palabras codificadas."""
+        # Máscara de letras permitidas por posición (todas al comienzo)
+        self._allowed = [(1 << self._alphabet_size) - 1] * self.length
+        self._min_counts = {}
+        self._max_counts = {}
+        self._impossible = False
+
+        self.indices = list(range(len(self.words)))
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def remaining_words(self) -> list:
+        return [self.words[i] for i in self.indices]
+
+    def _encode_positions(self, word: str) -> int:
+        code = 0
+        for pos, letter in enumerate(word):
+            code |= 1 << (pos * self._alphabet_size + self._letter_index[letter])
+        return code
+
+    def _encode_counts(self, word: str) -> int:
+        code = 0
+        for letter in word:
+            code += 1 << (self._letter_index[letter] * _COUNT_BITS)
+        return code
+
+    def _allowed_code(self) -> int:
+        code = 0
+        for pos, mask in enumerate(self._allowed):
+            code |= mask << (pos * self._alphabet_size)
+        return code
+
+    def add_feedback(self, guess: str, pattern: int):
+        """Incorporar la retroalimentación de una suposición y reducir las candidatas."""
+        found = {}
+        has_absent = set()
+
+        for pos, letter in enumerate(guess):
+            pattern, state = divmod(pattern, 3)
+            index = self._letter_index.get(letter)
+            if state != ABSENT:
+                found[letter] = found.get(letter, 0) + 1
+                if index is None:
+                    # La letra está en la respuesta pero en ninguna palabra de la lista
+                    self._impossible = True
+                    continue
+            else:
+                has_absent.add(letter)
+                if index is None:
+                    continue
+
+            bit = 1 << index
+            if state == CORRECT:
+                self._allowed[pos] &= bit
+            else:
+                self._allowed[pos] &= ~bit
+
+        for letter in set(guess):
+            index = self._letter_index.get(letter)
+            if index is None:
+                continue
+            count = found.get(letter, 0)
+            if count > self._min_counts.get(index, 0):
+                self._min_counts[index] = count
+            if letter in has_absent:
+                self._max_counts[index] = min(count, self._max_counts.get(index, self.length))
+                if count == 0:
+                    for pos in range(self.length):
+                        self._allowed[pos] &= ~(1 << index)
+
+        self._narrow()
+
+    def add_letter_hint(self, pos: int, letter: str):
+        """Incorporar una pista que revela la letra de una posición."""
+        index = self._letter_index.get(letter)
+        if index is None:
+            self._impossible = True
+        else:
+            self._allowed[pos] &= 1 << index
+        self._narrow()
+
+    def _count_checks(self) -> list:
+        checks = []
+        for index in set(self._min_counts) | set(self._max_counts):
+            low = self._min_counts.get(index, 0)
+            high = self._max_counts.get(index, self.length)
+            if low > 0 or high < self.length:
+                checks.append((index * _COUNT_BITS, low, high))
+        return checks
+
+    def _narrow(self):
+        if self._impossible:
+            self.indices = []
+            return
+
+        allowed = self._allowed_code()
+        checks = self._count_checks()
+        position_codes = self._position_codes
+        count_codes = self._count_codes
+
+        remaining = []
+        for i in self.indices:
+            code = position_codes[i]
+            if code & allowed != code:
+                continue
+            counts = count_codes[i]
+            for shift, low, high in checks:
+                count = (counts >> shift) & _COUNT_MASK
+                if count < low or count > high:
+                    break
+            else:
+                remaining.append(i)
+
+        self.indices = remaining
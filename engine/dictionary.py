@@ -0,0 +1,93 @@
+"""Índice compacto de palabras válidas para validar suposiciones.
+
+Cada palabra se empaqueta en un entero (``bits`` por letra según el
+alfabeto de la lista) y los códigos se guardan ordenados en un ``array``,
+de modo que la pertenencia se resuelve con una búsqueda binaria.
+
+Las respuestas salen de la tabla 'palabras'; las suposiciones permitidas son
+esas mismas palabras más, si existe, el diccionario completo del idioma en
+``diccionarios/<idioma>.txt`` (una palabra por línea) dentro del directorio
+de datos locales. Ese diccionario puede ser mucho más grande que la lista de
+respuestas y solo se usa para validar.
+"""
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+from database.local_storage import get_local_dir
+from engine.scoring import WORD_LENGTH
+
+
+class WordIndex:
+    """Conjunto inmutable de palabras de longitud fija con búsqueda O(log n)."""
+
+    def __init__(self, words, length: int = WORD_LENGTH):
+        start = time.perf_counter()
+        self.length = length
+
+        words = [word.upper() for word in words if len(word) == length]
+        letters = sorted({letter for word in words for letter in word})
+        self._letter_codes = {letter: i + 1 for i, letter in enumerate(letters)}
+        self._bits = max(1, len(letters).bit_length())
+
+        self._codes = array("Q", sorted({self._encode(word) for word in words}))
+        self.build_seconds = time.perf_counter() - start
+
+    def _encode(self, word: str):
+        code = 0
+        for letter in word:
+            letter_code = self._letter_codes.get(letter)
+            if letter_code is None:
+                return None
+            code = (code << self._bits) | letter_code
+        return code
+
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str) or len(word) != self.length:
+            return False
+        code = self._encode(word.upper())
+        if code is None:
+            return False
+        i = bisect_left(self._codes, code)
+        return i < len(self._codes) and self._codes[i] == code
+
+    def __len__(self):
+        return len(self._codes)
+
+    def memory_bytes(self) -> int:
+        """Memoria aproximada del índice (códigos más el mapa de letras)."""
+        return (self._codes.buffer_info()[1] * self._codes.itemsize
+                + sys.getsizeof(self._letter_codes))
+
+    def stats(self) -> dict:
+        return {
+            "words": len(self),
+            "build_ms": self.build_seconds * 1000,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+def guess_words_path(language_name: str):
+    """Archivo con el diccionario completo de suposiciones de un idioma."""
+    return get_local_dir("diccionarios") / f"{language_name}.txt"
+
+
+def load_guess_words(language_name: str) -> list:
+    """Palabras del diccionario de suposiciones del idioma (vacío si no hay archivo)."""
+    path = guess_words_path(language_name)
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [line.strip().upper() for line in f if line.strip()]
+
+
+def build_guess_index(language_name: str, answers) -> WordIndex:
+    """Índice de suposiciones permitidas: las respuestas más el diccionario completo del idioma."""
+    try:
+        guess_words = load_guess_words(language_name)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error al leer el diccionario de suposiciones: {e}")
+        guess_words = []
+    return WordIndex(chain(answers, guess_words))
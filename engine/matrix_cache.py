@@ -0,0 +1,141 @@
+"""Caché en disco de la matriz de patrones por idioma y versión de la lista de palabras.
+
+La matriz se guarda como ``.npy`` y se abre mapeada en memoria en modo
+solo lectura, de modo que el juego y cualquier solucionador comparten las
+mismas páginas del sistema operativo entre procesos.
+"""
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from database.local_storage import get_local_dir
+from engine.scoring import build_pattern_matrix, prepare_words
+
+# Matrices ya abiertas en este proceso, por (idioma, hash de la lista), de la menos a la más usada
+_open_matrices = {}
+# Un candado por clave mientras se abre o construye su matriz; ``_lock`` solo protege los dos diccionarios
+_key_locks = {}
+_lock = threading.Lock()
+
+# Matrices abiertas como máximo (una por idioma; las de listas anteriores se sueltan al abrir la nueva)
+MAX_OPEN_MATRICES = 4
+
+
+class PatternMatrix:
+    """Lista de palabras junto con su matriz de patrones (suposición x respuesta)."""
+
+    def __init__(self, words, matrix):
+        self.words = list(words)
+        self.matrix = matrix
+        self.index = {word: i for i, word in enumerate(self.words)}
+        # Mejor primera suposición, calculada bajo demanda por engine.solver
+        self.opener = None
+
+    def __len__(self):
+        return len(self.words)
+
+    def pattern(self, guess: str, answer: str) -> int:
+        return int(self.matrix[self.index[guess], self.index[answer]])
+
+
+def word_list_hash(words) -> str:
+    """Hash estable de una lista de palabras ya normalizada."""
+    return hashlib.sha256("\n".join(words).encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_path(language_name: str, digest: str):
+    return get_local_dir("matrices") / f"{language_name}-{digest}.npy"
+
+
+def _write_matrix(path, matrix):
+    """Escribir la matriz de forma atómica para que otro proceso nunca lea un archivo a medias."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, matrix)
+    os.replace(tmp_path, path)
+
+
+def _remove_stale(language_name: str, keep):
+    for stale in get_local_dir("matrices").glob(f"{language_name}-*.npy"):
+        if stale != keep:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def load_pattern_matrix(language_name: str, words=None, persist: bool = True) -> PatternMatrix:
+    """Abrir la matriz de patrones de un idioma, reconstruyéndola solo si la lista cambió.
+
+    Con ``persist=False`` (listas de respaldo sin conexión) la matriz se
+    construye solo en memoria: no se guarda ni reemplaza la del idioma en disco.
+    Construirla para una lista grande tarda segundos y solo bloquea a quien
+    pida la misma lista: el resto de los idiomas (y las matrices ya abiertas)
+    se sirven mientras tanto.
+    """
+    if words is None:
+        from database.supabase_client import get_words_for_game
+        words = get_words_for_game(language_name)
+
+    words = prepare_words(words)
+    if not words or not persist:
+        return PatternMatrix(words, build_pattern_matrix(words, words))
+
+    digest = word_list_hash(words)
+    key = (language_name, digest)
+
+    cached = _get_open(key)
+    if cached is not None:
+        return cached
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Otro hilo pudo terminar de abrirla mientras se esperaba el candado
+        cached = _get_open(key)
+        if cached is not None:
+            return cached
+
+        path = _cache_path(language_name, digest)
+        matrix = None
+        if path.exists():
+            try:
+                matrix = np.load(path, mmap_mode="r")
+                if matrix.shape != (len(words), len(words)):
+                    matrix = None
+            except (OSError, ValueError) as e:
+                print(f"Error al abrir la matriz de patrones en caché: {e}")
+                matrix = None
+
+        if matrix is None:
+            _write_matrix(path, build_pattern_matrix(words, words))
+            _remove_stale(language_name, path)
+            matrix = np.load(path, mmap_mode="r")
+
+        pattern_matrix = PatternMatrix(words, matrix)
+        _remember(key, pattern_matrix, key_lock)
+        return pattern_matrix
+
+
+def _get_open(key):
+    """Matriz ya abierta para ``key`` (o None), marcándola como la más reciente."""
+    with _lock:
+        pattern_matrix = _open_matrices.pop(key, None)
+        if pattern_matrix is not None:
+            _open_matrices[key] = pattern_matrix
+        return pattern_matrix
+
+
+def _remember(key, pattern_matrix, key_lock):
+    """Guardar una matriz recién abierta, soltando las de listas anteriores del idioma y las menos usadas."""
+    with _lock:
+        for other in [k for k in _open_matrices if k[0] == key[0] and k != key]:
+            del _open_matrices[other]
+        _open_matrices[key] = pattern_matrix
+        while len(_open_matrices) > MAX_OPEN_MATRICES:
+            del _open_matrices[next(iter(_open_matrices))]
+        if _key_locks.get(key) is key_lock:
+            del _key_locks[key]
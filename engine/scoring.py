@@ -0,0 +1,125 @@
+"""Motor de puntuación de Wordle independiente de Qt.
+
+La retroalimentación de una suposición se codifica como un entero en base 3:
+la columna ``col`` aporta ``estado * 3 ** col``, donde el estado es
+ABSENT (0), PRESENT (1) o CORRECT (2). Para palabras de 5 letras el patrón
+cabe en un ``uint8`` (0..242).
+"""
+import numpy as np
+
+from engine.constants import MAX_ATTEMPTS, MAX_HINTS, WORD_LENGTH  # noqa: F401 (reexportadas)
+
+ABSENT = 0
+PRESENT = 1
+CORRECT = 2
+
+STATE_NAMES = ("absent", "present", "correct")
+
+# Cantidad de celdas de (suposición x respuesta) que se evalúan por bloque
+# al construir la matriz, para acotar la memoria de los arreglos intermedios.
+_BLOCK_CELLS = 4_000_000
+
+
+def score_guess(guess: str, answer: str) -> int:
+    """Calcular el patrón en base 3 de ``guess`` contra ``answer``."""
+    remaining_letters = {}
+    for g, a in zip(guess, answer):
+        if g != a:
+            remaining_letters[a] = remaining_letters.get(a, 0) + 1
+
+    pattern = 0
+    weight = 1
+    for g, a in zip(guess, answer):
+        if g == a:
+            pattern += CORRECT * weight
+        elif remaining_letters.get(g, 0) > 0:
+            pattern += PRESENT * weight
+            remaining_letters[g] -= 1
+        weight *= 3
+
+    return pattern
+
+
+def decode_pattern(pattern: int, length: int = WORD_LENGTH) -> list:
+    """Convertir un patrón en base 3 a la lista de estados por columna."""
+    states = []
+    for _ in range(length):
+        pattern, state = divmod(int(pattern), 3)
+        states.append(STATE_NAMES[state])
+    return states
+
+
+def solved_pattern(length: int = WORD_LENGTH) -> int:
+    """Patrón correspondiente a una suposición completamente correcta."""
+    return sum(CORRECT * 3 ** col for col in range(length))
+
+
+def prepare_words(words, length: int = WORD_LENGTH) -> list:
+    """Normalizar una lista de palabras: mayúsculas, longitud fija y sin duplicados."""
+    seen = set()
+    prepared = []
+    for word in words:
+        word = word.upper()
+        if len(word) == length and word not in seen:
+            seen.add(word)
+            prepared.append(word)
+    return prepared
+
+
+def encode_words(words) -> np.ndarray:
+    """Codificar palabras de igual longitud como una matriz (N, L) de códigos Unicode."""
+    words = list(words)
+    if not words:
+        return np.zeros((0, WORD_LENGTH), dtype=np.int32)
+    return np.array([[ord(letter) for letter in word] for word in words], dtype=np.int32)
+
+
+def pattern_dtype(length: int = WORD_LENGTH):
+    """Tipo entero más pequeño que puede contener un patrón de ``length`` columnas."""
+    return np.uint8 if 3 ** length <= 256 else np.uint16 if 3 ** length <= 65536 else np.uint32
+
+
+def build_pattern_matrix(guesses, answers) -> np.ndarray:
+    """Construir la matriz de patrones de cada suposición contra cada respuesta.
+
+    El resultado tiene forma (len(guesses), len(answers)) y ``matrix[g, a]``
+    es igual a ``score_guess(guesses[g], answers[a])``.
+    """
+    guess_codes = encode_words(guesses)
+    answer_codes = encode_words(answers)
+    length = guess_codes.shape[1]
+    if answer_codes.size and answer_codes.shape[1] != length:
+        raise ValueError("Las suposiciones y las respuestas deben tener la misma longitud")
+
+    n_guesses, n_answers = len(guess_codes), len(answer_codes)
+    matrix = np.zeros((n_guesses, n_answers), dtype=pattern_dtype(length))
+    if not n_guesses or not n_answers:
+        return matrix
+
+    block = max(1, _BLOCK_CELLS // (n_answers * length))
+    for start in range(0, n_guesses, block):
+        g = guess_codes[start:start + block]
+        matrix[start:start + block] = _score_block(g, answer_codes)
+
+    return matrix
+
+
+def _score_block(g: np.ndarray, a: np.ndarray) -> np.ndarray:
+    """Puntuar un bloque de suposiciones contra todas las respuestas."""
+    length = g.shape[1]
+    # same[i][k]: la letra i de la suposición coincide con la letra k de la respuesta
+    same = [[g[:, i, None] == a[None, :, k] for k in range(length)] for i in range(length)]
+    green = [same[i][i] for i in range(length)]
+
+    pattern = np.zeros((g.shape[0], a.shape[0]), dtype=np.int32)
+    weight = 1
+    for i in range(length):
+        # Apariciones de la letra i en la respuesta que no quedaron en verde
+        available = sum((same[i][k] & ~green[k]).astype(np.int8) for k in range(length))
+        # Apariciones anteriores de la misma letra en la suposición que no son verdes
+        used = sum(((g[:, j] == g[:, i])[:, None] & ~green[j]).astype(np.int8) for j in range(i))
+        present = ~green[i] & (used < available)
+        pattern += (CORRECT * weight) * green[i] + (PRESENT * weight) * present
+        weight *= 3
+
+    return pattern
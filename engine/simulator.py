@@ -0,0 +1,271 @@
+"""Simulador de partidas sin interfaz gráfica.
+
+Reproduce las reglas de ``WordleGame`` (validación contra la lista, límite de
+intentos y presupuesto de pistas) y ejecuta estrategias intercambiables
+sobre toda la lista de respuestas, repartiendo el trabajo en un pool de
+procesos.
+
+Uso: python -m engine.simulator --language english --strategy entropy
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine.constraints import CandidateFilter
+from engine.dictionary import WordIndex
+from engine.matrix_cache import load_pattern_matrix
+from engine.scoring import MAX_ATTEMPTS, MAX_HINTS, prepare_words, score_guess
+from engine.solver import best_guess
+
+
+class HeadlessGame:
+    """Una partida de Wordle con las mismas reglas que la ventana del juego."""
+
+    def __init__(self, target_word, guess_index, max_attempts=MAX_ATTEMPTS, max_hints=MAX_HINTS, rng=None):
+        self.target_word = target_word
+        self.guess_index = guess_index
+        self.max_attempts = max_attempts
+        self.max_hints = max_hints
+        self.rng = rng or random.Random()
+
+        self.history = []
+        self.hints_used = 0
+        self.game_over = False
+        self.win = False
+
+    @property
+    def attempts(self) -> int:
+        return len(self.history)
+
+    @property
+    def hints_left(self) -> int:
+        return self.max_hints - self.hints_used
+
+    def submit_guess(self, guess: str) -> int:
+        """Evaluar una suposición y devolver su patrón en base 3."""
+        if self.game_over:
+            raise ValueError("La partida ya terminó")
+        if guess not in self.guess_index:
+            raise ValueError(f"La palabra '{guess}' no está en la lista de palabras")
+
+        pattern = score_guess(guess, self.target_word)
+        self.history.append((guess, pattern))
+
+        if guess == self.target_word:
+            self.game_over = True
+            self.win = True
+        elif self.attempts >= self.max_attempts:
+            self.game_over = True
+
+        return pattern
+
+    def reveal_letter_hint(self):
+        """Revelar una letra aún no acertada, como ``WordleGame.reveal_letter_hint``.
+
+        Devuelve ``(columna, letra)`` o ``None`` si ya se acertaron todas; en
+        ambos casos la pista se descuenta, igual que en la interfaz.
+        """
+        if self.hints_used >= self.max_hints or self.game_over:
+            return None
+
+        self.hints_used += 1
+        unguessed_indices = [col for col, letter in enumerate(self.target_word)
+                             if not any(guess[col] == letter for guess, _ in self.history)]
+        if not unguessed_indices:
+            return None
+
+        col = self.rng.choice(unguessed_indices)
+        return col, self.target_word[col]
+
+
+class Strategy:
+    """Estrategia de juego. Se instancia en el proceso padre y se prepara en cada trabajador."""
+
+    name = "base"
+
+    def setup(self, words, language_name=None):
+        """Preparar estructuras por proceso (se llama una vez por trabajador)."""
+        self.words = words
+
+    def play(self, game: HeadlessGame):
+        raise NotImplementedError
+
+
+class RandomCandidateStrategy(Strategy):
+    """Elige al azar entre las respuestas aún posibles; opcionalmente gasta pistas."""
+
+    name = "random"
+
+    def __init__(self, use_hints=False, seed=0):
+        self.name = "random-hints" if use_hints else "random"
+        self.use_hints = use_hints
+        self.seed = seed
+
+    def setup(self, words, language_name=None):
+        super().setup(words, language_name)
+        self.rng = random.Random(self.seed)
+        self.candidates = CandidateFilter(words)
+
+    def play(self, game):
+        candidates = self.candidates
+        candidates.reset()
+        while not game.game_over and len(candidates):
+            if self.use_hints and game.hints_left:
+                hint = game.reveal_letter_hint()
+                if hint:
+                    candidates.add_letter_hint(*hint)
+                    continue
+            guess = self.words[self.rng.choice(candidates.indices)]
+            candidates.add_feedback(guess, game.submit_guess(guess))
+
+
+class EntropyStrategy(Strategy):
+    """Juega siempre la suposición de mayor entropía (la misma que la pista "Mejor Palabra")."""
+
+    name = "entropy"
+
+    def setup(self, words, language_name=None):
+        super().setup(words, language_name)
+        self.pattern_matrix = load_pattern_matrix(language_name or "simulation", words)
+        self.candidates = CandidateFilter(self.pattern_matrix.words)
+        # La estrategia es determinista: la próxima suposición depende solo del historial
+        self.next_guess = {}
+
+    def play(self, game):
+        candidates = self.candidates
+        candidates.reset()
+        history = ()
+        while not game.game_over and len(candidates):
+            guess = self.next_guess.get(history)
+            if guess is None:
+                guess, _ = best_guess(self.pattern_matrix, candidates.indices)
+                self.next_guess[history] = guess
+            pattern = game.submit_guess(guess)
+            candidates.add_feedback(guess, pattern)
+            history += ((guess, pattern),)
+
+
+STRATEGIES = {
+    "random": lambda: RandomCandidateStrategy(),
+    "random-hints": lambda: RandomCandidateStrategy(use_hints=True),
+    "entropy": lambda: EntropyStrategy(),
+}
+
+# Estado de cada proceso trabajador
+_worker = {}
+
+
+def _init_worker(strategy, words, language_name):
+    strategy.setup(words, language_name)
+    _worker["strategy"] = strategy
+    _worker["guess_index"] = WordIndex(words)
+
+
+def _play_batch(targets):
+    """Jugar un lote de respuestas y devolver sus resultados agregados."""
+    strategy = _worker["strategy"]
+    guess_index = _worker["guess_index"]
+    result = new_result()
+
+    for target in targets:
+        game = HeadlessGame(target, guess_index, rng=random.Random(target))
+        strategy.play(game)
+        result["games"] += 1
+        result["hints_used"] += game.hints_used
+        if game.win:
+            result["wins"] += 1
+            result["distribution"][game.attempts] += 1
+        else:
+            result["losses"] += 1
+
+    return result
+
+
+def new_result() -> dict:
+    return {"games": 0, "wins": 0, "losses": 0, "hints_used": 0,
+            "distribution": {attempt: 0 for attempt in range(1, MAX_ATTEMPTS + 1)}}
+
+
+def merge_results(total: dict, part: dict) -> dict:
+    for key in ("games", "wins", "losses", "hints_used"):
+        total[key] += part[key]
+    for attempt, count in part["distribution"].items():
+        total["distribution"][attempt] += count
+    return total
+
+
+def run_simulation(words, strategy, answers=None, workers=None, language_name=None, batch_size=200) -> dict:
+    """Jugar una partida por cada respuesta y devolver el resumen de la simulación.
+
+    El resumen incluye la tasa de victoria, la distribución de intentos de las
+    partidas ganadas y el rendimiento en partidas por segundo.
+    """
+    words = prepare_words(words)
+    answers = words if answers is None else prepare_words(answers)
+    workers = workers or os.cpu_count() or 1
+
+    if isinstance(strategy, EntropyStrategy):
+        # Construir la matriz en disco una sola vez; los trabajadores la mapean
+        load_pattern_matrix(language_name or "simulation", words)
+
+    batches = [answers[i:i + batch_size] for i in range(0, len(answers), batch_size)]
+    result = new_result()
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(strategy, words, language_name)
+        for batch in batches:
+            merge_results(result, _play_batch(batch))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(strategy, words, language_name)) as executor:
+            for part in executor.map(_play_batch, batches):
+                merge_results(result, part)
+    elapsed = time.perf_counter() - start
+
+    games = result["games"]
+    result.update({
+        "strategy": strategy.name,
+        "workers": workers,
+        "seconds": elapsed,
+        "win_rate": result["wins"] / games * 100 if games else 0,
+        "avg_attempts": (sum(a * n for a, n in result["distribution"].items()) / result["wins"]
+                         if result["wins"] else 0),
+        "games_per_second": games / elapsed if elapsed else 0,
+    })
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de partidas de Wordle sin interfaz")
+    parser.add_argument("--language", choices=["english", "spanish"], default="english")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="usar N palabras aleatorias en lugar de la base de datos")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        from benchmarks.bench_hints import synthetic_words
+        words = synthetic_words(args.synthetic)
+        language_name = f"synthetic-{args.synthetic}"
+    else:
+        from database.supabase_client import get_words_for_game
+        words = get_words_for_game(args.language)
+        language_name = args.language
+
+    result = run_simulation(words, STRATEGIES[args.strategy](), workers=args.workers,
+                            language_name=language_name)
+
+    print(f"estrategia: {result['strategy']}  trabajadores: {result['workers']}")
+    print(f"partidas: {result['games']}  victorias: {result['win_rate']:.1f}%  "
+          f"intentos promedio: {result['avg_attempts']:.2f}  pistas: {result['hints_used']}")
+    print("distribución: " + "  ".join(f"{a}:{n}" for a, n in result["distribution"].items())
+          + f"  X:{result['losses']}")
+    print(f"{result['games_per_second']:.0f} partidas/s en {result['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
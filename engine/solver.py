@@ -0,0 +1,88 @@
+"""Sugerencia de la mejor próxima suposición por entropía sobre la matriz de patrones."""
+import numpy as np
+
+from engine.scoring import score_guess
+
+# Presupuesto de tiempo (segundos) de una pista de "mejor suposición" sobre una
+# lista de 10k palabras una vez hecha la primera suposición. Lo mide
+# benchmarks/bench_hints.py.
+HINT_TIME_BUDGET = 0.1
+
+# Celdas de (suposición x candidata) procesadas por bloque al contar patrones
+_BLOCK_CELLS = 2_000_000
+
+# Máximo de candidatas usadas para estimar la distribución de patrones
+_MAX_SAMPLE = 500
+
+
+def filter_candidates(pattern_matrix, candidates, guess: str, pattern: int) -> np.ndarray:
+    """Quedarse con las candidatas que habrían producido ``pattern`` para ``guess``."""
+    candidates = np.asarray(candidates, dtype=np.int64)
+    row = pattern_matrix.index.get(guess)
+    if row is not None:
+        return candidates[pattern_matrix.matrix[row, candidates] == pattern]
+
+    words = pattern_matrix.words
+    return np.array([c for c in candidates if score_guess(guess, words[c]) == pattern], dtype=np.int64)
+
+
+def guess_entropies(matrix, candidates, guesses=None, max_sample: int = _MAX_SAMPLE) -> np.ndarray:
+    """Entropía esperada (en bits) de cada suposición contra el conjunto de candidatas.
+
+    Si hay más de ``max_sample`` candidatas, la distribución de patrones se
+    estima con una muestra fija de ellas para acotar el costo por pista.
+    """
+    candidates = np.asarray(candidates, dtype=np.int64)
+    if len(candidates) > max_sample:
+        candidates = np.random.default_rng(0).choice(candidates, max_sample, replace=False)
+
+    guesses = np.arange(matrix.shape[0]) if guesses is None else np.asarray(guesses, dtype=np.int64)
+    n_candidates = len(candidates)
+    entropies = np.zeros(len(guesses), dtype=np.float64)
+    if n_candidates == 0:
+        return entropies
+
+    columns = matrix[:, candidates]
+    n_patterns = int(columns.max()) + 1
+    # sum(c * log2(c)) tabulado para cada tamaño de grupo posible
+    c = np.arange(n_candidates + 1, dtype=np.float64)
+    c_log_c = np.zeros_like(c)
+    c_log_c[1:] = c[1:] * np.log2(c[1:])
+
+    block = max(1, _BLOCK_CELLS // n_candidates)
+    for start in range(0, len(guesses), block):
+        patterns = columns[guesses[start:start + block]].astype(np.int32)
+        rows = len(patterns)
+        patterns += np.arange(rows, dtype=np.int32)[:, None] * n_patterns
+        counts = np.bincount(patterns.ravel(), minlength=rows * n_patterns).reshape(rows, n_patterns)
+        entropies[start:start + block] = np.log2(n_candidates) - c_log_c[counts].sum(axis=1) / n_candidates
+
+    return entropies
+
+
+def best_guess(pattern_matrix, candidates):
+    """Devolver ``(palabra, entropía)`` de la suposición más informativa.
+
+    Con el conjunto completo de candidatas el resultado se memoriza en el
+    ``PatternMatrix``, ya que es el cálculo más costoso y nunca cambia.
+    """
+    candidates = np.asarray(candidates, dtype=np.int64)
+    if len(candidates) == 0:
+        return None, 0.0
+    if len(candidates) <= 2:
+        return pattern_matrix.words[candidates[0]], float(len(candidates) - 1)
+
+    full_set = len(candidates) == len(pattern_matrix)
+    if full_set and pattern_matrix.opener is not None:
+        return pattern_matrix.opener
+
+    scores = guess_entropies(pattern_matrix.matrix, candidates)
+    # A igual entropía se prefiere una palabra que todavía puede ser la respuesta
+    is_candidate = np.zeros(len(scores), dtype=bool)
+    is_candidate[candidates] = True
+    best = int(np.lexsort((is_candidate, scores))[-1])
+    result = pattern_matrix.words[best], float(scores[best])
+
+    if full_set:
+        pattern_matrix.opener = result
+    return result
@@ -0,0 +1,142 @@
+"""Agregado incremental de estadísticas de partidas.
+
+``StatsAggregate`` se actualiza en O(1) por partida y dos agregados de
+tramos consecutivos se pueden combinar con ``merge``, incluidas las rachas.
+"""
+from engine.constants import MAX_ATTEMPTS
+
+
+def summarize_statistics(total_games: int, wins: int, english_games: int, spanish_games: int, total_time: float,
+                         total_attempts: int) -> dict:
+    """Calcular las métricas de las tarjetas de resumen a partir de los totales."""
+    return {
+        "total_games": total_games,
+        "win_rate": (wins / total_games * 100) if total_games else 0,
+        "en_pct": (english_games / total_games * 100) if total_games else 0,
+        "es_pct": (spanish_games / total_games * 100) if total_games else 0,
+        "avg_time": (total_time / total_games) if total_games else 0,
+        "avg_attempts": (total_attempts / total_games) if total_games else 0,
+    }
+
+
+def normalize_language(language: str):
+    """Llevar las variantes de nombre de idioma a 'english' / 'spanish' (o None)."""
+    lang = (language or "").lower()
+    if lang in ("english", "en"):
+        return "english"
+    if lang in ("spanish", "es", "español"):
+        return "spanish"
+    return None
+
+
+class StatsAggregate:
+    """Totales, rachas e histograma de intentos de una secuencia de partidas en orden."""
+
+    def __init__(self):
+        self.total_games = 0
+        self.wins = 0
+        self.total_time = 0.0
+        self.total_attempts = 0
+        self.language_counts = {"english": 0, "spanish": 0}
+        # Victorias por cantidad de intentos
+        self.attempt_histogram = {attempt: 0 for attempt in range(1, MAX_ATTEMPTS + 1)}
+        # Victorias consecutivas al principio y al final de la secuencia, y la mayor racha
+        self.leading_streak = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        # Mayor id de 'partidas' de la copia sincronizada ya contado (None: solo partidas locales)
+        self.last_id = None
+        # 'client_id' de las partidas contadas al terminar en este equipo que la copia sincronizada todavía no trajo
+        self.pending_client_ids = set()
+
+    def add_game(self, win: bool, attempts: int, time_taken: float, language: str) -> None:
+        """Incorporar una partida posterior a todas las ya agregadas."""
+        all_wins = self.leading_streak == self.total_games
+
+        self.total_games += 1
+        self.total_time += time_taken or 0
+        self.total_attempts += attempts or 0
+
+        lang = normalize_language(language)
+        if lang:
+            self.language_counts[lang] += 1
+
+        if win:
+            self.wins += 1
+            if attempts in self.attempt_histogram:
+                self.attempt_histogram[attempts] += 1
+            self.current_streak += 1
+            self.max_streak = max(self.max_streak, self.current_streak)
+            if all_wins:
+                self.leading_streak += 1
+        else:
+            self.current_streak = 0
+
+    def merge(self, later: "StatsAggregate") -> "StatsAggregate":
+        """Combinar con el agregado de partidas jugadas después de las de este."""
+        merged = StatsAggregate()
+        merged.total_games = self.total_games + later.total_games
+        merged.wins = self.wins + later.wins
+        merged.total_time = self.total_time + later.total_time
+        merged.total_attempts = self.total_attempts + later.total_attempts
+        merged.language_counts = {lang: self.language_counts[lang] + later.language_counts[lang]
+                                  for lang in self.language_counts}
+        merged.attempt_histogram = {attempt: self.attempt_histogram[attempt] + later.attempt_histogram[attempt]
+                                    for attempt in self.attempt_histogram}
+
+        merged.max_streak = max(self.max_streak, later.max_streak, self.current_streak + later.leading_streak)
+        if later.current_streak == later.total_games:
+            merged.current_streak = self.current_streak + later.total_games
+        else:
+            merged.current_streak = later.current_streak
+        if self.leading_streak == self.total_games:
+            merged.leading_streak = self.total_games + later.leading_streak
+        else:
+            merged.leading_streak = self.leading_streak
+        merged.last_id = later.last_id if later.last_id is not None else self.last_id
+        merged.pending_client_ids = self.pending_client_ids | later.pending_client_ids
+        return merged
+
+    def add_games(self, games) -> None:
+        """Incorporar, en el orden dado, partidas con el formato de las estadísticas."""
+        for g in games:
+            self.add_game(g.get("win", False), g.get("attempts", 0), g.get("time_taken", 0), g.get("language", ""))
+
+    @classmethod
+    def from_games(cls, games) -> "StatsAggregate":
+        """Construir el agregado a partir de partidas, ordenándolas por fecha."""
+        aggregate = cls()
+        aggregate.add_games(sorted(games, key=lambda g: g.get("created_at", "")))
+        return aggregate
+
+    def summary(self) -> dict:
+        return summarize_statistics(self.total_games, self.wins, self.language_counts["english"],
+                                    self.language_counts["spanish"], self.total_time, self.total_attempts)
+
+    def to_dict(self) -> dict:
+        return {
+            "total_games": self.total_games,
+            "wins": self.wins,
+            "total_time": self.total_time,
+            "total_attempts": self.total_attempts,
+            "language_counts": self.language_counts,
+            "attempt_histogram": {str(a): n for a, n in self.attempt_histogram.items()},
+            "leading_streak": self.leading_streak,
+            "current_streak": self.current_streak,
+            "max_streak": self.max_streak,
+            "last_id": self.last_id,
+            "pending_client_ids": sorted(self.pending_client_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StatsAggregate":
+        aggregate = cls()
+        for key in ("total_games", "wins", "total_time", "total_attempts",
+                    "leading_streak", "current_streak", "max_streak"):
+            setattr(aggregate, key, data.get(key, 0))
+        aggregate.language_counts.update(data.get("language_counts", {}))
+        for attempt, count in data.get("attempt_histogram", {}).items():
+            aggregate.attempt_histogram[int(attempt)] = count
+        aggregate.last_id = data.get("last_id")
+        aggregate.pending_client_ids = set(data.get("pending_client_ids", []))
+        return aggregate
@@ -4,8 +4,7 @@ from dotenv import load_dotenv
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTranslator, QLocale
 
-from ui.login import LoginWindow
-from database.supabase_client import initialize_supabase
+from database.supabase_client import initialize_supabase, get_backend_name
 
 def get_base_path():
     # When running as a PyInstaller bundle
@@ -14,7 +13,21 @@ def get_base_path():
     # When running as a normal Python script
     return os.path.abspath(".")
 
-def main():
+def on_supabase_error(error):
+    # Requests retry the initialization, so the app keeps working once the network is back
+    print(f"Error initializing Supabase: {error}")
+
+def initialize_backend():
+    """Connect to the database, then start the game outbox so results left over from the last session are sent."""
+    try:
+        return initialize_supabase()
+    finally:
+        # The outbox retries with backoff on its own, so start it even if the first connection failed
+        from database.outbox import get_game_outbox
+        get_game_outbox()
+
+def startup(argv):
+    """Create the application and show the login screen; returns (app, window)."""
     # Load environment variables
     # Load .env from the bundle
     env_path = os.path.join(get_base_path(), ".env")
@@ -24,27 +37,34 @@ def main():
         load_dotenv(prod_path)
     elif os.path.exists(env_path):
         load_dotenv(env_path)
-    
-    # Check if Supabase credentials are set
-    if not os.getenv("SUPABASE_URL") or not os.getenv("SUPABASE_KEY"):
+
+    # Check if Supabase credentials are set (not needed for the local SQLite backend)
+    if get_backend_name() != "sqlite" and (not os.getenv("SUPABASE_URL") or not os.getenv("SUPABASE_KEY")):
         print("Error: Supabase credentials not found. Please set SUPABASE_URL and SUPABASE_KEY in .env file.")
         sys.exit(1)
-    
-    # Initialize Supabase client
-    initialize_supabase()
-    
-    # Create application
-    app = QApplication(sys.argv)
-    
+
+    # Create application first so the login window paints as soon as possible
+    app = QApplication(argv)
+
     # Set up translator for internationalization
     translator = QTranslator()
     app.installTranslator(translator)
-    
-    # Show login window
-    login_window = LoginWindow()
-    login_window.show()
-    
+    app.translator = translator
+
+    # Show login window inside the single app window (screens are imported on demand)
+    from ui.navigation import get_navigator
+    window = get_navigator()
+    window.show_login()
+
+    # Initialize Supabase client and the game outbox in the background (importing supabase takes ~0.5s)
+    from ui.workers import run_in_background
+    app.supabase_task = run_in_background(initialize_backend, on_error=on_supabase_error)
+
+    return app, window
+
+def main():
+    app, window = startup(sys.argv)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -13,6 +13,7 @@ install_requires = [
     'PyQt6>=6.4.0',
     'supabase>=1.0.3',
     'python-dotenv>=0.19.0',
+    'numpy>=1.21',
     'pyinstaller>=5.0',
 ]
 
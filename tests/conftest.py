@@ -0,0 +1,46 @@
+import os
+import time
+
+import pytest
+
+
+@pytest.fixture
+def local_backend(tmp_path, monkeypatch):
+    """Backend SQLite y datos locales en un directorio temporal, sin clientes de otras pruebas."""
+    from database import outbox, supabase_client
+
+    monkeypatch.setenv("WORDLE_BACKEND", "sqlite")
+    monkeypatch.setenv("WORDLE_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("WORDLE_SQLITE_PATH", raising=False)
+    monkeypatch.setattr(supabase_client, "_supabase_client", None)
+    monkeypatch.setattr(outbox, "_outbox", None)
+    supabase_client.invalidate_reference_cache()
+
+    yield supabase_client.get_supabase_client()
+
+    supabase_client.invalidate_reference_cache()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication con la plataforma ``offscreen`` para las pruebas de la interfaz."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(["wordle-tests"])
+    yield app
+
+
+@pytest.fixture
+def wait_until(qapp):
+    """Atender eventos de Qt hasta que ``condition()`` sea verdadera o se agote el tiempo."""
+    def wait(condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            qapp.processEvents()
+            time.sleep(0.001)
+        return True
+
+    return wait
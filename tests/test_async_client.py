@@ -0,0 +1,77 @@
+import asyncio
+import weakref
+
+import pytest
+
+from database import async_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch):
+    monkeypatch.setattr(async_client, "_async_clients", weakref.WeakKeyDictionary())
+
+
+@pytest.fixture
+def games(local_backend):
+    local_backend.table("usuarios").insert([{"id": 1, "nombre_usuario": "ana", "contrasena": "x"},
+                                            {"id": 2, "nombre_usuario": "luis", "contrasena": "x"}]).execute()
+    local_backend.table("palabras").insert([{"id": 1, "palabra": "arbol", "idioma_id": 2},
+                                            {"id": 2, "palabra": "crane", "idioma_id": 1}]).execute()
+    local_backend.table("partidas").insert([
+        {"usuario_id": 1, "palabra_id": 1, "adivinada": True, "intentos": 3, "time_taken": 10.0},
+        {"usuario_id": 1, "palabra_id": 2, "adivinada": False, "intentos": 6, "time_taken": 20.0},
+        {"usuario_id": 2, "palabra_id": 1, "adivinada": True, "intentos": 4, "time_taken": 30.0},
+    ]).execute()
+    return local_backend
+
+
+def test_sqlite_backend_is_used(games):
+    user_games = async_client.run(async_client.get_user_statistics(1))
+    assert [(game["word"], game["language"], game["win"]) for game in user_games] == [
+        ("arbol", "spanish", True), ("crane", "english", False)]
+
+    summary, all_games = async_client.run(async_client.get_admin_dashboard())
+    assert summary["total_games"] == 3
+    assert [game["username"] for game in all_games] == ["ana", "ana", "luis"]
+
+
+def test_one_client_per_event_loop(local_backend):
+    async def client_pair():
+        return async_client.get_async_client(), async_client.get_async_client()
+
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first_a, first_b = first_loop.run_until_complete(client_pair())
+        first_loop.close()
+        second, _ = second_loop.run_until_complete(client_pair())
+    finally:
+        first_loop.close()
+        second_loop.close()
+
+    assert first_a is first_b
+    assert second is not first_a
+    # Al pedir el de un bucle nuevo se sueltan los de bucles ya cerrados
+    assert first_loop not in async_client._async_clients
+    assert second_loop in async_client._async_clients
+
+
+def test_run_closes_the_loop_client(local_backend):
+    async def use_client():
+        async_client.get_async_client()
+        return len(async_client._async_clients)
+
+    assert async_client.run(use_client()) == 1
+    assert len(async_client._async_clients) == 0
+
+
+def test_supabase_clients_are_not_shared_between_loops(monkeypatch):
+    monkeypatch.setenv("WORDLE_BACKEND", "supabase")
+    monkeypatch.setenv("SUPABASE_URL", "http://127.0.0.1:9")
+    monkeypatch.setenv("SUPABASE_KEY", "clave")
+
+    async def http_client():
+        return async_client.get_async_client().session
+
+    first = asyncio.run(http_client())
+    second = asyncio.run(http_client())
+    assert first is not second
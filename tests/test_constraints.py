@@ -0,0 +1,51 @@
+import random
+
+from engine.constraints import CandidateFilter
+from engine.scoring import prepare_words, score_guess
+
+
+def make_words(seed, count=400):
+    rng = random.Random(seed)
+    return prepare_words("".join(rng.choice("AEILMNORST") for _ in range(5)) for _ in range(count))
+
+
+def test_feedback_keeps_exactly_the_consistent_words():
+    words = make_words(1)
+    rng = random.Random(2)
+    for _ in range(30):
+        answer = rng.choice(words)
+        candidates = CandidateFilter(words)
+        expected = list(words)
+        for guess in rng.sample(words, 4):
+            pattern = score_guess(guess, answer)
+            candidates.add_feedback(guess, pattern)
+            expected = [word for word in expected if score_guess(guess, word) == pattern]
+            assert candidates.remaining_words == expected
+            assert answer in candidates.remaining_words
+
+
+def test_repeated_letters_bound_counts():
+    words = ["LLAMA", "HELLO", "LOCAL", "ALLOW", "HOTEL"]
+    candidates = CandidateFilter(words)
+    # Una sola L presente y la segunda ausente: la respuesta tiene exactamente una L
+    candidates.add_feedback("LLAMA", score_guess("LLAMA", "HOTEL"))
+    assert candidates.remaining_words == ["HOTEL"]
+
+
+def test_letter_hint_and_reset():
+    words = ["MUNDO", "MANGO", "TANGO", "TURNO"]
+    candidates = CandidateFilter(words)
+    candidates.add_letter_hint(0, "T")
+    assert candidates.remaining_words == ["TANGO", "TURNO"]
+
+    candidates.add_letter_hint(1, "X")
+    assert len(candidates) == 0
+
+    candidates.reset()
+    assert candidates.remaining_words == words
+
+
+def test_letter_outside_the_list_empties_the_filter():
+    candidates = CandidateFilter(["MUNDO", "MANGO"])
+    candidates.add_feedback("ZZZZZ", score_guess("ZZZZZ", "ZORRO"))
+    assert candidates.remaining_words == []
@@ -0,0 +1,35 @@
+from engine.dictionary import WordIndex, build_guess_index, guess_words_path
+
+
+def test_membership():
+    index = WordIndex(["HOLAS", "mundo", "Perro", "GATOS", "GATOS"])
+
+    assert len(index) == 4
+    for word in ("HOLAS", "holas", "MUNDO", "perro"):
+        assert word in index
+    for word in ("HOLA", "MUNDOS", "GATOZ", "QUESO", "", None, 12345):
+        assert word not in index
+
+
+def test_words_of_other_lengths_are_ignored():
+    index = WordIndex(["SOL", "LUNAS", "ESTRELLA"])
+    assert len(index) == 1
+    assert "SOL" not in index
+    assert "LUNAS" in index
+
+
+def test_stats():
+    stats = WordIndex(["HOLAS", "MUNDO"]).stats()
+    assert stats["words"] == 2
+    assert stats["memory_bytes"] > 0
+
+
+def test_guess_index_adds_the_full_dictionary(tmp_path, monkeypatch):
+    monkeypatch.setenv("WORDLE_DATA_DIR", str(tmp_path))
+    guess_words_path("spanish").write_text("queso\nPERRO\n\nzorro\n", encoding="utf-8")
+
+    index = build_guess_index("spanish", ["HOLAS", "MUNDO"])
+    assert len(index) == 5
+    for word in ("HOLAS", "QUESO", "ZORRO"):
+        assert word in index
+    assert "ZORRO" not in build_guess_index("english", ["HOLAS", "MUNDO"])
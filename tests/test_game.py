@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from database import supabase_client as db
+
+
+@pytest.fixture
+def game_factory(qapp, local_backend, monkeypatch):
+    from ui.game import WordleGame
+
+    monkeypatch.setattr(WordleGame, "show_message", lambda self, title, message: None)
+    games = []
+
+    def make(language="spanish"):
+        game = WordleGame(1, False, language)
+        games.append(game)
+        return game
+
+    yield make
+    for game in games:
+        game.close()
+        game.deleteLater()
+    qapp.processEvents()
+
+
+def test_word_list_is_loaded_in_the_background(game_factory, wait_until, monkeypatch):
+    release = threading.Event()
+    calling_threads = []
+
+    def slow_words(language_name):
+        calling_threads.append(threading.current_thread())
+        release.wait(5)
+        return ["ARBOL", "BARCO", "CASAS"]
+
+    monkeypatch.setattr(db, "get_words_for_game", slow_words)
+    game = game_factory()
+
+    assert not game.words_ready
+    assert not game.keyboard_widget.isEnabled()
+    game.key_pressed("A")
+    assert game.current_col == 0
+
+    release.set()
+    assert wait_until(lambda: game.words_ready)
+    assert calling_threads and calling_threads[0] is not threading.main_thread()
+    assert game.keyboard_widget.isEnabled()
+    assert game.target_word in ("ARBOL", "BARCO", "CASAS")
+    game.key_pressed("A")
+    assert game.current_col == 1
+
+
+def test_failed_load_falls_back_to_the_default_words(game_factory, wait_until, monkeypatch):
+    from PyQt6.QtWidgets import QMessageBox
+
+    def broken(language_name):
+        raise ConnectionError("sin conexión")
+
+    monkeypatch.setattr(db, "get_words_for_game", broken)
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args: None)
+    game = game_factory()
+
+    assert wait_until(lambda: game.words_ready)
+    assert game.using_default_words
+    assert game.target_word in game.valid_words
+
+
+def test_guesses_are_checked_against_the_full_dictionary(game_factory, wait_until, monkeypatch):
+    from engine.dictionary import guess_words_path
+
+    guess_words_path("spanish").write_text("QUESO\n", encoding="utf-8")
+    monkeypatch.setattr(db, "get_words_for_game", lambda language_name: ["ARBOL", "BARCO"])
+    game = game_factory()
+    assert wait_until(lambda: game.words_ready)
+
+    assert game.target_word in ("ARBOL", "BARCO")
+    assert "QUESO" in game.guess_index
+    assert "QUESO" not in game.valid_words
+
+    for letter in "QUESO":
+        game.key_pressed(letter)
+    game.key_pressed("ENTER")
+    assert game.current_row == 1
@@ -0,0 +1,57 @@
+import pytest
+
+from database import supabase_client as db
+
+ENV_VARS = ("SUPABASE_MAX_CONNECTIONS", "SUPABASE_KEEPALIVE_EXPIRY", "SUPABASE_HTTP2", "SUPABASE_TIMEOUT",
+            "SUPABASE_CONNECT_TIMEOUT")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_defaults():
+    settings = db.get_http_settings(http2=False)
+
+    assert settings["limits"].max_connections == db.HTTP_MAX_CONNECTIONS
+    assert settings["limits"].max_keepalive_connections == db.HTTP_MAX_CONNECTIONS
+    assert settings["limits"].keepalive_expiry == db.HTTP_KEEPALIVE_EXPIRY
+    assert settings["timeout"].read == db.HTTP_TIMEOUT
+    assert settings["timeout"].connect == db.HTTP_CONNECT_TIMEOUT
+    assert settings["http2"] is False
+
+
+def test_environment_overrides_defaults_and_arguments_override_both(monkeypatch):
+    monkeypatch.setenv("SUPABASE_MAX_CONNECTIONS", "3")
+    monkeypatch.setenv("SUPABASE_KEEPALIVE_EXPIRY", "15")
+    monkeypatch.setenv("SUPABASE_TIMEOUT", "2.5")
+    monkeypatch.setenv("SUPABASE_CONNECT_TIMEOUT", "1")
+
+    settings = db.get_http_settings(http2=False)
+    assert settings["limits"].max_connections == 3
+    assert settings["limits"].keepalive_expiry == 15.0
+    assert settings["timeout"].read == 2.5
+    assert settings["timeout"].connect == 1.0
+
+    settings = db.get_http_settings(max_connections=7, keepalive_expiry=30, timeout=4, connect_timeout=2,
+                                    http2=False)
+    assert settings["limits"].max_connections == 7
+    assert settings["limits"].keepalive_expiry == 30
+    assert settings["timeout"].read == 4
+    assert settings["timeout"].connect == 2
+
+
+@pytest.mark.parametrize("value, h2_installed, expected", [
+    ("auto", True, True),
+    ("auto", False, False),
+    ("1", True, True),
+    ("0", True, False),
+    # Pedido pero sin el paquete 'h2': se vuelve a HTTP/1.1
+    ("true", False, False),
+])
+def test_http2_switch(monkeypatch, value, h2_installed, expected):
+    monkeypatch.setenv("SUPABASE_HTTP2", value)
+    monkeypatch.setattr(db, "_h2_available", lambda: h2_installed)
+    assert db.get_http_settings()["http2"] is expected
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from engine import matrix_cache
+from engine.scoring import build_pattern_matrix
+
+SPANISH = ["ARBOL", "BARCO", "CASAS"]
+ENGLISH = ["APPLE", "BREAD", "CRANE"]
+
+
+@pytest.fixture(autouse=True)
+def matrices_dir(tmp_path, monkeypatch):
+    """Matrices en un directorio temporal y sin las abiertas por otras pruebas."""
+    monkeypatch.setenv("WORDLE_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(matrix_cache, "_open_matrices", {})
+    monkeypatch.setattr(matrix_cache, "_key_locks", {})
+    return tmp_path / "matrices"
+
+
+def test_matrix_is_built_once_and_reused():
+    first = matrix_cache.load_pattern_matrix("spanish", SPANISH)
+    assert first.pattern("ARBOL", "ARBOL") == 242
+    assert matrix_cache.load_pattern_matrix("spanish", list(SPANISH)) is first
+
+
+def test_cached_language_is_served_while_another_is_built(monkeypatch):
+    spanish = matrix_cache.load_pattern_matrix("spanish", SPANISH)
+
+    started, release = threading.Event(), threading.Event()
+
+    def slow_build(guesses, answers):
+        started.set()
+        release.wait(5)
+        return build_pattern_matrix(guesses, answers)
+
+    monkeypatch.setattr(matrix_cache, "build_pattern_matrix", slow_build)
+    builder = threading.Thread(target=matrix_cache.load_pattern_matrix, args=("english", ENGLISH))
+    builder.start()
+    try:
+        assert started.wait(5)
+        served = []
+        reader = threading.Thread(target=lambda: served.append(matrix_cache.load_pattern_matrix("spanish", SPANISH)))
+        reader.start()
+        reader.join(1)
+        assert served == [spanish]
+    finally:
+        release.set()
+        builder.join(5)
+
+
+def test_concurrent_loads_of_the_same_list_build_it_once(monkeypatch):
+    builds = []
+
+    def counting_build(guesses, answers):
+        builds.append(guesses)
+        return build_pattern_matrix(guesses, answers)
+
+    monkeypatch.setattr(matrix_cache, "build_pattern_matrix", counting_build)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(matrix_cache.load_pattern_matrix("spanish", SPANISH)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(builds) == 1
+    assert len({id(result) for result in results}) == 1
+
+
+def test_new_word_list_replaces_the_previous_one(matrices_dir):
+    matrix_cache.load_pattern_matrix("spanish", SPANISH)
+    matrix_cache.load_pattern_matrix("spanish", SPANISH + ["DEDOS"])
+
+    assert len(matrix_cache._open_matrices) == 1
+    assert len(list(matrices_dir.glob("spanish-*.npy"))) == 1
+    assert not matrix_cache._key_locks
+
+
+def test_open_matrices_are_bounded(monkeypatch):
+    monkeypatch.setattr(matrix_cache, "MAX_OPEN_MATRICES", 2)
+    first = matrix_cache.load_pattern_matrix("spanish", SPANISH)
+    matrix_cache.load_pattern_matrix("english", ENGLISH)
+    assert matrix_cache.load_pattern_matrix("spanish", SPANISH) is first
+    matrix_cache.load_pattern_matrix("catalan", ["GATOS", "PERRO"])
+
+    assert [language for language, _ in matrix_cache._open_matrices] == ["spanish", "catalan"]
+
+
+def test_fallback_lists_are_not_written(matrices_dir):
+    matrix_cache.load_pattern_matrix("spanish", SPANISH, persist=False)
+    assert not list(matrices_dir.glob("*.npy"))
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+COLUMNS = [("Fecha", "created_at"), ("Palabra", "word"), ("Intentos", "attempts")]
+
+
+@pytest.fixture
+def model(qapp):
+    from ui.models import GameHistoryModel
+    return GameHistoryModel(COLUMNS)
+
+
+def make_games(count, seed):
+    rng = random.Random(seed)
+    # Pocas fechas distintas para que haya empates
+    return [{"created_at": f"2024-01-{rng.randint(1, 9):02d}", "word": f"W{seed}-{i}",
+             "attempts": rng.randint(1, 6)} for i in range(count)]
+
+
+def expected_words(games, field, descending):
+    return [game["word"] for game in sorted(games, key=lambda game: game[field], reverse=descending)]
+
+
+def view_words(model):
+    return [game["word"] for game in model.games()]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 200])
+def test_chunked_append_matches_a_full_sort(model, chunk_size):
+    games = make_games(400, seed=chunk_size)
+    for i in range(0, len(games), chunk_size):
+        model.append_games(games[i:i + chunk_size])
+
+    assert model.rowCount() == len(games)
+    assert view_words(model) == expected_words(games, "created_at", descending=True)
+
+
+def test_append_keeps_the_chosen_column_order(model):
+    from PyQt6.QtCore import Qt
+
+    games = make_games(50, seed=1)
+    model.append_games(games[:20])
+    model.sort(2, Qt.SortOrder.AscendingOrder)
+    model.append_games(games[20:])
+
+    assert view_words(model) == expected_words(games, "attempts", descending=False)
+    assert model.data(model.index(0, 2)) == str(min(game["attempts"] for game in games))
+
+
+def test_few_runs_are_announced_as_row_insertions(model):
+    inserted, relayouts = [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.layoutChanged.connect(lambda *args: relayouts.append(True))
+
+    model.append_games([{"created_at": "2024-01-05", "word": "B"}, {"created_at": "2024-01-01", "word": "D"}])
+    model.append_games([{"created_at": "2024-01-09", "word": "A"}, {"created_at": "2024-01-03", "word": "C"}])
+
+    assert view_words(model) == ["A", "B", "C", "D"]
+    assert inserted == [(0, 1), (0, 0), (2, 2)]
+    assert not relayouts
+
+
+def test_persistent_indexes_follow_their_rows(model):
+    from PyQt6.QtCore import QPersistentModelIndex
+
+    model.append_games([{"created_at": f"2024-01-01T{i:03d}", "word": f"E{i}"} for i in range(0, 100, 2)])
+    current = QPersistentModelIndex(model.index(10, 1))
+    word = current.data()
+
+    # Pocas filas nuevas delante: se insertan sin reordenar
+    model.append_games([{"created_at": "2024-12-31", "word": "NUEVA"}])
+    assert (current.row(), current.data()) == (11, word)
+
+    # Un bloque que cae en todos los huecos se reordena con un solo cambio de diseño
+    relayouts = []
+    model.layoutChanged.connect(lambda *args: relayouts.append(True))
+    model.append_games([{"created_at": f"2024-01-01T{i:03d}", "word": f"O{i}"} for i in range(1, 100, 2)])
+    assert relayouts
+    assert current.data() == word
+    assert view_words(model)[current.row()] == word
+
+    model.sort(1)
+    assert current.data() == word
+    assert current.row() == view_words(model).index(word)
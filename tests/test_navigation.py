@@ -0,0 +1,102 @@
+import pytest
+
+
+@pytest.fixture
+def navigator(qapp):
+    from ui.navigation import Navigator
+
+    navigator = Navigator()
+    yield navigator
+    for name in list(navigator.screens):
+        navigator.dispose_screen(name)
+    navigator.close()
+    navigator.deleteLater()
+    flush_deleted(qapp)
+
+
+def flush_deleted(app):
+    from PyQt6.QtCore import QEvent
+
+    app.processEvents()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def is_deleted(widget):
+    from PyQt6 import sip
+    return sip.isdeleted(widget)
+
+
+def screen(title="Pantalla"):
+    from PyQt6.QtWidgets import QMainWindow
+
+    widget = QMainWindow()
+    widget.setWindowTitle(title)
+    return widget
+
+
+def test_uncached_screens_are_destroyed_when_left(qapp, navigator):
+    rules = navigator.show_screen("rules", screen("Reglas"))
+    home = navigator.show_screen("home", screen("Inicio"))
+    flush_deleted(qapp)
+
+    assert is_deleted(rules)
+    assert "rules" not in navigator.screens
+    assert navigator.stack.count() == 1
+
+    navigator.show_screen("statistics", screen("Estadísticas"))
+    flush_deleted(qapp)
+    assert not is_deleted(home)
+    assert navigator.screens["home"] is home
+
+
+def test_window_title_follows_the_current_screen(navigator):
+    current = navigator.show_screen("home", screen("Inicio"))
+    assert navigator.windowTitle() == "Inicio"
+
+    current.setWindowTitle("Inicio - ana")
+    assert navigator.windowTitle() == "Inicio - ana"
+
+    navigator.show_screen("rules", screen("Reglas"))
+    current.setWindowTitle("otro")
+    assert navigator.windowTitle() == "Reglas"
+
+
+def test_home_is_reused_only_for_the_same_user_and_language(qapp, navigator):
+    home = navigator.show_home(1, False, "spanish")
+    navigator.show_screen("rules", screen())
+    assert navigator.show_home(1, False, "spanish") is home
+
+    english = navigator.show_home(1, False, "english")
+    flush_deleted(qapp)
+    assert english is not home
+    assert is_deleted(home)
+
+
+def test_logout_keeps_only_the_login_screen(qapp, navigator):
+    home = navigator.show_home(1, False, "spanish")
+    navigator.show_screen("statistics", screen())
+    navigator.logout()
+    flush_deleted(qapp)
+
+    assert list(navigator.screens) == ["login"]
+    assert navigator.current_name == "login"
+    assert is_deleted(home)
+
+
+def test_leaving_a_game_cancels_its_background_loads(qapp, navigator, local_backend, monkeypatch):
+    import threading
+    from database import supabase_client as db
+
+    release = threading.Event()
+    monkeypatch.setattr(db, "get_words_for_game", lambda language_name: release.wait(5) and ["ARBOL"])
+    try:
+        game = navigator.start_game(1, False, "spanish")
+        task = game.words_task
+        navigator.show_home(1, False, "spanish")
+
+        assert task.cancelled
+        assert "game" not in navigator.screens
+    finally:
+        release.set()
+    flush_deleted(qapp)
+    assert is_deleted(game)
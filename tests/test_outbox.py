@@ -0,0 +1,153 @@
+import json
+import sqlite3
+
+import pytest
+
+from database import outbox as outbox_module
+from database.outbox import GameOutbox, is_transient_error
+from database.supabase_client import save_game_results
+
+
+def seed(client):
+    client.table("usuarios").insert({"nombre_usuario": "ana", "contrasena": "x", "tipo_usuario_id": 1}).execute()
+    client.table("palabras").insert([{"palabra": "mundo", "idioma_id": 2}, {"palabra": "world", "idioma_id": 1}]).execute()
+
+
+def test_pending_games_are_sent_after_a_restart(local_backend, tmp_path):
+    seed(local_backend)
+    journal = tmp_path / "partidas.jsonl"
+
+    def offline(batch):
+        raise ConnectionError("sin conexión")
+
+    # Primera sesión: el envío falla, las partidas quedan en el diario
+    first = GameOutbox(journal)
+    first._send = offline
+    first.record(1, "MUNDO", "spanish", 3, 12.5, True, 0)
+    first.record(1, "WORLD", "english", 6, 40.0, False, 1)
+    assert first.pending_count == 2
+    assert len(journal.read_text(encoding="utf-8").splitlines()) == 2
+
+    # Segunda sesión sobre el mismo diario: se retoman y se envían
+    second = GameOutbox(journal)
+    assert second.pending_count == 2
+    assert second.flush(timeout=10)
+
+    rows = local_backend.table("partidas").select("usuario_id, intentos, adivinada, hints_used").order("id").execute()
+    assert rows.data == [
+        {"usuario_id": 1, "intentos": 3, "adivinada": True, "hints_used": 0},
+        {"usuario_id": 1, "intentos": 6, "adivinada": False, "hints_used": 1},
+    ]
+    assert second.pending_count == 0
+    assert journal.read_text(encoding="utf-8") == ""
+
+
+def test_truncated_journal_line_is_skipped(local_backend, tmp_path):
+    seed(local_backend)
+    journal = tmp_path / "partidas.jsonl"
+    entry = {"user_id": 1, "word": "MUNDO", "language": "spanish", "attempts": 2, "time_taken": 5.0, "win": True,
+             "hints_used": 0, "created_at": "2024-05-01T10:00:00+00:00"}
+    journal.write_text(json.dumps(entry) + "\n" + '{"user_id": 1, "wo', encoding="utf-8")
+
+    outbox = GameOutbox(journal)
+    assert outbox.flush(timeout=10)
+
+    rows = local_backend.table("partidas").select("created_at").execute()
+    assert rows.data == [{"created_at": entry["created_at"]}]
+
+
+def test_invalid_entries_are_quarantined(local_backend, tmp_path):
+    seed(local_backend)
+    journal = tmp_path / "partidas.jsonl"
+
+    outbox = GameOutbox(journal)
+    outbox.record(1, "MUNDO", "klingon", 3, 12.5, True, 0)
+    outbox.record(1, "MUNDO", "spanish", 3, 12.5, True, 0)
+    assert outbox.flush(timeout=10)
+
+    assert local_backend.table("partidas").select("id", count="exact").execute().count == 1
+    quarantined = [json.loads(line) for line in outbox.quarantine_path.read_text(encoding="utf-8").splitlines()]
+    assert [item["entry"]["language"] for item in quarantined] == ["klingon"]
+    assert "klingon" in quarantined[0]["error"]
+    assert outbox.pending_count == 0
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(outbox_module, "RETRY_INITIAL_DELAY", 0.01)
+
+
+def test_server_rejection_is_isolated_and_the_rest_is_sent(local_backend, tmp_path, fast_retries):
+    seed(local_backend)
+
+    outbox = GameOutbox(tmp_path / "partidas.jsonl")
+    outbox.record(1, "MUNDO", "spanish", 1, 1.0, True, 0)
+    # Usuario inexistente: la clave foránea hace que la base rechace la fila (y con ella el lote)
+    outbox.record(99, "MUNDO", "spanish", 2, 2.0, True, 0)
+    outbox.record(1, "WORLD", "english", 3, 3.0, False, 0)
+    assert outbox.flush(timeout=10)
+
+    rows = local_backend.table("partidas").select("intentos").order("intentos").execute()
+    assert rows.data == [{"intentos": 1}, {"intentos": 3}]
+    quarantined = [json.loads(line) for line in outbox.quarantine_path.read_text(encoding="utf-8").splitlines()]
+    assert [item["entry"]["user_id"] for item in quarantined] == [99]
+
+
+def test_lost_response_does_not_duplicate_rows(local_backend, tmp_path, monkeypatch, fast_retries):
+    seed(local_backend)
+    calls = []
+
+    def save_then_lose_response(rows):
+        calls.append(len(rows))
+        result = save_game_results(rows)
+        if len(calls) == 1:
+            raise TimeoutError("la respuesta no llegó")
+        return result
+
+    monkeypatch.setattr(outbox_module, "save_game_results", save_then_lose_response)
+
+    # Las dos partidas en el diario antes de arrancar, para que viajen en el mismo lote
+    journal = tmp_path / "partidas.jsonl"
+    journal.write_text("".join(json.dumps({
+        "client_id": f"partida-{i}", "user_id": 1, "word": word, "language": language, "attempts": 3,
+        "time_taken": 1.0, "win": True, "hints_used": 0, "created_at": "2024-05-01T10:00:00+00:00"}) + "\n"
+        for i, (word, language) in enumerate([("MUNDO", "spanish"), ("WORLD", "english")])), encoding="utf-8")
+
+    outbox = GameOutbox(journal)
+    assert outbox.flush(timeout=10)
+
+    # El lote se reenvió completo, pero el upsert por 'client_id' no crea filas nuevas
+    assert calls == [2, 2]
+    assert local_backend.table("partidas").select("id", count="exact").execute().count == 2
+    assert not outbox.quarantine_path.exists()
+
+
+def test_legacy_journal_entries_get_a_stable_client_id(local_backend, tmp_path, monkeypatch):
+    seed(local_backend)
+    journal = tmp_path / "partidas.jsonl"
+    entry = {"user_id": 1, "word": "MUNDO", "language": "spanish", "attempts": 2, "time_taken": 5.0, "win": True,
+             "hints_used": 0, "created_at": "2024-05-01T10:00:00+00:00"}
+    journal.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    monkeypatch.setattr(GameOutbox, "_run", lambda self: None)
+
+    first = GameOutbox(journal)
+    client_id = first._pending[0]["client_id"]
+    assert json.loads(journal.read_text(encoding="utf-8"))["client_id"] == client_id
+    assert GameOutbox(journal)._pending[0]["client_id"] == client_id
+
+
+@pytest.mark.parametrize("error, transient", [
+    (ConnectionError("sin red"), True),
+    (TimeoutError("tiempo agotado"), True),
+    (sqlite3.OperationalError("database is locked"), True),
+    (sqlite3.OperationalError("no such column: client_id"), False),
+    (sqlite3.IntegrityError("FOREIGN KEY constraint failed"), False),
+    (ValueError("Idioma 'klingon' no encontrado"), False),
+])
+def test_transient_errors(error, transient):
+    assert is_transient_error(error) is transient
+
+
+def test_httpx_transport_errors_are_transient():
+    httpx = pytest.importorskip("httpx")
+    assert is_transient_error(httpx.ConnectTimeout("tiempo agotado"))
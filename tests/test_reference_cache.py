@@ -0,0 +1,59 @@
+from database import supabase_client as db
+from database.supabase_client import _ReferenceCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_the_ttl():
+    clock = FakeClock()
+    cache = _ReferenceCache(60, clock=clock)
+    cache.set("idiomas", "all", {1: "english"})
+
+    clock.now += 59.9
+    assert cache.get("idiomas", "all") == {1: "english"}
+    clock.now += 0.1
+    assert cache.get("idiomas", "all") is None
+
+
+def test_invalidate_one_table_or_all():
+    cache = _ReferenceCache(60, clock=FakeClock())
+    cache.set("idiomas", "all", {1: "english"})
+    cache.set("palabras", ("arbol", 2), 7)
+
+    cache.invalidate("palabras")
+    assert cache.get("palabras", ("arbol", 2)) is None
+    assert cache.get("idiomas", "all") == {1: "english"}
+
+    cache.invalidate()
+    assert cache.get("idiomas", "all") is None
+
+
+def test_idiomas_are_served_from_the_cache_until_it_is_invalidated(local_backend, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(db, "_reference_cache", _ReferenceCache(db.REFERENCE_CACHE_TTL, clock=clock))
+    assert db._get_idiomas() == {1: "english", 2: "spanish"}
+
+    local_backend.table("idiomas").insert({"id": 3, "idioma": "català"}).execute()
+    assert 3 not in db._get_idiomas()
+
+    db.invalidate_reference_cache("idiomas")
+    assert db._get_idiomas()[3] == "català"
+
+    local_backend.table("idiomas").insert({"id": 4, "idioma": "português"}).execute()
+    clock.now += db.REFERENCE_CACHE_TTL
+    assert db._get_idiomas()[4] == "português"
+
+
+def test_word_ids_are_cached(local_backend, monkeypatch):
+    monkeypatch.setattr(db, "_reference_cache", _ReferenceCache(db.REFERENCE_CACHE_TTL, clock=FakeClock()))
+    local_backend.table("palabras").insert({"id": 5, "palabra": "arbol", "idioma_id": 2}).execute()
+    assert db._get_palabra_id("ARBOL", 2) == 5
+
+    local_backend.table("palabras").update({"palabra": "barco"}).eq("id", 5).execute()
+    assert db._get_palabra_id("arbol", 2) == 5
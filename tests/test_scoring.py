@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from engine.scoring import build_pattern_matrix, decode_pattern, prepare_words, score_guess, solved_pattern
+
+
+def reference_states(guess, target):
+    """Evaluación original de ui/game.py (WordleGame.evaluate_guess) sin los widgets."""
+    states = ["absent"] * len(guess)
+    remaining_letters = {}
+    for letter in target:
+        remaining_letters[letter] = remaining_letters.get(letter, 0) + 1
+
+    for col, letter in enumerate(guess):
+        if letter == target[col]:
+            states[col] = "correct"
+            remaining_letters[letter] -= 1
+
+    for col, letter in enumerate(guess):
+        if letter == target[col]:
+            continue
+        if letter in remaining_letters and remaining_letters[letter] > 0:
+            states[col] = "present"
+            remaining_letters[letter] -= 1
+
+    return states
+
+
+REPEATED_LETTERS = [
+    ("LLAMA", "HELLO"),
+    ("HELLO", "LLAMA"),
+    ("SPEED", "ABIDE"),
+    ("EERIE", "THREE"),
+    ("ABBEY", "BABES"),
+    ("PAPAS", "SAPPY"),
+    ("LLLLL", "HELLO"),
+    ("HOLAA", "AHORA"),
+]
+
+
+@pytest.mark.parametrize("guess, target", REPEATED_LETTERS)
+def test_score_guess_matches_original_with_repeated_letters(guess, target):
+    assert decode_pattern(score_guess(guess, target)) == reference_states(guess, target)
+
+
+def test_score_guess_matches_original_on_random_words():
+    rng = random.Random(7)
+    # Alfabeto chico para que abunden las letras repetidas
+    words = ["".join(rng.choice("ABCDE") for _ in range(5)) for _ in range(300)]
+    for guess, target in zip(words, reversed(words)):
+        assert decode_pattern(score_guess(guess, target)) == reference_states(guess, target)
+
+
+def test_solved_pattern():
+    assert score_guess("MUNDO", "MUNDO") == solved_pattern()
+    assert decode_pattern(solved_pattern()) == ["correct"] * 5
+
+
+def test_build_pattern_matrix_matches_score_guess():
+    rng = random.Random(3)
+    words = prepare_words("".join(rng.choice("AEILNORST") for _ in range(5)) for _ in range(120))
+    matrix = build_pattern_matrix(words, words)
+
+    assert matrix.shape == (len(words), len(words))
+    for g, guess in enumerate(words):
+        for a, answer in enumerate(words):
+            assert matrix[g, a] == score_guess(guess, answer)
+
+
+def test_build_pattern_matrix_empty():
+    assert build_pattern_matrix([], ["HOLAS"]).shape == (0, 1)
+
+
+def test_prepare_words():
+    assert prepare_words(["hola", "mundo", "MUNDO", "jazzy", "rapido"], length=5) == ["MUNDO", "JAZZY"]
@@ -0,0 +1,151 @@
+import sqlite3
+
+import pytest
+
+from database import sqlite_backend
+from database.sqlite_backend import SQLiteClient
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = SQLiteClient(tmp_path / "wordle.db")
+    client.table("palabras").insert([{"palabra": word, "idioma_id": 2}
+                                     for word in ("arbol", "barco", "casas", "dedos", "enano")]).execute()
+    return client
+
+
+def words(response):
+    return [row["palabra"] for row in response.data]
+
+
+def test_insert_returns_rows_with_ids(client):
+    result = client.table("palabras").insert({"palabra": "fuego", "idioma_id": 2}).execute()
+    assert result.data == [{"id": 6, "palabra": "fuego", "idioma_id": 2}]
+
+
+@pytest.mark.parametrize("method, value, expected", [
+    ("eq", 3, ["casas"]),
+    ("neq", 3, ["arbol", "barco", "dedos", "enano"]),
+    ("gt", 3, ["dedos", "enano"]),
+    ("gte", 3, ["casas", "dedos", "enano"]),
+    ("lt", 3, ["arbol", "barco"]),
+    ("lte", 3, ["arbol", "barco", "casas"]),
+])
+def test_comparison_filters(client, method, value, expected):
+    query = getattr(client.table("palabras").select("palabra"), method)("id", value)
+    assert words(query.order("id").execute()) == expected
+
+
+def test_in_filter(client):
+    assert words(client.table("palabras").select("palabra").in_("id", [5, 1, 9]).order("id").execute()) == [
+        "arbol", "enano"]
+    assert client.table("palabras").select("palabra").in_("id", []).execute().data == []
+
+
+def test_filters_are_combined_with_and(client):
+    query = client.table("palabras").select("palabra").gt("id", 1).lt("id", 5).neq("palabra", "casas")
+    assert words(query.order("id").execute()) == ["barco", "dedos"]
+
+
+def test_order_and_limit(client):
+    assert words(client.table("palabras").select("palabra").order("id", desc=True).limit(2).execute()) == [
+        "enano", "dedos"]
+    assert words(client.table("palabras").select("palabra").order("idioma_id").order("palabra", desc=True)
+                 .limit(1).execute()) == ["enano"]
+
+
+def test_exact_count_ignores_limit(client):
+    result = client.table("palabras").select("id", count="exact").gte("id", 2).order("id", desc=True).limit(1).execute()
+    assert result.data == [{"id": 5}]
+    assert result.count == 4
+
+
+def test_aliases_and_embedded_resources(client):
+    client.table("usuarios").insert({"nombre_usuario": "admin", "contrasena": "x", "tipo_usuario_id": 2}).execute()
+
+    result = client.table("usuarios").select("nombre:nombre_usuario, tipo_usuario(es_administrador)").execute()
+    assert result.data == [{"nombre": "admin", "tipo_usuario": {"es_administrador": True}}]
+
+
+def test_update_applies_filters(client):
+    result = client.table("palabras").update({"palabra": "barca"}).eq("palabra", "barco").execute()
+    assert words(result) == ["barca"]
+    assert words(client.table("palabras").select("palabra").order("id").execute())[1] == "barca"
+
+
+def test_rpc_statistics_summary(client):
+    client.table("usuarios").insert({"nombre_usuario": "ana", "contrasena": "x", "tipo_usuario_id": 1}).execute()
+    client.table("partidas").insert([
+        {"usuario_id": 1, "palabra_id": 1, "adivinada": True, "intentos": 3, "time_taken": 10.0},
+        {"usuario_id": 1, "palabra_id": 2, "adivinada": False, "intentos": 6, "time_taken": 30.0},
+    ]).execute()
+
+    row = client.rpc("estadisticas_resumen", {"p_usuario_id": 1}).execute().data[0]
+    assert row == {"total_games": 2, "wins": 1, "english_games": 0, "spanish_games": 2,
+                   "total_time": 40.0, "total_attempts": 9}
+
+
+def test_invalid_identifiers_are_rejected(client):
+    with pytest.raises(ValueError):
+        client.table("palabras; drop table palabras").select("*").execute()
+    with pytest.raises(ValueError):
+        client.table("palabras").select("palabra").eq("id = 1 or 1", 1)
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_insert_and_update_with_and_without_returning(client, monkeypatch, returning):
+    monkeypatch.setattr(sqlite_backend, "HAS_RETURNING", returning)
+
+    inserted = client.table("palabras").insert([{"palabra": "fuego", "idioma_id": 2},
+                                                {"palabra": "gatos", "idioma_id": 2}]).execute()
+    assert inserted.data == [{"id": 6, "palabra": "fuego", "idioma_id": 2}, {"id": 7, "palabra": "gatos", "idioma_id": 2}]
+
+    # El filtro deja de cumplirse después de actualizar: igual se devuelven las filas cambiadas
+    updated = client.table("palabras").update({"palabra": "fuegos"}).eq("palabra", "fuego").execute()
+    assert updated.data == [{"id": 6, "palabra": "fuegos", "idioma_id": 2}]
+
+
+def test_duplicate_words_are_accepted_like_supabase(client):
+    client.table("palabras").insert({"palabra": "arbol", "idioma_id": 2}).execute()
+    assert client.table("palabras").select("id", count="exact").eq("palabra", "arbol").execute().count == 2
+
+
+def test_import_words_skips_existing_words(client, tmp_path):
+    words_file = tmp_path / "palabras.txt"
+    words_file.write_text("ARBOL\nfuego\nfuego\n\ngatos\n", encoding="utf-8")
+
+    assert sqlite_backend.import_words(client, "spanish", words_file) == 2
+    assert sqlite_backend.import_words(client, "spanish", words_file) == 0
+    assert client.table("palabras").select("id", count="exact").eq("idioma_id", 2).execute().count == 7
+
+
+@pytest.mark.parametrize("returning", [True, False])
+def test_upsert_updates_or_ignores_on_conflict(client, monkeypatch, returning):
+    monkeypatch.setattr(sqlite_backend, "HAS_RETURNING", returning)
+    client.table("usuarios").insert({"nombre_usuario": "ana", "contrasena": "x", "tipo_usuario_id": 1}).execute()
+    row = {"usuario_id": 1, "palabra_id": 1, "adivinada": True, "intentos": 3, "client_id": "partida-1"}
+
+    first = client.table("partidas").upsert(row, on_conflict="client_id").execute()
+    again = client.table("partidas").upsert({**row, "intentos": 4}, on_conflict="client_id").execute()
+    ignored = client.table("partidas").upsert({**row, "intentos": 5}, on_conflict="client_id",
+                                              ignore_duplicates=True).execute()
+
+    assert first.data[0]["id"] == again.data[0]["id"]
+    assert again.data[0]["intentos"] == 4
+    assert ignored.data == []
+    assert client.table("partidas").select("intentos").execute().data == [{"intentos": 4}]
+
+
+def test_existing_databases_get_the_client_id_column(tmp_path):
+    path = tmp_path / "antigua.db"
+    connection = sqlite3.connect(path)
+    connection.executescript(sqlite_backend.SCHEMA.replace(",\n    client_id text", ""))
+    connection.close()
+
+    client = SQLiteClient(path)
+    client.table("usuarios").insert({"nombre_usuario": "ana", "contrasena": "x", "tipo_usuario_id": 1}).execute()
+    client.table("palabras").insert({"palabra": "arbol", "idioma_id": 2}).execute()
+    for _ in range(2):
+        client.table("partidas").upsert({"usuario_id": 1, "palabra_id": 1, "client_id": "partida-1"},
+                                        on_conflict="client_id").execute()
+    assert client.table("partidas").select("client_id").execute().data == [{"client_id": "partida-1"}]
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from engine.statistics import StatsAggregate
+
+
+def random_games(seed, count=60):
+    rng = random.Random(seed)
+    return [{"created_at": f"2024-01-01T00:00:{i:02d}", "win": rng.random() < 0.7, "attempts": rng.randint(1, 6),
+             "time_taken": rng.uniform(5, 90), "language": rng.choice(["english", "spanish", "es", "en"])}
+            for i in range(count)]
+
+
+def aggregate_of(games) -> StatsAggregate:
+    aggregate = StatsAggregate()
+    aggregate.add_games(games)
+    return aggregate
+
+
+def assert_same(left: StatsAggregate, right: StatsAggregate):
+    left, right = left.to_dict(), right.to_dict()
+    assert left.pop("total_time") == pytest.approx(right.pop("total_time"))
+    assert left == right
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_merge_equals_adding_in_order(seed):
+    games = random_games(seed)
+    whole = aggregate_of(games)
+    for split in (0, 1, 17, len(games) - 1, len(games)):
+        assert_same(aggregate_of(games[:split]).merge(aggregate_of(games[split:])), whole)
+
+
+def test_merge_streaks_across_the_boundary():
+    wins = [{"win": True, "attempts": 3}] * 3
+    loss = [{"win": False, "attempts": 6}]
+
+    merged = aggregate_of(loss + wins[:2]).merge(aggregate_of(wins + loss + wins[:1]))
+    assert merged.max_streak == 5
+    assert merged.current_streak == 1
+    assert merged.leading_streak == 0
+
+    all_wins = aggregate_of(wins).merge(aggregate_of(wins))
+    assert all_wins.leading_streak == all_wins.current_streak == all_wins.max_streak == 6
+
+
+def test_summary_and_histogram():
+    aggregate = aggregate_of([
+        {"win": True, "attempts": 2, "time_taken": 10, "language": "english"},
+        {"win": True, "attempts": 2, "time_taken": 20, "language": "spanish"},
+        {"win": False, "attempts": 6, "time_taken": 30, "language": "español"},
+    ])
+    summary = aggregate.summary()
+    assert summary["total_games"] == 3
+    assert summary["win_rate"] == pytest.approx(200 / 3)
+    assert summary["es_pct"] == pytest.approx(200 / 3)
+    assert summary["avg_time"] == pytest.approx(20)
+    assert aggregate.attempt_histogram[2] == 2
+    assert aggregate.attempt_histogram[6] == 0
+
+
+def test_dict_round_trip_keeps_last_id():
+    aggregate = aggregate_of(random_games(9))
+    aggregate.last_id = 42
+    assert StatsAggregate.from_dict(aggregate.to_dict()).to_dict() == aggregate.to_dict()
+
+
+def test_from_games_sorts_by_date():
+    games = random_games(4)
+    assert_same(StatsAggregate.from_games(list(reversed(games))), aggregate_of(games))
@@ -0,0 +1,148 @@
+import pytest
+
+from database.stats_snapshot import load_user_aggregate, load_user_snapshot, reconcile_user_aggregate, record_game_stats
+from engine.statistics import StatsAggregate
+
+
+def synced(partida_id, win=True, client_id=None, attempts=3):
+    return {"id": partida_id, "client_id": client_id, "created_at": f"2024-01-01T00:00:{partida_id:02d}",
+            "win": win, "attempts": attempts, "time_taken": 10.0, "language": "spanish"}
+
+
+@pytest.fixture
+def no_rebuild(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("no se esperaba reconstruir el agregado")
+
+    monkeypatch.setattr(StatsAggregate, "from_games", classmethod(fail))
+
+
+def test_local_games_are_not_counted_twice(local_backend, no_rebuild):
+    record_game_stats(1, True, 3, 10.0, "spanish", "local-1")
+    record_game_stats(1, False, 6, 10.0, "spanish", "local-2")
+
+    # La copia trae las dos partidas locales y una de otro equipo
+    snapshot = {"last_id": 3, "games": [synced(1, client_id="local-1"), synced(2, False, client_id="local-2"),
+                                        synced(3, client_id="otro-equipo")]}
+    aggregate = reconcile_user_aggregate(1, load_user_aggregate(1), snapshot)
+
+    assert aggregate.total_games == 3
+    assert aggregate.wins == 2
+    assert aggregate.current_streak == 1
+    assert aggregate.last_id == 3
+    assert aggregate.pending_client_ids == set()
+    assert load_user_aggregate(1).to_dict() == aggregate.to_dict()
+
+
+def test_only_games_after_last_id_are_visited(local_backend, no_rebuild):
+    aggregate = StatsAggregate()
+    aggregate.add_games([synced(1), synced(2)])
+    aggregate.last_id = 2
+
+    class Untouchable(dict):
+        def get(self, *args):
+            raise AssertionError("se recorrió una partida ya contada")
+
+    # La partida 2 se mira para saber dónde parar; la 1 ni siquiera se lee
+    snapshot = {"last_id": 4, "games": [Untouchable(synced(1)), synced(2), synced(3), synced(4, False)]}
+    aggregate = reconcile_user_aggregate(1, aggregate, snapshot)
+
+    assert (aggregate.total_games, aggregate.wins, aggregate.last_id) == (4, 3, 4)
+
+
+def test_games_still_pending_stay_counted(local_backend, no_rebuild):
+    record_game_stats(1, True, 3, 10.0, "spanish", "local-1")
+    snapshot = {"last_id": 7, "games": [synced(7, client_id="otro-equipo")]}
+
+    aggregate = reconcile_user_aggregate(1, load_user_aggregate(1), snapshot)
+    assert aggregate.total_games == 2
+    assert aggregate.pending_client_ids == {"local-1"}
+
+
+def test_inconsistent_aggregate_is_rebuilt_with_pending_games(local_backend):
+    from database.outbox import get_game_outbox
+
+    # Agregado de una versión anterior: contó partidas sin 'client_id'
+    record_game_stats(1, True, 3, 10.0, "spanish")
+    record_game_stats(1, True, 3, 10.0, "spanish")
+    outbox = get_game_outbox()
+    outbox._send = lambda batch: (_ for _ in ()).throw(ConnectionError("sin red"))
+    outbox.record(1, "MUNDO", "spanish", 4, 10.0, False, 0)
+
+    snapshot = {"last_id": 5, "games": [synced(5)]}
+    aggregate = reconcile_user_aggregate(1, load_user_aggregate(1), snapshot)
+
+    assert aggregate.total_games == 2
+    assert aggregate.wins == 1
+    assert aggregate.last_id == 5
+    assert len(aggregate.pending_client_ids) == 1
+
+
+def test_snapshot_without_ids_is_rebuilt(local_backend):
+    legacy_games = [{key: value for key, value in synced(i).items() if key not in ("id", "client_id")}
+                    for i in range(1, 4)]
+    aggregate = reconcile_user_aggregate(1, StatsAggregate(), {"last_id": 3, "games": legacy_games})
+    assert (aggregate.total_games, aggregate.last_id) == (3, 3)
+
+
+@pytest.fixture
+def played(local_backend):
+    local_backend.table("usuarios").insert({"id": 1, "nombre_usuario": "ana", "contrasena": "x"}).execute()
+    local_backend.table("palabras").insert([{"id": 1, "palabra": "arbol", "idioma_id": 2},
+                                            {"id": 2, "palabra": "crane", "idioma_id": 1}]).execute()
+
+    def play(palabra_id, win=True, created_at=None):
+        row = {"usuario_id": 1, "palabra_id": palabra_id, "adivinada": win, "intentos": 3, "time_taken": 10.0}
+        if created_at:
+            row["created_at"] = created_at
+        return local_backend.table("partidas").insert(row).execute().data[0]["id"]
+
+    return play
+
+
+def test_sync_downloads_only_games_after_the_last_id(played, monkeypatch):
+    from database import supabase_client as db
+
+    played(1)
+    played(2, win=False)
+    snapshot = db.sync_user_snapshot(1)
+    assert [game["word"] for game in snapshot["games"]] == ["arbol", "crane"]
+    assert snapshot["last_id"] == 2
+
+    # Llega desde la bandeja de salida con una fecha anterior a las ya vistas
+    played(1, created_at="2000-01-01T00:00:00+00:00")
+    cursors = []
+    iter_user_partidas = db._iter_user_partidas
+    monkeypatch.setattr(db, "_iter_user_partidas",
+                        lambda user_id, after_id=None: cursors.append(after_id) or iter_user_partidas(user_id, after_id))
+
+    snapshot = db.sync_user_snapshot(1)
+    assert cursors == [2]
+    assert [game["id"] for game in snapshot["games"]] == [1, 2, 3]
+    assert load_user_snapshot(1) == snapshot
+
+
+def test_failed_sync_keeps_the_cursor(played, monkeypatch):
+    from database import supabase_client as db
+
+    played(1)
+    db.sync_user_snapshot(1)
+    played(2)
+
+    def broken():
+        raise ConnectionError("sin conexión")
+
+    monkeypatch.setattr(db, "_get_idiomas", broken)
+    assert db.sync_user_snapshot(1)["last_id"] == 1
+    assert load_user_snapshot(1)["last_id"] == 1
+
+
+def test_snapshots_of_different_databases_are_kept_apart(played, tmp_path, monkeypatch):
+    from database import supabase_client as db
+
+    played(1)
+    db.sync_user_snapshot(1)
+    assert load_user_snapshot(1)["last_id"] == 1
+
+    monkeypatch.setenv("WORDLE_SQLITE_PATH", str(tmp_path / "otra.db"))
+    assert load_user_snapshot(1)["games"] == []
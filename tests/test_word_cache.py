@@ -0,0 +1,77 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from database import supabase_client as db
+from database.word_cache import load_cached_words
+
+
+@pytest.fixture
+def words(local_backend):
+    local_backend.table("palabras").insert([{"palabra": word, "idioma_id": 2}
+                                            for word in ("arbol", "barco", "casas")]).execute()
+    return local_backend
+
+
+def test_without_cache_the_database_is_queried(words):
+    assert db.get_words_for_game("spanish") == ["ARBOL", "BARCO", "CASAS"]
+    version, rows = load_cached_words("spanish")
+    assert version == [3, 3]
+    assert [row["palabra"] for row in rows] == ["arbol", "barco", "casas"]
+
+
+def test_cache_is_served_while_it_is_revalidated(words, monkeypatch):
+    db.get_words_for_game("spanish")
+    words.table("palabras").insert({"palabra": "dedos", "idioma_id": 2}).execute()
+
+    release = threading.Event()
+    get_version = db._get_words_version
+
+    def slow_version(idioma_id):
+        assert release.wait(10)
+        return get_version(idioma_id)
+
+    monkeypatch.setattr(db, "_get_words_version", slow_version)
+    futures = []
+    monkeypatch.setattr(db, "_revalidate_word_rows_later",
+                        lambda *args, later=db._revalidate_word_rows_later: futures.append(later(*args)))
+
+    # La versión todavía no se pudo consultar: se devuelve la copia local sin esperar
+    assert db.get_words_for_game("spanish") == ["ARBOL", "BARCO", "CASAS"]
+    # Con una revalidación en curso no se encola otra
+    db.get_words_for_game("spanish")
+    assert futures[1] is None
+
+    release.set()
+    futures[0].result(timeout=10)
+    assert db.get_words_for_game("spanish") == ["ARBOL", "BARCO", "CASAS", "DEDOS"]
+
+
+def test_failed_revalidation_keeps_the_cache(words, monkeypatch):
+    db.get_words_for_game("spanish")
+
+    def offline(idioma_id):
+        raise ConnectionError("sin red")
+
+    monkeypatch.setattr(db, "_get_words_version", offline)
+    future = db._revalidate_word_rows_later("spanish", *load_cached_words("spanish"))
+    future.result(timeout=10)
+    assert db.get_words_for_game("spanish") == ["ARBOL", "BARCO", "CASAS"]
+
+
+def test_data_layer_does_not_import_qt(words):
+    # Con la caché ya guardada, el proceso nuevo la sirve y revalida en segundo plano
+    db.get_words_for_game("spanish")
+    code = ("import sys; from database import supabase_client as db; "
+            "db.get_words_for_game('spanish'); db._word_revalidation_executor.shutdown(wait=True); "
+            "print(any(name.startswith('PyQt6') for name in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_word_rows_are_normalized():
+    rows = [{"id": 1, "palabra": "arbol"}, {"id": 2, "palabra": "sol"}, {"id": 3, "palabra": "Barco"}]
+    assert db.normalize_word_rows(rows) == ["ARBOL", "BARCO"]
+    assert db.normalize_word_rows(rows[1:2]) == ["SOL"]
@@ -1,12 +1,16 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QApplication, QPushButton, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QTableView, QHeaderView
 )
 
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
-from database.supabase_client import get_all_statistics, sign_out
+from database.supabase_client import iter_all_statistics, get_statistics_summary, sign_out
+from engine.statistics import StatsAggregate
+from ui.models import GameHistoryModel
+from ui.navigation import get_navigator
+from ui.workers import BackgroundTask
 from ui.styles import create_styled_button
 
 import csv
@@ -19,6 +23,8 @@ class AdminWindow(QWidget):
     def __init__(self, user_id, parent=None):
         super().__init__(parent)
         self.user_id = user_id
+        self.summary_task = None
+        self.history_task = None
         self.setWindowTitle("Estadísticas de Administrador")
         self.setMinimumSize(700, 700)
         self.setup_ui()
@@ -71,7 +77,7 @@ class AdminWindow(QWidget):
         history_title = QLabel("Historial de Partidas")
         history_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333;")
         main_layout.addWidget(history_title)
-        self.history_table = QTableWidget()
+        self.history_table = QTableView()
         self.setup_history_table()
         action_layout = QHBoxLayout()
         export_btn = create_styled_button("Exportar CSV", is_primary=False)
@@ -96,58 +102,71 @@ class AdminWindow(QWidget):
         self.load_statistics()
 
     def handle_logout(self):
+        self.cancel_loading()
         try:
             sign_out()
-
-            from ui.login import LoginWindow
-
-            self.login_window = LoginWindow()
-            self.hide()
-            self.login_window.show()
+            get_navigator().logout()
 
         except Exception as e:
             print(f"Error al cerrar sesión: {e}")
 
     def load_statistics(self):
-        """Obtener y procesar las estadísticas de todos los usuarios."""
-        try:
-            self.game_results = get_all_statistics()
-            self.calculate_statistics()
-            self.update_ui_with_stats()
-        except Exception as e:
-            print(f"Error al cargar las estadísticas: {e}")
-            self.game_results = []
-
-    def calculate_statistics(self):
-        """Calcular estadísticas de resumen."""
-        self.total_games = len(self.game_results)
-
-        lang_counts = {"english": 0, "spanish": 0}
-        total_time = 0
-        total_attempts = 0
-        wins = 0
-
-        for g in self.game_results:
-            lang = g.get("language", "").lower()
-            if lang in ("english", "en"):
-                lang_counts["english"] += 1
-            elif lang in ("spanish", "es", "español"):
-                lang_counts["spanish"] += 1
+        """Cargar en segundo plano el resumen y, por bloques, el historial de todos los usuarios."""
+        self.cancel_loading()
+        self.history_model.clear()
+        self.server_summary = None
+        self.local_totals = StatsAggregate()
+
+        self.summary_task = BackgroundTask(get_statistics_summary)
+        self.summary_task.signals.result.connect(self.on_summary_loaded)
+
+        self.history_task = BackgroundTask(iter_all_statistics)
+        self.history_task.signals.chunk.connect(self.on_history_chunk)
+        self.history_task.signals.error.connect(self.on_load_error)
+        self.history_task.signals.finished.connect(self.calculate_statistics)
+
+        self.summary_task.start()
+        self.history_task.start()
+
+    def cancel_loading(self):
+        """Cancelar las cargas en curso (al salir de la ventana)."""
+        for task in (self.summary_task, self.history_task):
+            if task is not None:
+                task.cancel()
+
+    def on_summary_loaded(self, summary):
+        if summary is None:
+            return
+        self.server_summary = summary
+        self.apply_summary(summary)
+        self.update_ui_with_stats()
 
-            total_time += g.get("time_taken", 0)
+    def on_history_chunk(self, games):
+        self.history_model.append_games(games)
+        self.local_totals.add_games(games)
+        self.calculate_statistics()
 
-            total_attempts += g.get("attempts", 0)
-            if g.get("win", False):
-                wins += 1
+    def on_load_error(self, error_message):
+        print(f"Error al cargar las estadísticas: {error_message}")
 
-        self.en_pct = (lang_counts["english"] / self.total_games * 100) if self.total_games else 0
-        self.es_pct = (lang_counts["spanish"] / self.total_games * 100) if self.total_games else 0
-        self.win_rate = (wins / self.total_games * 100) if self.total_games else 0
-        self.avg_time = (total_time / self.total_games) if self.total_games else 0
-        self.avg_attempts = (total_attempts / self.total_games) if self.total_games else 0
+    def calculate_statistics(self):
+        """Mostrar el resumen calculado localmente mientras no llegue (o si falla) el del servidor."""
+        if self.server_summary is not None:
+            return
+        self.apply_summary(self.local_totals.summary())
+        self.update_ui_with_stats()
+
+    def apply_summary(self, summary: dict):
+        """Guardar las métricas de resumen para las tarjetas."""
+        self.total_games = summary["total_games"]
+        self.en_pct = summary["en_pct"]
+        self.es_pct = summary["es_pct"]
+        self.win_rate = summary["win_rate"]
+        self.avg_time = summary["avg_time"]
+        self.avg_attempts = summary["avg_attempts"]
 
     def update_ui_with_stats(self):
-        """Actualizar los widgets de estadísticas y la tabla de historial con los datos calculados."""
+        """Actualizar los widgets de estadísticas con los datos calculados."""
         self.set_stat_value(self.games_played_label, str(self.total_games))
         self.set_stat_value(self.games_en_label, f"{self.en_pct:.1f}%")
         self.set_stat_value(self.games_es_label, f"{self.es_pct:.1f}%")
@@ -155,30 +174,9 @@ class AdminWindow(QWidget):
         self.set_stat_value(self.avg_time_label, f"{self.avg_time:.1f}s")
         self.set_stat_value(self.avg_attempts_label, f"{self.avg_attempts:.1f}")
 
-        self.history_table.setRowCount(len(self.game_results))
-        for row, game in enumerate(sorted(self.game_results, key=lambda g: g.get("created_at", ""), reverse=True)):
-            user_item = QTableWidgetItem(game.get("username", "Unknown"))
-            self.history_table.setItem(row, 0, user_item)
-
-            word_item = QTableWidgetItem(game.get("word", ""))
-            self.history_table.setItem(row, 1, word_item)
-
-            lang = game.get("language", "")
-            lang_display = "Español" if lang == "spanish" else "English"
-            lang_item = QTableWidgetItem(lang_display)
-            self.history_table.setItem(row, 2, lang_item)
-
-            attempts_item = QTableWidgetItem(str(game.get("attempts", 0)))
-            self.history_table.setItem(row, 3, attempts_item)
-
-            time_item = QTableWidgetItem(f"{game.get('time_taken', 0):.1f}s")
-            self.history_table.setItem(row, 4, time_item)
-
-            result_text = "Victoria" if game.get("win", False) else "Derrota"
-            result_item = QTableWidgetItem(result_text)
-            self.history_table.setItem(row, 5, result_item)
-            hints_item = QTableWidgetItem(str(game.get("hints_used", 0)))
-            self.history_table.setItem(row, 6, hints_item)
+    def closeEvent(self, event):
+        self.cancel_loading()
+        super().closeEvent(event)
 
     def export_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, "Guardar CSV", "estadisticas.csv", "CSV Files (*.csv)")
@@ -189,7 +187,7 @@ class AdminWindow(QWidget):
                 writer = csv.writer(f)
 
                 writer.writerow(["usuario", "palabra", "idioma", "intentos", "tiempo", "resultado", "pistas"])
-                for g in self.game_results:
+                for g in self.history_model.games():
                     writer.writerow([
                         g.get("username", ""),
                         g.get("word", ""),
@@ -225,9 +223,12 @@ class AdminWindow(QWidget):
 
     def setup_history_table(self):
         headers = ["Usuario", "Palabra", "Idioma", "Intentos", "Tiempo", "Resultado", "Pistas"]
-        self.history_table.setColumnCount(len(headers))
-        self.history_table.setHorizontalHeaderLabels(headers)
+        fields = ["username", "word", "language", "attempts", "time_taken", "win", "hints_used"]
+        self.history_model = GameHistoryModel(list(zip(headers, fields)), "spanish", self)
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.history_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.DescendingOrder)
+        self.history_table.setSortingEnabled(True)
         self.history_table.setMinimumHeight(330)
 
         return
@@ -2,47 +2,45 @@ import random
 import time
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-                             QLabel, QPushButton, QFrame, QMessageBox)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject
-from PyQt6.QtGui import QFont
-
-from database.supabase_client import save_game_result
-
-
-class GameSaver(QObject):
-    """Clase trabajadora para guardar los resultados del juego de forma asíncrona."""
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
-
-    def __init__(self, user_id, target_word, language, attempts, time_taken, win, hints_used):
-        super().__init__()
-        self.user_id = user_id
-        self.target_word = target_word
-        self.language = language
-        self.attempts = attempts
-        self.time_taken = time_taken
-        self.win = win
-        self.hints_used = hints_used
-
-    def save_game(self):
-        """Guardar el resultado del juego en un hilo separado."""
-        try:
-            save_game_result(
-                self.user_id,
-                self.target_word,
-                self.language,
-                self.attempts,
-                self.time_taken,
-                self.win,
-                self.hints_used
-            )
-            self.finished.emit()
-        except Exception as e:
-            self.error.emit(str(e))
-
-
-class LetterTile(QFrame):
-    """Un cuadrado que representa una letra en el juego de Wordle."""
+                             QLabel, QPushButton, QMessageBox)
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QFont, QPainter, QColor
+
+from database.outbox import get_game_outbox
+from database.stats_snapshot import record_game_stats
+from engine.matrix_cache import load_pattern_matrix
+from engine.constraints import CandidateFilter
+from engine.dictionary import WordIndex, build_guess_index
+from engine.scoring import MAX_ATTEMPTS, MAX_HINTS, score_guess, decode_pattern, prepare_words
+from engine.solver import best_guess
+from ui.navigation import get_navigator
+from ui.workers import BackgroundTask, get_cpu_executor, run_in_background
+
+
+# Colores de cada estado: (borde, fondo, letra) del azulejo y (fondo, fondo bajo el mouse, letra) de la tecla
+TILE_COLORS = {
+    "empty": ("#d3d6da", None, "black"),
+    "filled": ("#878a8c", None, "black"),
+    "correct": ("#6aaa64", "#6aaa64", "white"),
+    "present": ("#c9b458", "#c9b458", "white"),
+    "absent": ("#787c7e", "#787c7e", "white"),
+}
+TILE_BORDER_WIDTH = 4
+
+KEY_COLORS = {
+    "unused": ("#d3d6da", "#c3c6ca", "black"),
+    "correct": ("#6aaa64", "#5a9a54", "white"),
+    "present": ("#c9b458", "#b9a448", "white"),
+    "absent": ("#787c7e", "#686c6e", "white"),
+}
+
+
+class LetterTile(QWidget):
+    """Un cuadrado que representa una letra en el juego de Wordle.
+
+    Se pinta a sí mismo: cambiar la letra o el estado solo pide un repintado,
+    sin hojas de estilo que interpretar ni widgets que volver a pulir.
+    """
 
     def __init__(self, row, col):
         super().__init__()
@@ -55,63 +53,46 @@ class LetterTile(QFrame):
 
     def setup_ui(self):
         self.setFixedSize(60, 60)
-
-        self.setFrameShape(QFrame.Shape.Box)
-        self.setLineWidth(2)
-
-        self.letter_label = QLabel("")
-        self.letter_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.letter_label.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.letter_label)
-        self.setLayout(layout)
-
-        self.update_style()
+        self.setFont(QFont("Arial", 24, QFont.Weight.Bold))
 
     def set_letter(self, letter):
         """Establece la letra para este azulejo."""
         self.letter = letter.upper() if letter else ""
-        self.letter_label.setText(self.letter)
 
         if letter:
             self.state = "filled"
         else:
             self.state = "empty"
 
-        self.update_style()
+        self.update()
 
     def set_state(self, state):
         """Establece el estado del azulejo (correcto, presente, ausente)."""
         self.state = state
-        self.update_style()
-
-    def update_style(self):
-        """Actualiza el estilo visual basado en el estado actual."""
-        style = "border: 2px solid "
-
-        if self.state == "empty":
-            style += "#d3d6da;"
-            self.letter_label.setStyleSheet("color: black;")
-        elif self.state == "filled":
-            style += "#878a8c;"
-            self.letter_label.setStyleSheet("color: black;")
-        elif self.state == "correct":
-            style += "#6aaa64; background-color: #6aaa64;"
-            self.letter_label.setStyleSheet("color: white;")
-        elif self.state == "present":
-            style += "#c9b458; background-color: #c9b458;"
-            self.letter_label.setStyleSheet("color: white;")
-        elif self.state == "absent":
-            style += "#787c7e; background-color: #787c7e;"
-            self.letter_label.setStyleSheet("color: white;")
-
-        self.setStyleSheet(style)
+        self.update()
+
+    def paintEvent(self, event):
+        border, background, text = TILE_COLORS[self.state]
+        rect = self.rect()
+        painter = QPainter(self)
+
+        if background:
+            painter.fillRect(rect, QColor(background))
+
+        width = TILE_BORDER_WIDTH
+        border_color = QColor(border)
+        painter.fillRect(0, 0, rect.width(), width, border_color)
+        painter.fillRect(0, rect.height() - width, rect.width(), width, border_color)
+        painter.fillRect(0, 0, width, rect.height(), border_color)
+        painter.fillRect(rect.width() - width, 0, width, rect.height(), border_color)
+
+        if self.letter:
+            painter.setPen(QColor(text))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.letter)
 
 
 class KeyboardKey(QPushButton):
-    """Un botón en el teclado virtual."""
+    """Un botón en el teclado virtual (pintado a mano, como los azulejos)."""
 
     def __init__(self, text, key_press_callback):
         super().__init__(text)
@@ -122,7 +103,8 @@ class KeyboardKey(QPushButton):
 
         self.setFixedHeight(50)
         self.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        self.update_style()
+        # Repintar al entrar y salir el mouse para el color de hover
+        self.setAttribute(Qt.WidgetAttribute.WA_Hover)
 
     def set_state(self, state):
         """Establece el estado de la tecla."""
@@ -131,58 +113,26 @@ class KeyboardKey(QPushButton):
                 (state == "present" and self.state != "correct") or
                 (state == "absent" and self.state not in ["correct", "present"])):
             self.state = state
-            self.update_style()
-
-    def update_style(self):
-        """Actualiza el estilo visual basado en el estado actual."""
-        if self.state == "unused":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #d3d6da;
-                    color: black;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #c3c6ca;
-                }
-            """)
-        elif self.state == "correct":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #6aaa64;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #5a9a54;
-                }
-            """)
-        elif self.state == "present":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #c9b458;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #b9a448;
-                }
-            """)
-        elif self.state == "absent":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #787c7e;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #686c6e;
-                }
-            """)
+            self.update()
+
+    def paintEvent(self, event):
+        background, hover, text = KEY_COLORS[self.state]
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(hover if self.underMouse() else background))
+        painter.drawRoundedRect(QRectF(self.rect()), 4, 4)
+
+        painter.setPen(QColor(text))
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.text())
+
+
+def load_game_words(language_name):
+    """Respuestas del idioma y su índice de suposiciones permitidas (fuera del hilo de la interfaz)."""
+    from database.supabase_client import get_words_for_game
+
+    words = get_words_for_game(language_name)
+    return words, build_guess_index(language_name, words)
 
 
 class WordleGame(QMainWindow):
@@ -200,46 +150,116 @@ class WordleGame(QMainWindow):
         self.win = False
         self.start_time = time.time()
         self.hints_used = 0
-        self.max_hints = 3
-
-        self.load_word_list()
+        self.max_hints = MAX_HINTS
+        self.pattern_matrix = None
+        self.matrix_task = None
+        self.words_task = None
+        self.words_ready = False
+        self.valid_words = []
+        self.using_default_words = True
+        self.target_word = ""
+        self.guess_index = WordIndex([])
+        self.candidate_filter = CandidateFilter([])
 
         self.setWindowTitle("Wordle")
         self.setMinimumSize(700, 700)
         self.setup_ui()
+        self.load_word_list()
 
     def load_word_list(self):
-        """Cargue de la base de datos la lista de palabras según el idioma seleccionado."""
-        from database.supabase_client import get_words_for_game
-        from PyQt6.QtWidgets import QMessageBox
+        """Cargar en segundo plano la lista de palabras del idioma seleccionado.
+
+        Mientras llega, el teclado y las pistas quedan deshabilitados; se
+        habilitan en ``apply_word_list`` con la lista recibida o la de respaldo.
+        """
+        self.set_input_enabled(False)
+        self.set_guess_hint_ready(False)
+        language_name = "english" if self.language == "english" else "spanish"
+        self.words_task = run_in_background(load_game_words, language_name,
+                                            on_result=self.on_word_list_loaded,
+                                            on_error=self.on_word_list_error)
+
+    def on_word_list_loaded(self, result):
+        from database.supabase_client import is_default_word_list
+
+        words, guess_index = result
+        if not words or not all(isinstance(word, str) for word in words):
+            self.on_word_list_error(ValueError(
+                "Invalid words list received from database" if self.language == "english" else "Invalida lista de palabras recibida de la base de datos"))
+            return
 
-        try:
-            language_name = "english" if self.language == "english" else "spanish"
+        self.apply_word_list(words, is_default_word_list(words), guess_index)
 
-            self.valid_words = get_words_for_game(language_name)
+    def on_word_list_error(self, error):
+        print(f"Error loading word list: {str(error)}")
+        default_words = ["HELLO", "WORLD", "PYTHON", "BAGGY", "QUICK"] if self.language == "english" else \
+            ["FECHA", "MUNDO", "TORTA", "FELIZ", "LOCOS"]
+        self.apply_word_list(default_words, True)
 
-            if not self.valid_words or not all(isinstance(word, str) for word in self.valid_words):
-                raise ValueError(
-                    "Invalid words list received from database" if self.language == "english" else "Invalida lista de palabras recibida de la base de datos")
+        QMessageBox.warning(
+            self,
+            "Warning" if self.language == "english" else "Advertencia",
+            "Could not load word list. Using default words." if self.language == "english"
+            else "No se pudo cargar la lista de palabras. Usando palabras predeterminadas."
+        )
 
-            self.target_word = random.choice(self.valid_words).upper()
+    def apply_word_list(self, words, using_default_words, guess_index=None):
+        """Preparar la partida con la lista recibida y habilitar la entrada.
 
-        except Exception as e:
-            print(f"Error loading word list: {str(e)}")
-            default_words = ["HELLO", "WORLD", "PYTHON", "BAGGY", "QUICK"] if self.language == "english" else \
-                ["FECHA", "MUNDO", "TORTA", "FELIZ", "LOCOS"]
-            self.valid_words = default_words
-            self.target_word = random.choice(default_words)
+        La respuesta sale de ``words``; las suposiciones se validan contra
+        ``guess_index``, que además incluye el diccionario completo del idioma.
+        """
+        self.valid_words = words
+        self.using_default_words = using_default_words
+        self.target_word = random.choice(words).upper() if words else "ERROR"
+        self.guess_index = guess_index if guess_index is not None else WordIndex(words)
 
-            QMessageBox.warning(
-                self,
-                "Warning" if self.language == "english" else "Advertencia",
-                "Could not load word list. Using default words." if self.language == "english"
-                else "No se pudo cargar la lista de palabras. Usando palabras predeterminadas."
-            )
+        # Mismo orden que PatternMatrix.words, así los índices sirven para la matriz
+        self.candidate_filter = CandidateFilter(prepare_words(self.valid_words))
 
-        if not hasattr(self, 'target_word') or not self.target_word:
-            self.target_word = "ERROR"
+        remaining_text = "Palabras posibles" if self.language == "spanish" else "Words left"
+        self.remaining_label.setText(f"{remaining_text}: {len(self.candidate_filter)}")
+        # El tiempo de la partida cuenta desde que se puede jugar
+        self.start_time = time.time()
+        self.words_ready = True
+        self.set_input_enabled(True)
+        self.load_pattern_matrix()
+
+    def set_input_enabled(self, enabled):
+        """Habilitar o deshabilitar el teclado y la pista de letra."""
+        self.keyboard_widget.setEnabled(enabled)
+        self.hint_btn.setEnabled(enabled and self.hints_used < self.max_hints and not self.game_over)
+
+    def load_pattern_matrix(self):
+        """Abrir en segundo plano la matriz de patrones compartida (en caché en disco).
+
+        Para una lista nueva hay que construirla y tarda segundos: mientras
+        tanto la pista de mejor palabra muestra que se está preparando. La
+        lista predeterminada no toca la caché en disco. Se construye en el
+        ejecutor de cálculo, no en el de E/S.
+        """
+        self.set_guess_hint_ready(False)
+        self.matrix_task = BackgroundTask(load_pattern_matrix, self.language, self.valid_words,
+                                          persist=not self.using_default_words)
+        self.matrix_task.signals.result.connect(self.on_pattern_matrix_loaded)
+        self.matrix_task.signals.error.connect(self.on_pattern_matrix_error)
+        self.matrix_task.start(get_cpu_executor())
+
+    def on_pattern_matrix_loaded(self, pattern_matrix):
+        self.pattern_matrix = pattern_matrix
+        self.set_guess_hint_ready(True)
+
+    def on_pattern_matrix_error(self, error):
+        print(f"Error loading pattern matrix: {str(error)}")
+        self.set_guess_hint_ready(True)
+
+    def set_guess_hint_ready(self, ready):
+        """Mostrar la pista de mejor palabra como disponible o en preparación."""
+        if ready:
+            self.guess_hint_btn.setText("Best Guess" if self.language != "spanish" else "Mejor Palabra")
+        else:
+            self.guess_hint_btn.setText("Preparing hints..." if self.language != "spanish" else "Preparando pistas...")
+        self.guess_hint_btn.setEnabled(ready and self.words_ready and self.hints_used < self.max_hints and not self.game_over)
 
     def setup_ui(self):
         main_widget = QWidget()
@@ -263,11 +283,18 @@ class WordleGame(QMainWindow):
         hints_label = QLabel(f"{hint_text}: {self.max_hints - self.hints_used}/{self.max_hints}")
         hint_btn = QPushButton("Use Hint" if self.language != "spanish" else "Usar Pista")
         hint_btn.clicked.connect(self.use_hint)
+        guess_hint_btn = QPushButton("Best Guess" if self.language != "spanish" else "Mejor Palabra")
+        guess_hint_btn.clicked.connect(self.use_guess_hint)
+        remaining_text = "Palabras posibles" if self.language == "spanish" else "Words left"
+        self.remaining_label = QLabel(f"{remaining_text}: {len(self.candidate_filter)}")
+        hints_layout.addWidget(self.remaining_label)
         hints_layout.addWidget(hints_label)
         hints_layout.addWidget(hint_btn)
+        hints_layout.addWidget(guess_hint_btn)
 
         self.hints_label = hints_label
         self.hint_btn = hint_btn
+        self.guess_hint_btn = guess_hint_btn
 
         header_layout.addWidget(back_btn)
         header_layout.addStretch()
@@ -281,7 +308,7 @@ class WordleGame(QMainWindow):
         board_widget.setLayout(board_layout)
 
         self.tiles = []
-        for row in range(6):
+        for row in range(MAX_ATTEMPTS):
             row_tiles = []
             for col in range(5):
                 tile = LetterTile(row, col)
@@ -292,6 +319,7 @@ class WordleGame(QMainWindow):
         keyboard_widget = QWidget()
         keyboard_layout = QVBoxLayout()
         keyboard_widget.setLayout(keyboard_layout)
+        self.keyboard_widget = keyboard_widget
         self.keyboard_keys = {}
 
         row1_layout = QHBoxLayout()
@@ -337,7 +365,7 @@ class WordleGame(QMainWindow):
 
     def key_pressed(self, key):
         """Manejar una pulsación de tecla en el teclado virtual."""
-        if self.game_over:
+        if self.game_over or not self.words_ready:
             return
 
         if key == "ENTER":
@@ -370,11 +398,18 @@ class WordleGame(QMainWindow):
         for col in range(5):
             guess += self.tiles[self.current_row][col].letter
 
+        if guess not in self.guess_index:
+            self.show_message(
+                "Not in word list" if self.language != "spanish" else "Palabra no válida",
+                "That word is not in the word list." if self.language != "spanish" else "La palabra no está en la lista de palabras.")
+            return
+
         self.evaluate_guess(guess)
+        self.update_candidates(guess)
 
         if guess == self.target_word:
             self.game_win()
-        elif self.current_row >= 5:
+        elif self.current_row >= MAX_ATTEMPTS - 1:
             self.game_lose()
         else:
             self.current_row += 1
@@ -382,27 +417,18 @@ class WordleGame(QMainWindow):
 
     def evaluate_guess(self, guess):
         """Evaluar la suposición actual contra la palabra objetivo."""
-        remaining_letters = {}
-        for letter in self.target_word:
-            remaining_letters[letter] = remaining_letters.get(letter, 0) + 1
-
-        for col, letter in enumerate(guess):
-            if letter == self.target_word[col]:
-                self.tiles[self.current_row][col].set_state("correct")
-                self.keyboard_keys[letter].set_state("correct")
-                remaining_letters[letter] -= 1
-
-        for col, letter in enumerate(guess):
-            if letter == self.target_word[col]:
-                continue
-
-            if letter in remaining_letters and remaining_letters[letter] > 0:
-                self.tiles[self.current_row][col].set_state("present")
-                self.keyboard_keys[letter].set_state("present")
-                remaining_letters[letter] -= 1
-            else:
-                self.tiles[self.current_row][col].set_state("absent")
-                self.keyboard_keys[letter].set_state("absent")
+        states = decode_pattern(score_guess(guess, self.target_word), len(guess))
+
+        for col, (letter, state) in enumerate(zip(guess, states)):
+            self.tiles[self.current_row][col].set_state(state)
+            self.keyboard_keys[letter].set_state(state)
+
+    def update_candidates(self, guess):
+        """Reducir el conjunto de respuestas posibles con la retroalimentación de la suposición."""
+        self.candidate_filter.add_feedback(guess, score_guess(guess, self.target_word))
+
+        remaining_text = "Palabras posibles" if self.language == "spanish" else "Words left"
+        self.remaining_label.setText(f"{remaining_text}: {len(self.candidate_filter)}")
 
     def game_win(self):
         """Manejar la condición de victoria del juego."""
@@ -439,7 +465,7 @@ class WordleGame(QMainWindow):
             self.user_id,
             self.target_word,
             self.language,
-            6,  # Max attempts
+            MAX_ATTEMPTS,
             elapsed_time,
             False,  # Loss
             self.hints_used
@@ -447,17 +473,47 @@ class WordleGame(QMainWindow):
 
     def use_hint(self):
         """Utiliza una pista para ayudar al jugador revelando una letra."""
-        if self.hints_used >= self.max_hints or self.game_over:
+        if self.hints_used >= self.max_hints or self.game_over or not self.words_ready:
             return
 
         self.reveal_letter_hint()
+        self.spend_hint()
 
+    def use_guess_hint(self):
+        """Utiliza una pista para sugerir la palabra que más información aporta."""
+        if self.hints_used >= self.max_hints or self.game_over:
+            return
+
+        if self.suggest_best_guess():
+            self.spend_hint()
+
+    def spend_hint(self):
+        """Descontar una pista del presupuesto y actualizar los controles."""
         self.hints_used += 1
         self.hints_label.setText(
             f"Hints: {self.max_hints - self.hints_used}/{self.max_hints}" if self.language != "spanish" else f"Pistas restantes: {self.max_hints - self.hints_used}/{self.max_hints}")
 
         if self.hints_used >= self.max_hints:
             self.hint_btn.setEnabled(False)
+            self.guess_hint_btn.setEnabled(False)
+
+    def suggest_best_guess(self):
+        """Pista: Sugerir la suposición de mayor entropía contra las candidatas restantes"""
+        if self.pattern_matrix is None:
+            self.show_message("Hint" if self.language != "spanish" else "Pista",
+                              "This hint is not available right now." if self.language != "spanish" else "Esta pista no está disponible en este momento.")
+            return False
+
+        word, _ = best_guess(self.pattern_matrix, self.candidate_filter.indices)
+        if word is None:
+            self.show_message("Hint" if self.language != "spanish" else "Pista",
+                              "No word in the list matches your guesses." if self.language != "spanish" else "Ninguna palabra de la lista coincide con tus intentos.")
+            return False
+
+        remaining = len(self.candidate_filter)
+        self.show_message("Best Guess" if self.language != "spanish" else "Mejor Palabra",
+                          f"Try '{word}' ({remaining} possible words left)." if self.language != "spanish" else f"Prueba con '{word}' (quedan {remaining} palabras posibles).")
+        return True
 
     def reveal_letter_hint(self):
         """Pista: Revelar una letra correcta"""
@@ -495,23 +551,24 @@ class WordleGame(QMainWindow):
         msg_box.exec()
 
     def save_game_result_async(self, user_id, target_word, language, attempts, time_taken, win, hints_used):
-        """Guardar el resultado del juego en un hilo en segundo plano."""
-        self.thread = QThread()
-        self.worker = GameSaver(user_id, target_word, language, attempts, time_taken, win, hints_used)
-
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.save_game)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.worker.error.connect(self.handle_save_error)
+        """Registrar el resultado del juego en la bandeja de salida; se envía en segundo plano."""
+        client_id = None
+        try:
+            client_id = get_game_outbox().record(user_id, target_word, language, attempts, time_taken, win,
+                                                 hints_used)
+        except Exception as e:
+            print(f"Error saving game result: {str(e)}")
 
-        self.thread.start()
+        try:
+            record_game_stats(user_id, win, attempts, time_taken, language, client_id)
+        except Exception as e:
+            print(f"Error updating local statistics: {str(e)}")
 
-    def handle_save_error(self, error_message):
-        """Manejar errores que ocurren durante el guardado del resultado del juego."""
-        print(f"Error saving game result: {error_message}")
+    def closeEvent(self, event):
+        for task in (self.words_task, self.matrix_task):
+            if task is not None:
+                task.cancel()
+        super().closeEvent(event)
 
     def back_to_home(self):
         """Volver a la pantalla de inicio."""
@@ -527,7 +584,4 @@ class WordleGame(QMainWindow):
             if reply == QMessageBox.StandardButton.No:
                 return
 
-        from ui.home import HomeWindow
-        self.home_window = HomeWindow(self.user_id, self.is_admin, self.language)
-        self.hide()
-        self.home_window.show()
+        get_navigator().show_home(self.user_id, self.is_admin, self.language)
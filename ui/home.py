@@ -4,9 +4,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
 from database.supabase_client import sign_out
-from ui.game import WordleGame
-from ui.statistics import StatisticsWindow
-from ui.admin import AdminWindow
+from ui.navigation import get_navigator
 
 
 class HomeWindow(QMainWindow):
@@ -97,33 +95,23 @@ class HomeWindow(QMainWindow):
 
     def start_game(self):
         """Iniciar un nuevo juego de Wordle."""
-        self.game_window = WordleGame(self.user_id, self.is_admin, self.language)
-        self.hide()
-        self.game_window.show()
+        get_navigator().start_game(self.user_id, self.is_admin, self.language)
 
     def show_statistics(self):
         """Mostrar estadísticas del usuario."""
-        self.stats_window = StatisticsWindow(self.user_id, self.is_admin, self.language)
-        self.hide()
-        self.stats_window.show()
+        get_navigator().show_statistics(self.user_id, self.is_admin, self.language)
 
     def show_admin_panel(self):
         """Mostrar panel de administrador (solo para administradores)."""
         if not self.is_admin:
             return
 
-        self.admin_panel = AdminWindow(self.user_id)
-        self.hide()
-        self.admin_panel.show()
+        get_navigator().show_admin(self.user_id)
 
     def handle_logout(self):
         """Manejar cierre de sesión del usuario."""
         try:
             sign_out()
-
-            from ui.login import LoginWindow
-            self.login_window = LoginWindow()
-            self.hide()
-            self.login_window.show()
+            get_navigator().logout()
         except Exception as e:
             print(f"Error logging out: {e}" if self.language != "spanish" else f"Error al cerrar sesión: {e}")
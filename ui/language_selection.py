@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
-from ui.rules import RulesWindow
+from ui.navigation import get_navigator
 
 
 class LanguageSelectionWindow(QMainWindow):
@@ -83,6 +83,4 @@ class LanguageSelectionWindow(QMainWindow):
         self.selected_language = self.language_combo.itemData(index)
 
     def proceed_to_rules(self):
-        self.rules_window = RulesWindow(self.user_id, self.is_admin, self.selected_language)
-        self.hide()
-        self.rules_window.show()
+        get_navigator().show_rules(self.user_id, self.is_admin, self.selected_language)
@@ -4,11 +4,10 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
-from database.supabase_client import sign_in
-from ui.language_selection import LanguageSelectionWindow
-from ui.signup import SignupWindow
-
+from database.supabase_client import sign_in, reset_user_password
 from ui.styles import create_styled_button, create_styled_input
+from ui.navigation import get_navigator
+from ui.workers import run_in_background
 
 
 class PasswordResetDialog(QDialog):
@@ -35,8 +34,8 @@ class PasswordResetDialog(QDialog):
         confirm_label = QLabel("Confirmar contraseña nueva:")
         self.confirm_input = create_styled_input("Confirma tu nueva contraseña")
         self.confirm_input.setEchoMode(QLineEdit.EchoMode.Password)
-        reset_btn = create_styled_button("Restablecer contraseña")
-        reset_btn.clicked.connect(self.reset_password)
+        self.reset_btn = create_styled_button("Restablecer contraseña")
+        self.reset_btn.clicked.connect(self.reset_password)
 
         layout.addWidget(QLabel("Ingresa tu nombre de usuario y tu nueva contraseña"))
         layout.addWidget(username_label)
@@ -45,7 +44,7 @@ class PasswordResetDialog(QDialog):
         layout.addWidget(self.password_input)
         layout.addWidget(confirm_label)
         layout.addWidget(self.confirm_input)
-        layout.addWidget(reset_btn)
+        layout.addWidget(self.reset_btn)
 
         self.setLayout(layout)
 
@@ -62,17 +61,22 @@ class PasswordResetDialog(QDialog):
             QMessageBox.warning(self, "Error", "Las contraseñas no coinciden.")
             return
 
-        try:
-            from database.supabase_client import reset_user_password
-            reset_user_password(username, password)
-            QMessageBox.information(
-                self,
-                "Excelente",
-                "Tu contraseña ha sido restablecida exitosamente. Ahora puedes iniciar sesión con tu nueva contraseña."
-            )
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error al restablecer la contraseña: {str(e)}")
+        self.reset_btn.setEnabled(False)
+        self.reset_task = run_in_background(reset_user_password, username, password,
+                                            on_result=self.on_reset_done, on_error=self.on_reset_error)
+
+    def on_reset_done(self, _result):
+        self.reset_btn.setEnabled(True)
+        QMessageBox.information(
+            self,
+            "Excelente",
+            "Tu contraseña ha sido restablecida exitosamente. Ahora puedes iniciar sesión con tu nueva contraseña."
+        )
+        self.accept()
+
+    def on_reset_error(self, error):
+        self.reset_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Error al restablecer la contraseña: {str(error)}")
 
 
 class LoginWindow(QMainWindow):
@@ -140,8 +144,8 @@ class LoginWindow(QMainWindow):
         self.username_input = create_styled_input("Nombre de usuario")
         self.password_input = create_styled_input("Contraseña")
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        login_btn = create_styled_button("Iniciar sesión")
-        login_btn.clicked.connect(self.handle_login)
+        self.login_btn = create_styled_button("Iniciar sesión")
+        self.login_btn.clicked.connect(self.handle_login)
 
         signup_container = QWidget()
         signup_layout = QHBoxLayout()
@@ -195,11 +199,17 @@ class LoginWindow(QMainWindow):
         card_layout.addWidget(self.username_input)
         card_layout.addWidget(self.password_input)
         card_layout.addWidget(forgot_btn, alignment=Qt.AlignmentFlag.AlignRight)
-        card_layout.addWidget(login_btn)
+        card_layout.addWidget(self.login_btn)
         card_layout.addWidget(signup_container)
 
         main_layout.addWidget(card)
 
+    def reset_form(self):
+        """Dejar el formulario vacío (al volver tras cerrar sesión)."""
+        self.username_input.clear()
+        self.password_input.clear()
+        self.login_btn.setEnabled(True)
+
     def handle_login(self):
         username = self.username_input.text().strip()
         password = self.password_input.text()
@@ -208,23 +218,29 @@ class LoginWindow(QMainWindow):
             self.show_error("Por favor ingresa nombre de usuario y contraseña.")
             return
 
-        try:
-            user = sign_in(username, password)
+        self.login_btn.setEnabled(False)
+        self.login_task = run_in_background(sign_in, username, password,
+                                            on_result=self.on_login_result, on_error=self.on_login_error)
 
-            if user:
-                self.user_id = user["id"]
-                self.is_admin = user.get("is_admin", False)
+    def on_login_result(self, user):
+        self.login_btn.setEnabled(True)
+        if user:
+            self.user_id = user["id"]
+            self.is_admin = user.get("is_admin", False)
 
-                if self.is_admin:
-                    self.show_admin_panel()
-                else:
-                    self.show_language_selection()
+            if self.is_admin:
+                self.show_admin_panel()
             else:
-                self.show_error("Nombre de usuario o contraseña inválidos.")
-        except ValueError as e:
-            self.show_error(str(e))
-        except Exception as e:
-            self.show_error(f"Ocurrio un Error: {str(e)}")
+                self.show_language_selection()
+        else:
+            self.show_error("Nombre de usuario o contraseña inválidos.")
+
+    def on_login_error(self, error):
+        self.login_btn.setEnabled(True)
+        if isinstance(error, ValueError):
+            self.show_error(str(error))
+        else:
+            self.show_error(f"Ocurrio un Error: {str(error)}")
 
     def show_error(self, message):
         error = QMessageBox(self)
@@ -256,10 +272,8 @@ class LoginWindow(QMainWindow):
         error.exec()
 
     def show_signup(self):
-        self.signup_window = SignupWindow(login_window=self)
-        self.signup_window.signup_successful.connect(self.on_signup_successful)
-        self.signup_window.show()
-        self.hide()
+        signup_window = get_navigator().show_signup()
+        signup_window.signup_successful.connect(self.on_signup_successful)
 
     def show_password_reset(self):
         dialog = PasswordResetDialog(self)
@@ -271,12 +285,7 @@ class LoginWindow(QMainWindow):
         self.show_language_selection()
 
     def show_language_selection(self):
-        self.language_window = LanguageSelectionWindow(self.user_id, self.is_admin)
-        self.hide()
-        self.language_window.show()
+        get_navigator().show_language_selection(self.user_id, self.is_admin)
 
     def show_admin_panel(self):
-        from ui.admin import AdminWindow
-        self.admin_window = AdminWindow(self.user_id)
-        self.hide()
-        self.admin_window.show()
+        get_navigator().show_admin(self.user_id)
@@ -0,0 +1,164 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# Campos de una partida con el formato de database.supabase_client._format_partida
+GAME_FIELDS = ("created_at", "username", "word", "language", "attempts", "time_taken", "win", "hints_used")
+
+_DEFAULTS = {"created_at": "", "username": "Unknown", "word": "", "language": "", "attempts": 0,
+             "time_taken": 0, "win": False, "hints_used": 0}
+
+# Con más huecos que este en un mismo bloque, se reordena la vista de una vez
+_MAX_INSERT_RUNS = 32
+
+
+class GameHistoryModel(QAbstractTableModel):
+    """Modelo de solo lectura del historial de partidas.
+
+    Guarda cada campo en una lista (almacenamiento por columnas) y arma el
+    texto de cada celda recién cuando la vista la pide, así que la memoria no
+    depende de cuántas celdas haya. El orden se mantiene como una permutación
+    de índices calculada con ``sorted`` sobre la columna, en lugar de un
+    QSortFilterProxyModel que llamaría a Python en cada comparación.
+    """
+
+    def __init__(self, columns, language="spanish", parent=None):
+        """``columns`` es una lista de (título, campo) con campos de GAME_FIELDS."""
+        super().__init__(parent)
+        self.columns = columns
+        self.language = language
+        self._data = {field: [] for field in GAME_FIELDS}
+        self._order = []
+        # Por defecto, las partidas más recientes primero
+        self._sort_field = "created_at"
+        self._sort_descending = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.columns[section][0]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        field = self.columns[index.column()][1]
+        value = self._data[field][self._order[index.row()]]
+        return self.format_value(field, value)
+
+    def format_value(self, field, value) -> str:
+        if field == "language":
+            return "Español" if value == "spanish" else "English"
+        if field == "time_taken":
+            return f"{value or 0:.1f}s"
+        if field == "win":
+            if self.language == "spanish":
+                return "Victoria" if value else "Derrota"
+            return "Win" if value else "Loss"
+        return str(value)
+
+    def append_games(self, games) -> None:
+        """Agregar partidas al almacenamiento e intercalarlas en el orden actual.
+
+        Solo se ordenan las filas nuevas; cada una se ubica en el orden
+        existente con una búsqueda binaria y se avisa a la vista con
+        ``beginInsertRows``, así que un bloque cuesta O(k log n) y no vuelve a
+        ordenar todo el historial.
+        """
+        games = list(games)
+        if not games:
+            return
+
+        start = len(self._data["created_at"])
+        for field in GAME_FIELDS:
+            default = _DEFAULTS[field]
+            self._data[field].extend(default if g.get(field) is None else g[field] for g in games)
+
+        values = self._data[self._sort_field]
+        new_rows = sorted(range(start, start + len(games)), key=values.__getitem__,
+                          reverse=self._sort_descending)
+
+        # Agrupar las filas nuevas que caen en el mismo hueco del orden actual
+        runs = []
+        position = 0
+        for row in new_rows:
+            position = self._insertion_point(values[row], position)
+            if runs and runs[-1][0] == position:
+                runs[-1][1].append(row)
+            else:
+                runs.append((position, [row]))
+
+        if len(runs) > _MAX_INSERT_RUNS:
+            # Filas repartidas por todo el historial: un solo cambio de diseño es más barato
+            merged = []
+            previous = 0
+            for position, rows in runs:
+                merged.extend(self._order[previous:position])
+                merged.extend(rows)
+                previous = position
+            merged.extend(self._order[previous:])
+            self._set_order(merged)
+            return
+
+        inserted = 0
+        for position, rows in runs:
+            first = position + inserted
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._order[first:first] = rows
+            self.endInsertRows()
+            inserted += len(rows)
+
+    def _insertion_point(self, value, lo=0) -> int:
+        """Posición en ``_order`` donde va una fila con ``value``, detrás de las iguales (como ``sorted``)."""
+        values = self._data[self._sort_field]
+        order = self._order
+        hi = len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = values[order[mid]]
+            goes_before = current < value if self._sort_descending else value < current
+            if goes_before:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._data = {field: [] for field in GAME_FIELDS}
+        self._order = []
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Ordenar por una columna visible (o por fecha si ``column`` es -1)."""
+        if 0 <= column < len(self.columns):
+            self._sort_field = self.columns[column][1]
+            self._sort_descending = order == Qt.SortOrder.DescendingOrder
+        else:
+            self._sort_field = "created_at"
+            self._sort_descending = True
+
+        values = self._data[self._sort_field]
+        self._set_order(sorted(range(len(values)), key=values.__getitem__, reverse=self._sort_descending))
+
+    def _set_order(self, new_order):
+        """Reemplazar el orden de la vista moviendo los índices persistentes (selección, fila actual)."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        if persistent:
+            view_row = {row: i for i, row in enumerate(new_order)}
+            moved = [self.index(view_row[self._order[index.row()]], index.column()) for index in persistent]
+            self._order = new_order
+            self.changePersistentIndexList(persistent, moved)
+        else:
+            self._order = new_order
+        self.layoutChanged.emit()
+
+    def games(self):
+        """Recorrer las partidas (como dicts) en el orden actual de la vista."""
+        for row in self._order:
+            yield {field: self._data[field][row] for field in GAME_FIELDS}
@@ -0,0 +1,126 @@
+"""Ventana principal única con las pantallas de la aplicación en un QStackedWidget.
+
+Cada pantalla pide la siguiente al navegador (``get_navigator()``) en lugar
+de crear otra ventana de nivel superior y ocultarse. Las pantallas que se
+visitan una y otra vez (inicio de sesión, inicio) se crean una sola vez y se
+reutilizan; las demás (partida, estadísticas, panel de administrador, ...) se
+destruyen al dejar de mostrarse, así cada partida libera su tablero.
+"""
+from PyQt6.QtWidgets import QMainWindow, QStackedWidget, QApplication
+
+# Pantallas que se conservan al navegar a otra; las demás se liberan
+CACHED_SCREENS = ("login", "home")
+
+
+class Navigator(QMainWindow):
+    """Ventana de la aplicación: muestra una pantalla a la vez y decide cuáles conservar."""
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Wordle")
+        self.setMinimumSize(700, 700)
+
+        screen = QApplication.primaryScreen().geometry()
+        self.move(int((screen.width() - self.width()) / 2),
+                  int((screen.height() - self.height()) / 2))
+
+        self.stack = QStackedWidget()
+        self.setCentralWidget(self.stack)
+        self.screens = {}
+        self.current_name = None
+
+    def show_screen(self, name, screen):
+        """Mostrar ``screen`` bajo ``name``; libera la pantalla anterior si no se reutiliza."""
+        if self.screens.get(name) is not screen:
+            self.dispose_screen(name)
+            self.screens[name] = screen
+            self.stack.addWidget(screen)
+            screen.windowTitleChanged.connect(lambda title, screen=screen: self.on_title_changed(screen, title))
+
+        previous = self.current_name
+        self.current_name = name
+        self.stack.setCurrentWidget(screen)
+        self.setWindowTitle(screen.windowTitle())
+
+        if previous not in (None, name) and previous not in CACHED_SCREENS:
+            self.dispose_screen(previous)
+
+        self.show()
+        return screen
+
+    def dispose_screen(self, name):
+        """Quitar una pantalla del stack y destruirla junto con todos sus widgets."""
+        screen = self.screens.pop(name, None)
+        if screen is None:
+            return
+
+        self.stack.removeWidget(screen)
+        # close() dispara closeEvent, donde las pantallas cancelan sus cargas en segundo plano
+        screen.close()
+        screen.deleteLater()
+
+    def on_title_changed(self, screen, title):
+        if self.stack.currentWidget() is screen:
+            self.setWindowTitle(title)
+
+    def show_login(self):
+        from ui.login import LoginWindow
+
+        login = self.screens.get("login")
+        if login is None:
+            login = LoginWindow()
+        login.reset_form()
+        return self.show_screen("login", login)
+
+    def show_signup(self):
+        from ui.signup import SignupWindow
+        return self.show_screen("signup", SignupWindow())
+
+    def show_language_selection(self, user_id, is_admin):
+        from ui.language_selection import LanguageSelectionWindow
+        return self.show_screen("language_selection", LanguageSelectionWindow(user_id, is_admin))
+
+    def show_rules(self, user_id, is_admin, language):
+        from ui.rules import RulesWindow
+        return self.show_screen("rules", RulesWindow(user_id, is_admin, language))
+
+    def show_home(self, user_id, is_admin, language):
+        from ui.home import HomeWindow
+
+        home = self.screens.get("home")
+        if home is None or (home.user_id, home.is_admin, home.language) != (user_id, is_admin, language):
+            home = HomeWindow(user_id, is_admin, language)
+        return self.show_screen("home", home)
+
+    def start_game(self, user_id, is_admin, language):
+        """Mostrar un tablero nuevo; el de la partida anterior se destruye."""
+        from ui.game import WordleGame
+        return self.show_screen("game", WordleGame(user_id, is_admin, language))
+
+    def show_statistics(self, user_id, is_admin, language):
+        from ui.statistics import StatisticsWindow
+        return self.show_screen("statistics", StatisticsWindow(user_id, is_admin, language))
+
+    def show_admin(self, user_id):
+        from ui.admin import AdminWindow
+        return self.show_screen("admin", AdminWindow(user_id))
+
+    def logout(self):
+        """Volver al inicio de sesión y liberar todas las pantallas del usuario."""
+        self.show_login()
+        for name in list(self.screens):
+            if name != "login":
+                self.dispose_screen(name)
+
+
+_navigator = None
+
+
+def get_navigator() -> Navigator:
+    """Navegador compartido por toda la aplicación (se crea con la primera pantalla)."""
+    global _navigator
+
+    if _navigator is None:
+        _navigator = Navigator()
+
+    return _navigator
@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLabel,
                              QScrollArea, QApplication)
+from ui.navigation import get_navigator
 from ui.styles import create_styled_button
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
@@ -131,10 +132,7 @@ class RulesWindow(QMainWindow):
 
     def proceed_to_home(self):
         try:
-            from ui.home import HomeWindow
-            self.home_window = HomeWindow(self.user_id, self.is_admin, self.language)
-            self.hide()
-            self.home_window.show()
+            get_navigator().show_home(self.user_id, self.is_admin, self.language)
         except Exception as e:
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"No se pudo cargar la ventana de inicio: {str(e)}")
@@ -5,6 +5,8 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
 from ui.styles import create_styled_button, create_styled_input
+from ui.navigation import get_navigator
+from ui.workers import run_in_background
 
 from database.supabase_client import sign_up
 
@@ -14,8 +16,7 @@ class SignupWindow(QMainWindow):
 
     signup_successful = pyqtSignal(int, bool)
 
-    def __init__(self, login_window=None):
-        self.login_window = login_window
+    def __init__(self):
         super().__init__()
         self.setWindowTitle("Wordle")
         self.setMinimumSize(700, 700)
@@ -83,8 +84,8 @@ class SignupWindow(QMainWindow):
         self.confirm_input = create_styled_input("Confirmar contraseña")
         self.confirm_input.setEchoMode(QLineEdit.EchoMode.Password)
 
-        signup_btn = create_styled_button("Crear cuenta")
-        signup_btn.clicked.connect(self.handle_signup)
+        self.signup_btn = create_styled_button("Crear cuenta")
+        self.signup_btn.clicked.connect(self.handle_signup)
 
         login_container = QWidget()
         login_layout = QHBoxLayout()
@@ -123,7 +124,7 @@ class SignupWindow(QMainWindow):
         card_layout.addWidget(self.email_input)
         card_layout.addWidget(self.password_input)
         card_layout.addWidget(self.confirm_input)
-        card_layout.addWidget(signup_btn)
+        card_layout.addWidget(self.signup_btn)
         card_layout.addWidget(login_container)
 
         main_layout.addWidget(card)
@@ -146,24 +147,28 @@ class SignupWindow(QMainWindow):
             self.show_error("Las contraseñas no coinciden.")
             return
 
-        try:
-            user = sign_up(username, password, email)
-
-            if user:
-                QMessageBox.information(self, "Excelente", "Cuenta creada exitosamente! Por favor inicia sesión.")
-                self.signup_successful.emit(user["id"], user.get("is_admin", False))
-                self.close()
-            else:
-                self.show_error("No se pudo crear la cuenta.")
-        except ValueError as e:
-            self.show_error(str(e))
-        except Exception as e:
-            self.show_error(f"Error al crear la cuenta: {str(e)}")
+        self.signup_btn.setEnabled(False)
+        self.signup_task = run_in_background(sign_up, username, password, email,
+                                             on_result=self.on_signup_result, on_error=self.on_signup_error)
+
+    def on_signup_result(self, user):
+        self.signup_btn.setEnabled(True)
+        if user:
+            QMessageBox.information(self, "Excelente", "Cuenta creada exitosamente! Por favor inicia sesión.")
+            self.signup_successful.emit(user["id"], user.get("is_admin", False))
+            self.close()
+        else:
+            self.show_error("No se pudo crear la cuenta.")
+
+    def on_signup_error(self, error):
+        self.signup_btn.setEnabled(True)
+        if isinstance(error, ValueError):
+            self.show_error(str(error))
+        else:
+            self.show_error(f"Error al crear la cuenta: {str(error)}")
 
     def show_login(self):
-        if self.login_window:
-            self.login_window.show()
-        self.close()
+        get_navigator().show_login()
 
     def show_error(self, message):
         QMessageBox.critical(self, "Error", message)
@@ -1,10 +1,14 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QPushButton, QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QApplication)
+                             QPushButton, QTableView, QHeaderView, QFileDialog, QApplication)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 import csv
 
-from database.supabase_client import get_user_statistics, get_user_profile
+from database.supabase_client import sync_user_snapshot, get_user_profile
+from database.stats_snapshot import load_user_aggregate, load_user_snapshot, reconcile_user_aggregate
+from ui.models import GameHistoryModel
+from ui.navigation import get_navigator
+from ui.workers import BackgroundTask
 
 
 class StatisticsWindow(QMainWindow):
@@ -15,12 +19,9 @@ class StatisticsWindow(QMainWindow):
         self.user_id = user_id
         self.is_admin = is_admin
         self.language = language
-
-        try:
-            profile = get_user_profile(user_id)
-            self.username = profile.get("nombre_usuario", "")
-        except Exception:
-            self.username = ""
+        self.username = ""
+        self.profile_task = None
+        self.statistics_task = None
 
         title = "Estadísticas" if language == "spanish" else "Statistics"
         self.setWindowTitle(f"Wordle - {title}")
@@ -29,61 +30,65 @@ class StatisticsWindow(QMainWindow):
         self.load_statistics()
 
         self.setup_ui()
+        self.start_loading()
 
     def load_statistics(self):
-        """Cargar las estadísticas de usuario de la base de datos."""
-        try:
-            result = get_user_statistics(self.user_id)
-            if isinstance(result, list):
-                self.game_results = result
-            else:
-                self.game_results = result.data if result.data else []
+        """Mostrar primero la copia local y sincronizar con la base de datos en segundo plano."""
+        self.aggregate = load_user_aggregate(self.user_id)
+        self.snapshot = load_user_snapshot(self.user_id)
+        self.game_results = self.snapshot["games"]
+        self.calculate_statistics()
+
+    def start_loading(self):
+        """Lanzar las consultas de perfil y estadísticas fuera del hilo de la interfaz."""
+        self.profile_task = BackgroundTask(get_user_profile, self.user_id)
+        self.profile_task.signals.result.connect(self.on_profile_loaded)
+        self.profile_task.start()
+
+        self.statistics_task = BackgroundTask(sync_user_snapshot, self.user_id)
+        self.statistics_task.signals.result.connect(self.on_statistics_loaded)
+        self.statistics_task.signals.error.connect(self.on_load_error)
+        self.statistics_task.start()
+
+    def cancel_loading(self):
+        """Cancelar las cargas en curso (al salir de la ventana)."""
+        for task in (self.profile_task, self.statistics_task):
+            if task is not None:
+                task.cancel()
+
+    def on_profile_loaded(self, profile):
+        if profile:
+            self.username = profile.get("nombre_usuario", "")
 
-            self.calculate_statistics()
-        except Exception as e:
-            print(f"Error al cargar las estadisticas: {e}")
-            self.game_results = []
+    def on_statistics_loaded(self, snapshot):
+        self.snapshot = snapshot
+        self.game_results = snapshot["games"]
+        self.calculate_statistics()
+        self.update_ui_with_stats()
+        self.history_model.clear()
+        self.history_model.append_games(self.game_results)
 
-            self.total_games = 0
-            self.win_rate = 0
-            self.avg_time = 0
-            self.avg_attempts = 0
-            self.current_streak = 0
-            self.max_streak = 0
+    def on_load_error(self, error_message):
+        print(f"Error al cargar las estadisticas: {error_message}")
 
     def calculate_statistics(self):
-        """Calcular estadísticas derivadas de los resultados del juego."""
-        self.total_games = len(self.game_results)
-
-        if self.total_games == 0:
-            self.win_rate = 0
-            self.avg_time = 0
-            self.avg_attempts = 0
-            self.current_streak = 0
-            self.max_streak = 0
-            return
-
-        sorted_games = sorted(self.game_results, key=lambda g: g.get("created_at", ""))
-
-        lang_counts = {"english": 0, "spanish": 0}
-        for g in self.game_results:
-            lang = g.get("language", "").lower()
-            if lang in ("english", "en"):
-                lang_counts["english"] += 1
-            elif lang in ("spanish", "es", "español"):
-                lang_counts["spanish"] += 1
-
-        self.en_pct = (lang_counts["english"] / self.total_games * 100) if self.total_games else 0
-        self.es_pct = (lang_counts["spanish"] / self.total_games * 100) if self.total_games else 0
-
-        wins = sum(1 for g in self.game_results if g.get("win", False))
-        self.win_rate = (wins / self.total_games) * 100 if self.total_games > 0 else 0
-
-        total_time = sum(g.get("time_taken", 0) for g in self.game_results)
-        self.avg_time = total_time / self.total_games if self.total_games > 0 else 0
-
-        total_attempts = sum(g.get("attempts", 0) for g in self.game_results)
-        self.avg_attempts = total_attempts / self.total_games if self.total_games else 0
+        """Calcular estadísticas derivadas a partir del agregado local."""
+        # El agregado se actualiza al terminar cada partida en este equipo; si la
+        # copia sincronizada trae partidas que no contó (p. ej. de otro equipo) se reconstruye.
+        self.aggregate = reconcile_user_aggregate(self.user_id, self.aggregate, self.snapshot)
+
+        self.apply_summary(self.aggregate.summary())
+        self.current_streak = self.aggregate.current_streak
+        self.max_streak = self.aggregate.max_streak
+
+    def apply_summary(self, summary: dict):
+        """Guardar las métricas de resumen para las tarjetas."""
+        self.total_games = summary["total_games"]
+        self.en_pct = summary["en_pct"]
+        self.es_pct = summary["es_pct"]
+        self.win_rate = summary["win_rate"]
+        self.avg_time = summary["avg_time"]
+        self.avg_attempts = summary["avg_attempts"]
 
     def setup_ui(self):
         main_widget = QWidget()
@@ -116,26 +121,32 @@ class StatisticsWindow(QMainWindow):
         summary_widget.setLayout(summary_layout)
 
         if self.language == "spanish":
-            games_label = self.create_stat_widget("Partidas", str(self.total_games))
-            win_rate_label = self.create_stat_widget("% Victoria", f"{self.win_rate:.1f}%")
-            en_label = self.create_stat_widget("Partidas en Inglés", f"{self.en_pct:.1f}%")
-            es_label = self.create_stat_widget("Partidas en Español", f"{self.es_pct:.1f}%")
-            avg_time_label = self.create_stat_widget("Tiempo Promedio", f"{self.avg_time:.1f}s")
-            avg_attempts_label = self.create_stat_widget("Intentos Promedio", f"{self.avg_attempts:.1f}")
+            self.games_label = self.create_stat_widget("Partidas", str(self.total_games))
+            self.win_rate_label = self.create_stat_widget("% Victoria", f"{self.win_rate:.1f}%")
+            self.en_label = self.create_stat_widget("Partidas en Inglés", f"{self.en_pct:.1f}%")
+            self.es_label = self.create_stat_widget("Partidas en Español", f"{self.es_pct:.1f}%")
+            self.avg_time_label = self.create_stat_widget("Tiempo Promedio", f"{self.avg_time:.1f}s")
+            self.avg_attempts_label = self.create_stat_widget("Intentos Promedio", f"{self.avg_attempts:.1f}")
+            self.current_streak_label = self.create_stat_widget("Racha Actual", str(self.current_streak))
+            self.max_streak_label = self.create_stat_widget("Mejor Racha", str(self.max_streak))
         else:
-            games_label = self.create_stat_widget("Games Played", str(self.total_games))
-            win_rate_label = self.create_stat_widget("Win Rate", f"{self.win_rate:.1f}%")
-            en_label = self.create_stat_widget("Games in English", f"{self.en_pct:.1f}%")
-            es_label = self.create_stat_widget("Games in Spanish", f"{self.es_pct:.1f}%")
-            avg_time_label = self.create_stat_widget("Avg Time", f"{self.avg_time:.1f}s")
-            avg_attempts_label = self.create_stat_widget("Avg Attempts", f"{self.avg_attempts:.1f}")
-
-        summary_layout.addWidget(games_label)
-        summary_layout.addWidget(en_label)
-        summary_layout.addWidget(es_label)
-        summary_layout.addWidget(win_rate_label)
-        summary_layout.addWidget(avg_time_label)
-        summary_layout.addWidget(avg_attempts_label)
+            self.games_label = self.create_stat_widget("Games Played", str(self.total_games))
+            self.win_rate_label = self.create_stat_widget("Win Rate", f"{self.win_rate:.1f}%")
+            self.en_label = self.create_stat_widget("Games in English", f"{self.en_pct:.1f}%")
+            self.es_label = self.create_stat_widget("Games in Spanish", f"{self.es_pct:.1f}%")
+            self.avg_time_label = self.create_stat_widget("Avg Time", f"{self.avg_time:.1f}s")
+            self.avg_attempts_label = self.create_stat_widget("Avg Attempts", f"{self.avg_attempts:.1f}")
+            self.current_streak_label = self.create_stat_widget("Current Streak", str(self.current_streak))
+            self.max_streak_label = self.create_stat_widget("Max Streak", str(self.max_streak))
+
+        summary_layout.addWidget(self.games_label)
+        summary_layout.addWidget(self.en_label)
+        summary_layout.addWidget(self.es_label)
+        summary_layout.addWidget(self.win_rate_label)
+        summary_layout.addWidget(self.avg_time_label)
+        summary_layout.addWidget(self.avg_attempts_label)
+        summary_layout.addWidget(self.current_streak_label)
+        summary_layout.addWidget(self.max_streak_label)
 
         if self.language == "spanish":
             history_label = QLabel("Historial de Partidas")
@@ -144,7 +155,7 @@ class StatisticsWindow(QMainWindow):
 
         history_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
 
-        self.history_table = QTableWidget()
+        self.history_table = QTableView()
         self.setup_history_table()
 
         action_layout = QHBoxLayout()
@@ -180,44 +191,36 @@ class StatisticsWindow(QMainWindow):
 
         return widget
 
+    def set_stat_value(self, widget: QWidget, value: str):
+        value_label: QLabel = widget.layout().itemAt(0).widget()
+        value_label.setText(value)
+
+    def update_ui_with_stats(self):
+        """Refrescar los valores de las tarjetas de resumen."""
+        self.set_stat_value(self.games_label, str(self.total_games))
+        self.set_stat_value(self.win_rate_label, f"{self.win_rate:.1f}%")
+        self.set_stat_value(self.en_label, f"{self.en_pct:.1f}%")
+        self.set_stat_value(self.es_label, f"{self.es_pct:.1f}%")
+        self.set_stat_value(self.avg_time_label, f"{self.avg_time:.1f}s")
+        self.set_stat_value(self.avg_attempts_label, f"{self.avg_attempts:.1f}")
+        self.set_stat_value(self.current_streak_label, str(self.current_streak))
+        self.set_stat_value(self.max_streak_label, str(self.max_streak))
+
     def setup_history_table(self):
         """Prepara la tabla de historia del juego."""
         if self.language == "spanish":
             headers = ["Palabra", "Idioma", "Intentos", "Tiempo", "Resultado", "Pistas Usadas"]
         else:
             headers = ["Word", "Language", "Attempts", "Time", "Result", "Hints Used"]
+        fields = ["word", "language", "attempts", "time_taken", "win", "hints_used"]
 
-        self.history_table.setColumnCount(len(headers))
-        self.history_table.setHorizontalHeaderLabels(headers)
-        self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-
-        self.history_table.setRowCount(len(self.game_results))
-
-        for row, game in enumerate(sorted(self.game_results, key=lambda g: g.get("created_at", ""), reverse=True)):
-            word_item = QTableWidgetItem(game.get("word", ""))
-            self.history_table.setItem(row, 0, word_item)
-
-            lang = game.get("language", "")
-            lang_display = "Español" if lang == "spanish" else "English"
-            lang_item = QTableWidgetItem(lang_display)
-            self.history_table.setItem(row, 1, lang_item)
+        self.history_model = GameHistoryModel(list(zip(headers, fields)), self.language, self)
+        self.history_model.append_games(self.game_results)
 
-            attempts_item = QTableWidgetItem(str(game.get("attempts", 0)))
-            self.history_table.setItem(row, 2, attempts_item)
-
-            time_item = QTableWidgetItem(f"{game.get('time_taken', 0):.1f}s")
-            self.history_table.setItem(row, 3, time_item)
-
-            if self.language == "spanish":
-                result_text = "Victoria" if game.get("win", False) else "Derrota"
-            else:
-                result_text = "Win" if game.get("win", False) else "Loss"
-
-            result_item = QTableWidgetItem(result_text)
-            self.history_table.setItem(row, 4, result_item)
-
-            hints_item = QTableWidgetItem(str(game.get("hints_used", 0)))
-            self.history_table.setItem(row, 5, hints_item)
+        self.history_table.setModel(self.history_model)
+        self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.history_table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.DescendingOrder)
+        self.history_table.setSortingEnabled(True)
 
     def export_csv(self):
         default_name = "estadisticas.csv" if self.language == "spanish" else "statistics.csv"
@@ -249,9 +252,11 @@ class StatisticsWindow(QMainWindow):
         link = "https://looker.google.com/your-dashboard-link"
         QApplication.clipboard().setText(link)
 
+    def closeEvent(self, event):
+        self.cancel_loading()
+        super().closeEvent(event)
+
     def back_to_home(self):
         """Volver al Home."""
-        from ui.home import HomeWindow
-        self.home_window = HomeWindow(self.user_id, self.is_admin, self.language)
-        self.hide()
-        self.home_window.show()
+        self.cancel_loading()
+        get_navigator().show_home(self.user_id, self.is_admin, self.language)
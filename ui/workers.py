@@ -0,0 +1,169 @@
+"""Ejecutor compartido para la entrada/salida de la base de datos.
+
+Todas las llamadas a ``database.supabase_client`` que hace la interfaz pasan
+por un único ``ThreadPoolExecutor`` con un número fijo de hilos; así una
+ráfaga de consultas no crea hilos sin límite y se puede medir la cola.
+Los resultados vuelven al hilo de la interfaz mediante señales de Qt.
+
+El cálculo pesado (construir la matriz de patrones) va a un ejecutor aparte
+de un solo hilo, para no ocupar los hilos de la E/S durante segundos.
+"""
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+# Hilos del ejecutor de E/S (se puede ajustar con WORDLE_IO_WORKERS)
+IO_WORKERS = int(os.getenv("WORDLE_IO_WORKERS", "4"))
+# Hilos del ejecutor de cálculo
+CPU_WORKERS = 1
+
+
+class IOExecutor:
+    """Grupo acotado de hilos para la E/S con métricas de profundidad de cola."""
+
+    def __init__(self, max_workers=IO_WORKERS, thread_name_prefix="WordleIO"):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+
+    def submit(self, fn, *args, **kwargs):
+        """Encolar ``fn`` y devolver su ``Future``."""
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+        return self._executor.submit(self._call, fn, args, kwargs)
+
+    def _call(self, fn, args, kwargs):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        failed = False
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    def metrics(self) -> dict:
+        """Estado de la cola: tareas en espera, en curso, terminadas y el máximo en espera."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "max_queue_depth": self._max_queue_depth,
+            }
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_io_executor = None
+_io_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> IOExecutor:
+    """Ejecutor de E/S compartido por toda la aplicación."""
+    global _io_executor
+    with _io_executor_lock:
+        if _io_executor is None:
+            _io_executor = IOExecutor()
+        return _io_executor
+
+
+_cpu_executor = None
+
+
+def get_cpu_executor() -> IOExecutor:
+    """Ejecutor de un solo hilo para el cálculo pesado, separado del de E/S."""
+    global _cpu_executor
+    with _io_executor_lock:
+        if _cpu_executor is None:
+            _cpu_executor = IOExecutor(max_workers=CPU_WORKERS, thread_name_prefix="WordleCPU")
+        return _cpu_executor
+
+
+class TaskSignals(QObject):
+    """Señales de una tarea en segundo plano (se entregan en el hilo de la interfaz)."""
+    result = pyqtSignal(object)
+    chunk = pyqtSignal(object)
+    error = pyqtSignal(object)
+    finished = pyqtSignal()
+
+
+class BackgroundTask:
+    """Ejecutar una función de la base de datos en el ejecutor de E/S.
+
+    Si la función devuelve un generador, cada elemento se emite por ``chunk``
+    a medida que llega; si no, el valor se emite por ``result``. Los errores
+    se emiten por ``error`` con la excepción original. Después de
+    ``cancel()`` no se emite nada más y el generador se cierra.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+        self.future = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def start(self, executor=None):
+        self.future = (executor or get_io_executor()).submit(self.run)
+        return self
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+            if inspect.isgenerator(result):
+                for item in result:
+                    if self.cancelled:
+                        result.close()
+                        break
+                    self.signals.chunk.emit(item)
+            elif not self.cancelled:
+                self.signals.result.emit(result)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.error.emit(e)
+            # Se relanza para que quede en el Future y en las métricas del ejecutor
+            raise
+        finally:
+            if not self.cancelled:
+                self.signals.finished.emit()
+
+
+def run_in_background(fn, *args, on_result=None, on_error=None, **kwargs) -> BackgroundTask:
+    """Atajo para lanzar ``fn`` en el ejecutor de E/S conectando sus señales."""
+    task = BackgroundTask(fn, *args, **kwargs)
+    if on_result is not None:
+        task.signals.result.connect(on_result)
+    if on_error is not None:
+        task.signals.error.connect(on_error)
+    return task.start()